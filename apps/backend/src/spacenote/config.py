@@ -23,6 +23,25 @@ class Config(BaseSettings):
     data_dir: Path = Field(description="Root data directory for all app storage")
     telegram_bot_token: str | None = Field(default=None, description="Telegram bot token")
     max_upload_size: int = Field(default=DEFAULT_MAX_UPLOAD_SIZE, description="Max file upload size in bytes")
+    session_secret: str | None = Field(
+        default=None,
+        description=(
+            "Secret for signed session tokens, verified without a database lookup; unset = opaque tokens. "
+            "Signed tokens expire 30 days after login (fixed), opaque ones 30 days after last use (sliding)"
+        ),
+    )
+    forwarded_allow_ips: str = Field(
+        default="127.0.0.1",
+        description=(
+            "Comma-separated proxy IPs (or '*') trusted to set X-Forwarded-For; the client IP from the header "
+            "keys the per-IP login limit"
+        ),
+    )
+    workers: int = Field(
+        default=1,
+        ge=1,
+        description="Server worker processes; above 1, processes sync caches and elect a leader through MongoDB",
+    )
 
     @property
     def attachments_path(self) -> Path:
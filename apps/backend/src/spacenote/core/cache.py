@@ -0,0 +1,100 @@
+import time
+from collections import OrderedDict
+from collections.abc import Hashable
+from datetime import datetime
+
+
+class SpaceVersionedCache[V]:
+    """Bounded LRU cache of values derived from a space's data (notes, comments, configuration).
+
+    Every entry remembers the space write version it was computed at. Writes call
+    `invalidate(space_slug)`, which bumps the version and makes all entries of that
+    space stale without scanning the cache. Stale entries can still be served when
+    the caller accepts an approximation (`max_stale_age`).
+    """
+
+    def __init__(self, max_entries: int = 1000) -> None:
+        self._max_entries = max_entries
+        self._versions: dict[str, int] = {}
+        self._entries: OrderedDict[tuple[str, Hashable], tuple[int, float, V]] = OrderedDict()
+
+    def get(self, space_slug: str, key: Hashable, max_stale_age: float | None = None) -> V | None:
+        """Return cached value, or None if missing or stale.
+
+        Args:
+            max_stale_age: Also accept entries from an older write version if they
+                were computed less than this many seconds ago.
+        """
+        entry_key = (space_slug, key)
+        entry = self._entries.get(entry_key)
+        if entry is None:
+            return None
+        version, computed_at, value = entry
+        if version != self.get_version(space_slug) and (max_stale_age is None or time.monotonic() - computed_at > max_stale_age):
+            return None
+        self._entries.move_to_end(entry_key)
+        return value
+
+    def get_version(self, space_slug: str) -> int:
+        """Current write version of the space."""
+        return self._versions.get(space_slug, 0)
+
+    def set(self, space_slug: str, key: Hashable, value: V, version: int | None = None) -> None:
+        """Store value computed at the given write version (defaults to the current one).
+
+        Pass the version read before starting a slow computation, so a write that lands
+        in the meantime leaves the stored value stale instead of current.
+        """
+        entry_key = (space_slug, key)
+        if version is None:
+            version = self.get_version(space_slug)
+        self._entries[entry_key] = (version, time.monotonic(), value)
+        self._entries.move_to_end(entry_key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, space_slug: str) -> None:
+        """Bump the space write version, marking all its entries stale."""
+        self._versions[space_slug] = self._versions.get(space_slug, 0) + 1
+
+
+class ExpiringCache[K: Hashable, V]:
+    """Bounded LRU cache whose entries expire at a given wall-clock time.
+
+    Expired entries are dropped when read; the size bound evicts the least recently
+    used entries, so memory stays flat however many keys pass through.
+    """
+
+    def __init__(self, max_entries: int = 1000) -> None:
+        self._max_entries = max_entries
+        self._entries: OrderedDict[K, tuple[datetime, V]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: K, current_time: datetime) -> V | None:
+        """Return cached value, or None if missing or expired at current_time."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= current_time:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: K, value: V, expires_at: datetime) -> None:
+        """Store value until expires_at."""
+        self._entries[key] = (expires_at, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def pop(self, key: K) -> None:
+        """Remove an entry if present."""
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        self._entries.clear()
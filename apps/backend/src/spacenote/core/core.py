@@ -14,6 +14,7 @@ from spacenote.config import Config
 from spacenote.core.modules.access.service import AccessService
 from spacenote.core.modules.attachment.service import AttachmentService
 from spacenote.core.modules.backup.service import BackupService
+from spacenote.core.modules.cluster.service import ClusterService
 from spacenote.core.modules.comment.service import CommentService
 from spacenote.core.modules.counter.service import CounterService
 from spacenote.core.modules.export.service import ExportService
@@ -21,6 +22,7 @@ from spacenote.core.modules.field.service import FieldService
 from spacenote.core.modules.filter.service import FilterService
 from spacenote.core.modules.image.service import ImageService
 from spacenote.core.modules.log.service import LogService
+from spacenote.core.modules.migration.service import MigrationService
 from spacenote.core.modules.note.service import NoteService
 from spacenote.core.modules.session.service import SessionService
 from spacenote.core.modules.space.service import SpaceService
@@ -49,6 +51,8 @@ class ServiceRegistry:
     export: ExportService
     template: TemplateService
     telegram: TelegramService
+    migration: MigrationService
+    cluster: ClusterService
 
     def __init__(self, core: Core) -> None:
         """Initialize all services and inject core reference."""
@@ -68,6 +72,9 @@ class ServiceRegistry:
         self.export = ExportService()
         self.template = TemplateService()
         self.telegram = TelegramService()
+        self.migration = MigrationService()
+        # Last: starts leader work once all other services are started
+        self.cluster = ClusterService()
 
         # Auto-discover services and inject core
         self._services = [v for v in vars(self).values() if isinstance(v, Service)]
@@ -84,6 +91,16 @@ class ServiceRegistry:
         for service in self._services:
             await service.on_stop()
 
+    async def start_leader_all(self) -> None:
+        """Start single-instance background work of all services (this process became leader)."""
+        for service in self._services:
+            await service.on_leader_start()
+
+    async def stop_leader_all(self) -> None:
+        """Stop single-instance background work of all services (this process is no longer leader)."""
+        for service in self._services:
+            await service.on_leader_stop()
+
 
 class Core:
     """Container providing config, database, and all service instances."""
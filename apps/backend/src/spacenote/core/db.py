@@ -22,6 +22,11 @@ class Collection(StrEnum):
     ATTACHMENTS = "attachments"
     TELEGRAM_TASKS = "telegram_tasks"
     TELEGRAM_MIRRORS = "telegram_mirrors"
+    MIGRATION_JOBS = "migration_jobs"
+    CACHE_EPOCHS = "cache_epochs"
+    LEASES = "leases"
+    REVOKED_TOKENS = "revoked_tokens"
+    BACKFILLS = "backfills"
 
 
 class PyObjectId(ObjectId):
@@ -0,0 +1,49 @@
+import bisect
+
+from pydantic import Field
+
+from spacenote.core.schema import OpenAPIModel
+
+# Upper bounds (seconds) of duration histogram buckets
+DURATION_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0)
+
+
+class HistogramBucket(OpenAPIModel):
+    """Cumulative count of observations up to a bound."""
+
+    le: float | None = Field(..., description="Upper bound (inclusive); null for the overflow bucket")
+    count: int = Field(..., description="Observations less than or equal to the bound", ge=0)
+
+
+class HistogramSnapshot(OpenAPIModel):
+    """Point-in-time state of a histogram."""
+
+    count: int = Field(..., description="Number of observations", ge=0)
+    sum: float = Field(..., description="Sum of observed values")
+    max: float = Field(..., description="Largest observed value (0 when empty)")
+    buckets: list[HistogramBucket] = Field(..., description="Cumulative bucket counts, ascending by bound")
+
+
+class Histogram:
+    """In-process histogram with fixed bucket bounds (Prometheus-style cumulative snapshot)."""
+
+    def __init__(self, bounds: tuple[float, ...] = DURATION_BUCKETS) -> None:
+        self._bounds = bounds
+        self._counts = [0] * (len(bounds) + 1)
+        self._sum = 0.0
+        self._max = 0.0
+
+    def observe(self, value: float) -> None:
+        """Record one observation."""
+        self._counts[bisect.bisect_left(self._bounds, value)] += 1
+        self._sum += value
+        self._max = max(self._max, value)
+
+    def snapshot(self) -> HistogramSnapshot:
+        """Cumulative view of the recorded observations."""
+        buckets: list[HistogramBucket] = []
+        total = 0
+        for bound, count in zip((*self._bounds, None), self._counts, strict=True):
+            total += count
+            buckets.append(HistogramBucket(le=bound, count=total))
+        return HistogramSnapshot(count=total, sum=self._sum, max=self._max, buckets=buckets)
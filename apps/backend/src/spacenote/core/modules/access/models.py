@@ -0,0 +1,16 @@
+from dataclasses import dataclass
+
+from spacenote.core.modules.session.models import AuthToken
+from spacenote.core.modules.user.models import User
+
+
+@dataclass(frozen=True, slots=True)
+class Principal:
+    """Authenticated caller, resolved once per request and passed to App methods."""
+
+    auth_token: AuthToken
+    user: User
+
+    @property
+    def username(self) -> str:
+        return self.user.username
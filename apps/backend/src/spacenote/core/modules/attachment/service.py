@@ -165,9 +165,11 @@ class AttachmentService(Service):
         source_attachments = await self.list_note_attachments(source_slug, source_note)
         att_map: dict[int, int] = {}
         new_attachments: list[Attachment] = []
+        new_numbers = await self.core.services.counter.reserve_range(
+            target_slug, CounterType.ATTACHMENT, len(source_attachments), target_note
+        )
 
-        for src_att in source_attachments:
-            new_number = await self.core.services.counter.get_next_sequence(target_slug, CounterType.ATTACHMENT, target_note)
+        for src_att, new_number in zip(source_attachments, new_numbers, strict=True):
             att_map[src_att.number] = new_number
 
             storage.copy_attachment_file(
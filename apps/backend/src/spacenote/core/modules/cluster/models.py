@@ -0,0 +1,15 @@
+from enum import StrEnum
+
+
+class CacheScope(StrEnum):
+    """In-memory caches kept coherent across server processes.
+
+    SPACES, USERS, SESSIONS — whole caches, reloaded on change.
+    NOTES, COMMENTS — derived list data (totals, facets) of one space, keyed by space slug.
+    """
+
+    SPACES = "spaces"
+    USERS = "users"
+    SESSIONS = "sessions"
+    NOTES = "notes"
+    COMMENTS = "comments"
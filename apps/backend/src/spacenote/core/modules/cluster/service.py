@@ -0,0 +1,255 @@
+import asyncio
+import contextlib
+import secrets
+import time
+from datetime import timedelta
+from functools import cached_property
+from typing import Any
+
+import structlog
+from pymongo import ReturnDocument, UpdateOne
+from pymongo.asynchronous.collection import AsyncCollection
+from pymongo.errors import DuplicateKeyError
+
+from spacenote.core.db import Collection
+from spacenote.core.modules.cluster.models import CacheScope
+from spacenote.core.service import Service
+from spacenote.utils import now
+
+logger = structlog.get_logger(__name__)
+
+# How often other processes' cache changes are picked up (seconds) — the staleness bound across workers
+CACHE_POLL_INTERVAL = 1.0
+
+# Change sequence numbers re-read on every poll. A process increments the global sequence
+# before it writes the change document, so a change may become visible after later ones.
+SEQ_LOOKBACK = 100
+
+# Leader lease duration and renewal interval (seconds)
+LEASE_TTL = 30
+LEASE_RENEW_INTERVAL = 10
+
+# _id of the global change sequence document in cache_epochs and of the leader lease in leases
+SEQ_DOC_ID = "seq"
+LEADER_LEASE_ID = "leader"
+
+
+class ClusterService(Service):
+    """Coordinates server processes sharing one database (enabled when config.workers > 1).
+
+    Cache coherence: a process that changes cached data publishes the cache scope (and key);
+    changes are stored in `cache_epochs` with a global sequence number, and every process
+    polls for sequence numbers it has not seen yet and reloads or invalidates the caches
+    concerned — its own changes included, which keeps the protocol free of ordering races.
+
+    Leader lease: background work that must not run twice (Telegram delivery, migrations,
+    startup backfills) runs only in the process holding the `leases` document, via
+    Service.on_leader_start / on_leader_stop. A single-process deployment is always leader.
+    """
+
+    def __init__(self) -> None:
+        self._process_id = secrets.token_hex(8)
+        self._is_leader = False
+        self._pending: set[tuple[CacheScope, str]] = set()
+        self._wakeup = asyncio.Event()
+        self._last_seq = 0
+        # Change document _id → last applied sequence number (within the lookback window)
+        self._applied: dict[str, int] = {}
+        self._lease_checked_at = 0.0
+        self._task: asyncio.Task[None] | None = None
+
+    @cached_property
+    def _epochs_collection(self) -> AsyncCollection[dict[str, Any]]:
+        return self.database.get_collection(Collection.CACHE_EPOCHS)
+
+    @cached_property
+    def _leases_collection(self) -> AsyncCollection[dict[str, Any]]:
+        return self.database.get_collection(Collection.LEASES)
+
+    @property
+    def enabled(self) -> bool:
+        """Whether several server processes may share the database."""
+        return self.core.config.workers > 1
+
+    @property
+    def process_id(self) -> str:
+        """Random id of this server process, stored as the lease holder."""
+        return self._process_id
+
+    @property
+    def is_leader(self) -> bool:
+        """Whether this process runs the single-instance background work."""
+        return self._is_leader
+
+    async def holds_lease(self) -> bool:
+        """Check in the database that this process still holds the leader lease.
+
+        Leader work calls this before each unit of writes: a process that lost the lease
+        (e.g. paused past LEASE_TTL) may not have noticed yet, and must not keep writing
+        alongside the new leader.
+        """
+        if not self.enabled:
+            return self._is_leader
+        lease = await self._leases_collection.find_one(
+            {"_id": LEADER_LEASE_ID, "holder": self._process_id, "expires_at": {"$gt": now()}}
+        )
+        return lease is not None
+
+    def publish(self, scope: CacheScope, key: str = "") -> None:
+        """Announce a change of cached data to all server processes. Returns immediately.
+
+        Called after the change is written to the database. Changes are sent in the
+        background, so bursts of writes to the same scope and key are coalesced.
+        """
+        if not self.enabled:
+            return
+        self._pending.add((scope, key))
+        self._wakeup.set()
+
+    async def on_start(self) -> None:
+        """Start cache polling and leader election (runs after all other services have started)."""
+        if not self.enabled:
+            await self._become_leader()
+            return
+        await self._epochs_collection.create_index("seq")
+        # Caches were just loaded from the database; only later changes matter
+        seq_doc = await self._epochs_collection.find_one({"_id": SEQ_DOC_ID})
+        self._last_seq = seq_doc["value"] if seq_doc else 0
+        recent = {"_id": {"$ne": SEQ_DOC_ID}, "seq": {"$gt": self._last_seq - SEQ_LOOKBACK}}
+        self._applied = {doc["_id"]: doc["seq"] async for doc in self._epochs_collection.find(recent, {"seq": 1})}
+        await self.check_lease()
+        self._task = asyncio.create_task(self._run())
+
+    async def on_stop(self) -> None:
+        """Stop polling, send remaining changes and release the lease."""
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            with contextlib.suppress(Exception):
+                await self._send_pending()
+        if self._is_leader and self.enabled:
+            self._is_leader = False
+            with contextlib.suppress(Exception):
+                await self._leases_collection.delete_one({"_id": LEADER_LEASE_ID, "holder": self._process_id})
+
+    async def _run(self) -> None:
+        """Background loop: send own changes, apply others' changes, keep the lease."""
+        logger.info("cluster_sync_started", process_id=self._process_id)
+        while True:
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(self._wakeup.wait(), timeout=CACHE_POLL_INTERVAL)
+            self._wakeup.clear()
+            try:
+                await self._send_pending()
+                await self.apply_changes()
+                if time.monotonic() - self._lease_checked_at >= LEASE_RENEW_INTERVAL:
+                    await self.check_lease()
+            except Exception:
+                logger.exception("cluster_sync_failed")
+
+    # --- Cache coherence ---
+
+    async def _send_pending(self) -> None:
+        """Store pending changes with new sequence numbers."""
+        pending, self._pending = self._pending, set()
+        if not pending:
+            return
+        try:
+            # Reserve one sequence number per change
+            seq_doc = await self._epochs_collection.find_one_and_update(
+                {"_id": SEQ_DOC_ID}, {"$inc": {"value": len(pending)}}, upsert=True, return_document=ReturnDocument.AFTER
+            )
+            first_seq = seq_doc["value"] - len(pending) + 1 if seq_doc else 1
+            operations = [
+                UpdateOne(
+                    {"_id": _change_id(scope, key)},
+                    {"$set": {"scope": scope, "key": key, "seq": seq, "updated_at": now()}},
+                    upsert=True,
+                )
+                for seq, (scope, key) in enumerate(sorted(pending), start=first_seq)
+            ]
+            await self._epochs_collection.bulk_write(operations, ordered=False)
+        except Exception:
+            # Retry with the next round
+            self._pending |= pending
+            raise
+
+    async def apply_changes(self) -> None:
+        """Reload or invalidate caches changed since the last poll."""
+        query = {"_id": {"$ne": SEQ_DOC_ID}, "seq": {"$gt": self._last_seq - SEQ_LOOKBACK}}
+        docs = await self._epochs_collection.find(query).to_list()
+        changes: set[tuple[CacheScope, str]] = set()
+        for doc in docs:
+            if self._applied.get(doc["_id"], 0) >= doc["seq"]:
+                continue
+            self._applied[doc["_id"]] = doc["seq"]
+            self._last_seq = max(self._last_seq, doc["seq"])
+            with contextlib.suppress(ValueError):
+                changes.add((CacheScope(doc["scope"]), doc["key"]))
+        # Forget changes that fell out of the lookback window
+        self._applied = {k: v for k, v in self._applied.items() if v > self._last_seq - SEQ_LOOKBACK}
+        if changes:
+            await self._reload(changes)
+
+    async def _reload(self, changes: set[tuple[CacheScope, str]]) -> None:
+        """Bring local caches in line with the database after changes from any process."""
+        services = self.core.services
+        scopes = {scope for scope, _ in changes}
+        if CacheScope.USERS in scopes:
+            await services.user.update_all_users_cache()
+        if CacheScope.SPACES in scopes:
+            await services.space.update_all_spaces_cache()
+            # Counters of renamed or deleted spaces may have been reset; drop reserved blocks
+            services.counter.discard_blocks()
+        if CacheScope.SESSIONS in scopes:
+            # Cached sessions may belong to logged out tokens
+            services.session.clear_cache()
+            await services.session.load_revocations()
+        if CacheScope.NOTES in scopes:
+            # Shadow value backfill progress is announced as a notes change
+            await services.note.load_backfill_state()
+        for scope, key in changes:
+            if scope == CacheScope.NOTES:
+                services.note.invalidate_caches(key, broadcast=False)
+            elif scope == CacheScope.COMMENTS:
+                services.comment.invalidate_caches(key, broadcast=False)
+        logger.debug("cluster_caches_reloaded", scopes=sorted(scopes))
+
+    # --- Leader lease ---
+
+    async def check_lease(self) -> None:
+        """Acquire or renew the leader lease and start or stop leader work accordingly."""
+        self._lease_checked_at = time.monotonic()
+        current = now()
+        try:
+            lease = await self._leases_collection.find_one_and_update(
+                {"_id": LEADER_LEASE_ID, "$or": [{"holder": self._process_id}, {"expires_at": {"$lt": current}}]},
+                {"$set": {"holder": self._process_id, "expires_at": current + timedelta(seconds=LEASE_TTL)}},
+                upsert=True,
+                return_document=ReturnDocument.AFTER,
+            )
+            held = lease is not None
+        except DuplicateKeyError:
+            # Lease exists and is held by another live process
+            held = False
+
+        if held and not self._is_leader:
+            await self._become_leader()
+        elif not held and self._is_leader:
+            await self._resign()
+
+    async def _become_leader(self) -> None:
+        self._is_leader = True
+        logger.info("cluster_leader_acquired", process_id=self._process_id)
+        await self.core.services.start_leader_all()
+
+    async def _resign(self) -> None:
+        self._is_leader = False
+        logger.warning("cluster_leader_lost", process_id=self._process_id)
+        await self.core.services.stop_leader_all()
+
+
+def _change_id(scope: CacheScope, key: str) -> str:
+    """_id of the change document of a cache scope and key."""
+    return f"{scope}:{key}" if key else str(scope)
@@ -4,11 +4,13 @@ from typing import Any
 import structlog
 from pymongo.asynchronous.collection import AsyncCollection
 
+from spacenote.core.cache import SpaceVersionedCache
 from spacenote.core.db import Collection
+from spacenote.core.modules.cluster.models import CacheScope
 from spacenote.core.modules.comment.models import Comment
 from spacenote.core.modules.counter.models import CounterType
 from spacenote.core.modules.field.models import FieldValueType
-from spacenote.core.pagination import PaginationResult
+from spacenote.core.pagination import PaginationResult, TotalMode, count_documents_cached
 from spacenote.core.service import Service
 from spacenote.errors import NotFoundError, ValidationError
 from spacenote.utils import now
@@ -19,6 +21,10 @@ logger = structlog.get_logger(__name__)
 class CommentService(Service):
     """Manages comments on notes with threading support."""
 
+    def __init__(self) -> None:
+        # Total counts per (space, note), invalidated by comment writes
+        self._count_cache: SpaceVersionedCache[int] = SpaceVersionedCache()
+
     @cached_property
     def _collection(self) -> AsyncCollection[dict[str, Any]]:
         return self.database.get_collection(Collection.COMMENTS)
@@ -29,12 +35,12 @@ class CommentService(Service):
         await self._collection.create_index([("space_slug", 1), ("note_number", 1)])
 
     async def list_comments(
-        self, space_slug: str, note_number: int, limit: int = 50, offset: int = 0
+        self, space_slug: str, note_number: int, limit: int = 50, offset: int = 0, total_mode: TotalMode = TotalMode.EXACT
     ) -> PaginationResult[Comment]:
         """List paginated comments for a note."""
         query = {"space_slug": space_slug, "note_number": note_number}
 
-        total = await self._collection.count_documents(query)
+        total = await count_documents_cached(self._collection, query, self._count_cache, space_slug, note_number, total_mode)
 
         cursor = self._collection.find(query).sort("number", 1).skip(offset).limit(limit)
         docs = await cursor.to_list()
@@ -107,6 +113,7 @@ class CommentService(Service):
         )
 
         await self._collection.insert_one(comment.to_mongo())
+        self.invalidate_caches(space_slug)
         await self.core.services.note.update_activity(space_slug, note_number, commented=True)
         logger.debug("comment_created", space_slug=space_slug, note_number=note_number, number=next_number, author=author)
         await self.core.services.telegram.notify_activity_comment_created(note, comment, changes)
@@ -130,6 +137,7 @@ class CommentService(Service):
         await self.get_comment(space_slug, note_number, number)  # Verify exists
 
         await self._collection.delete_one({"space_slug": space_slug, "note_number": note_number, "number": number})
+        self.invalidate_caches(space_slug)
         await self.core.services.note.update_activity(space_slug, note_number)
         logger.debug("comment_deleted", space_slug=space_slug, note_number=note_number, number=number)
 
@@ -161,11 +169,13 @@ class CommentService(Service):
     async def delete_comments_by_note(self, space_slug: str, note_number: int) -> int:
         """Delete all comments for a note."""
         result = await self._collection.delete_many({"space_slug": space_slug, "note_number": note_number})
+        self.invalidate_caches(space_slug)
         return result.deleted_count
 
     async def delete_comments_by_space(self, space_slug: str) -> int:
         """Delete all comments in a space."""
         result = await self._collection.delete_many({"space_slug": space_slug})
+        self.invalidate_caches(space_slug)
         return result.deleted_count
 
     async def import_comments(self, comments: list[Comment]) -> int:
@@ -174,4 +184,15 @@ class CommentService(Service):
             return 0
 
         await self._collection.insert_many([c.to_mongo() for c in comments])
+        for space_slug in {c.space_slug for c in comments}:
+            self.invalidate_caches(space_slug)
         return len(comments)
+
+    def invalidate_caches(self, space_slug: str, *, broadcast: bool = True) -> None:
+        """Mark cached comment totals of a space stale. Called after every comment write.
+
+        With broadcast, other server processes drop their cached totals of the space too.
+        """
+        self._count_cache.invalidate(space_slug)
+        if broadcast:
+            self.core.services.cluster.publish(CacheScope.COMMENTS, space_slug)
@@ -13,6 +13,7 @@ class CounterType(StrEnum):
     PENDING_ATTACHMENT = "pending_attachment"
     ATTACHMENT = "attachment"
     TELEGRAM_TASK = "telegram_task"
+    MIGRATION_JOB = "migration_job"
 
 
 class Counter(MongoModel):
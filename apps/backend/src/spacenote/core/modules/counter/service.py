@@ -1,3 +1,4 @@
+from collections.abc import Iterator
 from functools import cached_property
 from typing import Any, cast
 
@@ -8,10 +9,22 @@ from spacenote.core.db import Collection
 from spacenote.core.modules.counter.models import CounterType
 from spacenote.core.service import Service
 
+# Counters served from blocks reserved in the database (hi/lo), with the block size.
+# Numbers stay unique but may have gaps (unused block remainders are lost on restart)
+# and, with several server processes, do not follow creation order.
+BLOCK_SIZES: dict[CounterType, int] = {
+    CounterType.TELEGRAM_TASK: 20,
+    CounterType.PENDING_ATTACHMENT: 20,
+}
+
 
 class CounterService(Service):
     """Service for managing auto-incrementing counters per space."""
 
+    def __init__(self) -> None:
+        # Unused numbers of reserved blocks (BLOCK_SIZES counters only)
+        self._blocks: dict[tuple[str, CounterType, int | None], Iterator[int]] = {}
+
     @cached_property
     def _collection(self) -> AsyncCollection[dict[str, Any]]:
         return self.database.get_collection(Collection.COUNTERS)
@@ -21,21 +34,54 @@ class CounterService(Service):
         await self._collection.create_index([("space_slug", 1), ("counter_type", 1), ("note_number", 1)], unique=True)
 
     async def get_next_sequence(self, space_slug: str, counter_type: CounterType, note_number: int | None = None) -> int:
-        """Atomically increment and return the next sequence number."""
+        """Atomically increment and return the next sequence number.
+
+        Counters in BLOCK_SIZES are served from an in-process block, one database round trip per block.
+        """
+        block_size = BLOCK_SIZES.get(counter_type)
+        if block_size is None:
+            return (await self.reserve_range(space_slug, counter_type, 1, note_number))[0]
+
+        key = (space_slug, counter_type, note_number)
+        if (block := self._blocks.get(key)) is not None and (number := next(block, None)) is not None:
+            return number
+        reserved = iter(await self.reserve_range(space_slug, counter_type, block_size, note_number))
+        number = next(reserved)
+        # Another caller may have refilled the block while this one waited; keep that block
+        # (the rest of this reservation becomes a gap)
+        if (current := self._blocks.get(key)) is None or current is block:
+            self._blocks[key] = reserved
+        return number
+
+    async def reserve_range(
+        self, space_slug: str, counter_type: CounterType, count: int, note_number: int | None = None
+    ) -> range:
+        """Atomically reserve `count` consecutive sequence numbers in one round trip (for bulk inserts)."""
+        if count < 1:
+            return range(0)
         # cast: upsert=True guarantees a document is returned, but pymongo types don't reflect this
         result = cast(
             dict[str, Any],
             await self._collection.find_one_and_update(
                 {"space_slug": space_slug, "counter_type": counter_type, "note_number": note_number},
-                {"$inc": {"seq": 1}},
+                {"$inc": {"seq": count}},
                 upsert=True,
                 return_document=ReturnDocument.AFTER,
             ),
         )
-        return int(result["seq"])
+        end = int(result["seq"]) + 1
+        return range(end - count, end)
+
+    def discard_blocks(self, space_slug: str | None = None) -> None:
+        """Forget reserved blocks of a space (all spaces if None) after its counters were reset, moved or deleted."""
+        if space_slug is None:
+            self._blocks.clear()
+        else:
+            self._blocks = {key: block for key, block in self._blocks.items() if key[0] != space_slug}
 
     async def delete_counters_by_space(self, space_slug: str) -> int:
         """Delete all counters for a space."""
+        self.discard_blocks(space_slug)
         result = await self._collection.delete_many({"space_slug": space_slug})
         return result.deleted_count
 
@@ -46,6 +92,7 @@ class CounterService(Service):
 
     async def set_sequence(self, space_slug: str, counter_type: CounterType, value: int, note_number: int | None = None) -> None:
         """Set counter sequence to specific value (for import)."""
+        self.discard_blocks(space_slug)
         await self._collection.update_one(
             {"space_slug": space_slug, "counter_type": counter_type, "note_number": note_number},
             {"$set": {"seq": value}},
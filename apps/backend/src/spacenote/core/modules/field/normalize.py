@@ -0,0 +1,63 @@
+"""Normalized shadow copies of text field values for index-friendly matching.
+
+Notes store `fields_norm.{name}` next to `fields.{name}` for STRING and SELECT fields:
+the value NFKC-normalized, case-folded and cut to SHADOW_MAX_LENGTH characters.
+Case-insensitive prefix matching then becomes a plain range over the shadow, which
+MongoDB serves from an index, unlike a case-insensitive regex.
+"""
+
+import unicodedata
+
+from spacenote.core.modules.field.models import FieldType, FieldValueType, SpaceField
+
+# Document key holding shadow values
+SHADOW_ROOT = "fields_norm"
+
+# Longer values are truncated; prefixes beyond this length also check the original value
+SHADOW_MAX_LENGTH = 256
+
+SHADOW_FIELD_TYPES = {FieldType.STRING, FieldType.SELECT}
+
+
+def normalize_text(value: str) -> str:
+    """Normalize text for case-insensitive comparison (NFKC + casefold)."""
+    return unicodedata.normalize("NFKC", value).casefold()
+
+
+def get_shadow_path(field_name: str) -> str:
+    """MongoDB document path of a field's shadow value."""
+    return f"{SHADOW_ROOT}.{field_name}"
+
+
+def has_shadow(field: SpaceField) -> bool:
+    """Check if values of this field get a normalized shadow copy."""
+    return field.type in SHADOW_FIELD_TYPES
+
+
+def build_shadow_value(value: FieldValueType) -> str | None:
+    """Shadow value for a field value, or None when no shadow is stored."""
+    if not isinstance(value, str):
+        return None
+    return normalize_text(value)[:SHADOW_MAX_LENGTH]
+
+
+def build_shadow_values(fields: list[SpaceField], values: dict[str, FieldValueType]) -> dict[str, str]:
+    """Shadow values for all shadowed fields present in `values`."""
+    result: dict[str, str] = {}
+    for field in fields:
+        if has_shadow(field) and (shadow := build_shadow_value(values.get(field.name))) is not None:
+            result[field.name] = shadow
+    return result
+
+
+def prefix_upper_bound(prefix: str) -> str | None:
+    """Smallest string greater than every string starting with `prefix` (None if unbounded)."""
+    chars = list(prefix)
+    while chars:
+        code = ord(chars.pop()) + 1
+        if code <= 0x10FFFF:
+            # Skip the surrogate range, which cannot be encoded in BSON strings
+            if 0xD800 <= code <= 0xDFFF:
+                code = 0xE000
+            return "".join(chars) + chr(code)
+    return None
@@ -0,0 +1,74 @@
+"""Per-space field schema compiled once per resolved space configuration."""
+
+import contextlib
+from collections.abc import Mapping
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Self
+from zoneinfo import ZoneInfo
+
+from spacenote.core.modules.field.models import FieldType, FieldValueType, SpaceField, SpecialValue
+from spacenote.core.modules.field.validators import VALIDATORS, DateTimeValidator, FieldValidator, ParseContext
+from spacenote.core.modules.space.models import Space
+from spacenote.errors import ValidationError
+
+
+@dataclass(frozen=True, slots=True)
+class CompiledField:
+    """Field definition paired with its validator."""
+
+    field: SpaceField
+    validator: type[FieldValidator]
+
+
+@dataclass(frozen=True, slots=True)
+class FieldSchema:
+    """Immutable lookup structures for parsing raw field values of one space.
+
+    Built from the resolved space whenever its configuration changes, so note
+    creation and update do not scan field lists or re-derive defaults per request.
+    """
+
+    # Field name → definition and validator, in space field order
+    fields: Mapping[str, CompiledField]
+    # Values of missing fields on create that do not depend on the request ($now, $me, $exif are excluded)
+    static_defaults: Mapping[str, FieldValueType]
+    # IMAGE field names referenced by DATETIME $exif.created_at:{field} defaults
+    exif_sources: tuple[str, ...]
+    # Space timezone for $now resolution
+    tz: ZoneInfo
+
+    @classmethod
+    def compile(cls, space: Space) -> Self:
+        """Compile the schema of a resolved space."""
+        fields: dict[str, CompiledField] = {}
+        static_defaults: dict[str, FieldValueType] = {}
+        exif_sources: list[str] = []
+        for field in space.fields:
+            validator = VALIDATORS.get(field.type)
+            if validator is None:
+                raise ValidationError(f"Unknown field type: {field.type}")
+            fields[field.name] = CompiledField(field=field, validator=validator)
+
+            if field.type == FieldType.DATETIME:
+                image_field = DateTimeValidator.get_exif_source_field(field.default)
+                if image_field is not None:
+                    exif_sources.append(image_field)
+            if field.default is not None and not is_dynamic_default(field):
+                # A misconfigured default is left to parse time, so the error surfaces per request
+                with contextlib.suppress(ValidationError):
+                    static_defaults[field.name] = validator.parse_value(field, space, None, ParseContext())
+
+        return cls(
+            fields=MappingProxyType(fields),
+            static_defaults=MappingProxyType(static_defaults),
+            exif_sources=tuple(dict.fromkeys(exif_sources)),
+            tz=ZoneInfo(space.timezone),
+        )
+
+
+def is_dynamic_default(field: SpaceField) -> bool:
+    """Whether the default value is resolved per request."""
+    if field.default in (SpecialValue.ME, SpecialValue.NOW):
+        return True
+    return field.type == FieldType.DATETIME and DateTimeValidator.get_exif_source_field(field.default) is not None
@@ -4,9 +4,9 @@ from typing import Any
 import structlog
 
 from spacenote.core.modules.attachment.models import PendingAttachment
-from spacenote.core.modules.field.models import FIELD_TYPE_OPTIONS, FieldType, FieldValueType, SpaceField
-from spacenote.core.modules.field.validators import VALIDATORS, DateTimeValidator, ParseContext
-from spacenote.core.modules.space.models import Space
+from spacenote.core.modules.field.models import FIELD_TYPE_OPTIONS, FieldValueType, SpaceField
+from spacenote.core.modules.field.schema import FieldSchema
+from spacenote.core.modules.field.validators import VALIDATORS, ParseContext
 from spacenote.core.service import Service
 from spacenote.errors import NotFoundError, ValidationError
 
@@ -16,13 +16,17 @@ logger = structlog.get_logger(__name__)
 class FieldService(Service):
     """Service for field management."""
 
+    def __init__(self) -> None:
+        # Compiled field schema per space, rebuilt whenever the resolved space changes
+        self._schemas: dict[str, FieldSchema] = {}
+
     async def add_field(self, slug: str, field: SpaceField) -> SpaceField:
         """Add a field to a space. Returns the validated field."""
         # Resolved space has own + inherited fields — one check catches both own and parent collisions
         space = self.core.services.space.get_space(slug)
         space_doc = self.core.services.space.get_space_document(slug)
 
-        if any(f.name == field.name for f in space.fields):
+        if space.get_field(field.name) is not None:
             raise ValidationError(f"Field '{field.name}' already exists in space")
 
         # If this is a parent space, also ensure no child already has a field with this name
@@ -32,6 +36,13 @@ class FieldService(Service):
                 if any(f.name == field.name for f in child.fields):
                     raise ValidationError(f"Field '{field.name}' already exists in child space '{child_slug}'")
 
+        # Values of a removed field with the same name would be wiped by its still running migration
+        for affected_slug in self._get_affected_slugs(slug):
+            if await self.core.services.migration.has_unfinished_unset(affected_slug, field.name):
+                raise ValidationError(
+                    f"Field '{field.name}' is still being removed from notes of space '{affected_slug}', try again later"
+                )
+
         validator_class = VALIDATORS.get(field.type)
         if not validator_class:
             raise ValidationError(f"Unknown field type: {field.type}")
@@ -49,11 +60,12 @@ class FieldService(Service):
         if not any(f.name == field_name for f in space_doc.fields):
             # Field not found in own config — check if it exists in resolved (inherited from parent)
             resolved = self.core.services.space.get_space(slug)
-            if any(f.name == field_name for f in resolved.fields):
+            if resolved.get_field(field_name) is not None:
                 raise ValidationError(f"Field '{field_name}' is inherited from parent and cannot be removed")
             raise NotFoundError(f"Field '{field_name}' not found in space")
 
         await self.core.services.space.update_space_document(slug, {"$pull": {"fields": {"name": field_name}}})
+        await self.core.services.migration.enqueue_field_removal(self._get_affected_slugs(slug), field_name)
         logger.debug("field_removed_from_space", space_slug=slug, field_name=field_name)
 
     async def update_field(
@@ -63,8 +75,16 @@ class FieldService(Service):
         required: bool,
         options: dict[str, Any],
         default: FieldValueType,
+        value_map: dict[str, str | None] | None = None,
+        *,
+        clear_removed_values: bool = False,
     ) -> SpaceField:
-        """Update a field in a space. Only required, options, and default can be changed."""
+        """Update a field in a space. Only required, options, and default can be changed.
+
+        For SELECT fields, value_map replaces stored values on existing notes (old → new,
+        None clears) and clear_removed_values clears stored values no longer allowed.
+        Without either, stored values are left as they are.
+        """
         # Resolved space for validator context, own space to check field ownership
         space = self.core.services.space.get_space(slug)
         space_doc = self.core.services.space.get_space_document(slug)
@@ -95,6 +115,7 @@ class FieldService(Service):
             raise ValidationError(f"Unknown field type: {updated_field.type}")
 
         validated_field = validator_class.validate_field(updated_field, space)
+        self.core.services.migration.validate_field_update(validated_field, value_map, clear_removed=clear_removed_values)
 
         # Update in MongoDB using array_filters pattern
         await self.core.services.space.update_space_document(
@@ -103,9 +124,20 @@ class FieldService(Service):
             array_filters=[{"elem.name": field_name}],
         )
 
+        await self.core.services.migration.enqueue_field_update(
+            self._get_affected_slugs(slug), existing_field, validated_field, value_map, clear_removed=clear_removed_values
+        )
+
         logger.debug("field_updated", space_slug=slug, field_name=field_name)
         return validated_field
 
+    def _get_affected_slugs(self, slug: str) -> list[str]:
+        """Spaces whose notes use the fields of this space: the space and, for a parent, its children."""
+        space_service = self.core.services.space
+        if space_service.get_space_document(slug).parent is not None:
+            return [slug]
+        return [slug, *space_service.get_child_slugs(slug)]
+
     async def parse_raw_fields(
         self,
         space_slug: str,
@@ -126,50 +158,69 @@ class FieldService(Service):
                 If False, parse all space fields, applying defaults for missing ones (create mode).
         """
         space = self.core.services.space.get_space(space_slug)
-        pending_attachments = await self._load_pending_attachments(space, raw_fields)
+        schema = self.get_schema(space_slug)
+        pending_attachments = await self._load_pending_attachments(schema, raw_fields)
         ctx = ParseContext(
             current_user=current_user,
             raw_fields=raw_fields,
             pending_attachments=pending_attachments,
             current_fields=current_fields,
+            tz=schema.tz,
         )
         parsed: dict[str, FieldValueType] = {}
 
         # Check for unknown fields first
         for field_name in raw_fields:
-            if space.get_field(field_name) is None:
+            if field_name not in schema.fields:
                 raise ValidationError(f"Unknown field: {field_name}")
 
         if partial:
             # For updates: only parse provided fields
             for field_name, raw_value in raw_fields.items():
-                field = space.get_field(field_name)
-                if field is not None:
-                    validator_class = VALIDATORS.get(field.type)
-                    if not validator_class:
-                        raise ValidationError(f"Unknown field type: {field.type}")
-                    parsed[field.name] = validator_class.parse_value(field, space, raw_value, ctx)
+                compiled = schema.fields[field_name]
+                parsed[field_name] = compiled.validator.parse_value(compiled.field, space, raw_value, ctx)
         else:
             # For creation: parse all fields (provided and missing)
-            for field in space.fields:
-                validator_class = VALIDATORS.get(field.type)
-                if not validator_class:
-                    raise ValidationError(f"Unknown field type: {field.type}")
-                parsed[field.name] = validator_class.parse_value(field, space, raw_fields.get(field.name), ctx)
+            for field_name, compiled in schema.fields.items():
+                raw = raw_fields.get(field_name)
+                if raw is None and field_name in schema.static_defaults:
+                    parsed[field_name] = schema.static_defaults[field_name]
+                else:
+                    parsed[field_name] = compiled.validator.parse_value(compiled.field, space, raw, ctx)
 
         return parsed
 
-    async def _load_pending_attachments(self, space: Space, raw_fields: dict[str, str]) -> list[PendingAttachment]:
+    def get_schema(self, space_slug: str) -> FieldSchema:
+        """Get the compiled field schema of a space."""
+        schema = self._schemas.get(space_slug)
+        if schema is None:
+            schema = FieldSchema.compile(self.core.services.space.get_space(space_slug))
+            self._schemas[space_slug] = schema
+        return schema
+
+    def refresh_schemas(self, slugs: list[str]) -> None:
+        """Recompile field schemas of these spaces (changed or deleted)."""
+        space_service = self.core.services.space
+        for slug in slugs:
+            self._schemas.pop(slug, None)
+            if not space_service.has_space(slug):
+                continue
+            try:
+                self._schemas[slug] = FieldSchema.compile(space_service.get_space(slug))
+            except Exception:
+                # One broken space must not abort startup or the rebuild for other spaces;
+                # get_schema compiles it again on use and surfaces the error there
+                logger.exception("field_schema_compile_failed", space_slug=slug)
+        # Deleted or renamed spaces
+        for slug in [slug for slug in self._schemas if not space_service.has_space(slug)]:
+            del self._schemas[slug]
+
+    async def _load_pending_attachments(self, schema: FieldSchema, raw_fields: dict[str, str]) -> list[PendingAttachment]:
         """Load pending attachments needed for field value parsing."""
         pending_numbers: set[int] = set()
 
         # DATETIME fields with $exif.created_at:{field} default need the referenced image's EXIF data
-        for field in space.fields:
-            if field.type != FieldType.DATETIME:
-                continue
-            image_field = DateTimeValidator.get_exif_source_field(field.default)
-            if not image_field:
-                continue
+        for image_field in schema.exif_sources:
             raw_value = raw_fields.get(image_field)
             if raw_value:
                 with contextlib.suppress(ValueError):
@@ -43,6 +43,8 @@ class ParseContext:
     pending_attachments: list[PendingAttachment] | None = None
     # Current note field values, used by RECURRENCE fields for $done/$reset (preserving interval on update)
     current_fields: dict[str, FieldValueType] | None = field(default=None)
+    # Space timezone from the compiled field schema, used by DATETIME $now (resolved from space.timezone if None)
+    tz: ZoneInfo | None = None
 
 
 class FieldValidator(ABC):
@@ -414,15 +416,15 @@ class DateTimeValidator(FieldValidator):
                     raise ValidationError(f"Invalid EXIF fallback: {source.fallback}. Use $now or date literal")
 
     @classmethod
-    def _resolve_now(cls, kind: str, space: Space) -> datetime | str:
+    def _resolve_now(cls, kind: str, space: Space, ctx: ParseContext) -> datetime | str:
         """Resolve $now based on kind and space timezone."""
         match kind:
             case "utc":
                 return datetime.now(UTC)
             case "local":
-                return datetime.now(ZoneInfo(space.timezone)).strftime(cls._LOCAL_FORMAT)
+                return datetime.now(ctx.tz or ZoneInfo(space.timezone)).strftime(cls._LOCAL_FORMAT)
             case "date":
-                return datetime.now(ZoneInfo(space.timezone)).strftime(cls._DATE_FORMAT)
+                return datetime.now(ctx.tz or ZoneInfo(space.timezone)).strftime(cls._DATE_FORMAT)
             case _:
                 raise ValidationError(f"Unknown datetime kind: {kind}")
 
@@ -435,7 +437,7 @@ class DateTimeValidator(FieldValidator):
         if raw is None:
             if field.default is not None:
                 if field.default == SpecialValue.NOW:
-                    return cls._resolve_now(kind, space)
+                    return cls._resolve_now(kind, space, ctx)
 
                 if isinstance(field.default, str):
                     source = cls._parse_exif_created_at_source(field.default)
@@ -451,7 +453,7 @@ class DateTimeValidator(FieldValidator):
             return None
 
         if raw == SpecialValue.NOW:
-            return cls._resolve_now(kind, space)
+            return cls._resolve_now(kind, space, ctx)
 
         match kind:
             case "utc":
@@ -474,20 +476,20 @@ class DateTimeValidator(FieldValidator):
     ) -> datetime | str | None:
         """Extract EXIF datetime from the referenced IMAGE field's pending attachment."""
         if not ctx.raw_fields or not ctx.pending_attachments:
-            return cls._resolve_fallback(source.fallback, kind, space)
+            return cls._resolve_fallback(source.fallback, kind, space, ctx)
 
         raw_value = ctx.raw_fields.get(source.image_field)
         if not raw_value:
-            return cls._resolve_fallback(source.fallback, kind, space)
+            return cls._resolve_fallback(source.fallback, kind, space, ctx)
 
         try:
             pending_number = int(raw_value)
         except ValueError:
-            return cls._resolve_fallback(source.fallback, kind, space)
+            return cls._resolve_fallback(source.fallback, kind, space, ctx)
 
         pending = next((p for p in ctx.pending_attachments if p.number == pending_number), None)
         if not pending or not pending.meta.image or not pending.meta.image.exif_date_time_original:
-            return cls._resolve_fallback(source.fallback, kind, space)
+            return cls._resolve_fallback(source.fallback, kind, space, ctx)
 
         dt_original = pending.meta.image.exif_date_time_original
         offset_original = pending.meta.image.exif_offset_time_original
@@ -526,11 +528,11 @@ class DateTimeValidator(FieldValidator):
                 raise ValidationError(f"Unknown datetime kind: {kind}")
 
     @classmethod
-    def _resolve_fallback(cls, fallback: str | None, kind: str, space: Space) -> datetime | str | None:
+    def _resolve_fallback(cls, fallback: str | None, kind: str, space: Space, ctx: ParseContext) -> datetime | str | None:
         if fallback is None:
             return None
         if fallback == SpecialValue.NOW:
-            return cls._resolve_now(kind, space)
+            return cls._resolve_now(kind, space, ctx)
         match kind:
             case "utc":
                 return cls._parse_datetime(fallback, UTC)
@@ -26,6 +26,8 @@ System fields:
 - ``note.created_at``  — creation timestamp (datetime)
 - ``note.edited_at``   — last edit timestamp (datetime | null)
 - ``note.activity_at`` — last activity timestamp (datetime)
+- ``note.title``      — rendered note title (string)
+- ``note.text``        — all text of the note (``search`` operator only)
 
 Custom fields:
 
@@ -38,6 +40,9 @@ Operators
 - ``contains``, ``startswith``, ``endswith`` — text search (string, markdown)
 - ``in``, ``nin``          — set membership (select, tags)
 - ``all``              — all values present (tags)
+- ``search``           — full-text search (note.text); every word must match, ``-word`` excludes
+  (at least one word to match is required). Covers string, select and tags fields;
+  results are ordered by relevance
 
 Special Values
 --------------
@@ -77,6 +82,10 @@ Date filter::
 Text search::
 
     note.fields.title:contains:meeting
+
+Full-text search::
+
+    note.text:search:quarterly report -draft
 """
 
 from __future__ import annotations
@@ -158,6 +167,10 @@ def _parse_value(value_raw: str, operator: FilterOperator) -> str | int | float
     if operator in (FilterOperator.IN, FilterOperator.NIN, FilterOperator.ALL):
         return value.split("|")
 
+    # Search text is never coerced (e.g. "2024" stays a string)
+    if operator == FilterOperator.SEARCH:
+        return value
+
     return _coerce_simple_value(value)
 
 
@@ -0,0 +1,68 @@
+"""Facet (value count) aggregation over filtered notes."""
+
+from typing import Any
+
+from spacenote.core.modules.field.models import FieldType
+from spacenote.core.modules.filter.models import get_field
+from spacenote.core.modules.filter.query_builder import get_field_path
+from spacenote.core.modules.space.models import Space
+from spacenote.errors import ValidationError
+
+# Field types with a small set of distinct values worth counting
+FACET_FIELD_TYPES = {FieldType.SELECT, FieldType.TAGS, FieldType.USER}
+
+# Most frequent values returned per field
+MAX_FACET_BUCKETS = 100
+
+# Upper bound on fields per request (each one is a sub-pipeline of the same aggregation)
+MAX_FACET_FIELDS = 20
+
+
+def validate_facet_fields(space: Space, field_names: list[str]) -> list[str]:
+    """Validate facet field references and return them without duplicates.
+
+    Fields use filter syntax: note.author or note.fields.{name}.
+    """
+    if not field_names:
+        raise ValidationError("At least one facet field is required")
+    unique = list(dict.fromkeys(field_names))
+    if len(unique) > MAX_FACET_FIELDS:
+        raise ValidationError(f"Too many facet fields (max {MAX_FACET_FIELDS})")
+    for name in unique:
+        field = get_field(space, name)
+        if field is None:
+            raise ValidationError(f"Unknown facet field: {name}")
+        if field.type not in FACET_FIELD_TYPES:
+            raise ValidationError(f"Facets are not supported for {field.type} field: {name}")
+    return unique
+
+
+def build_facet_pipeline(space: Space, query: dict[str, Any], field_names: list[str]) -> list[dict[str, Any]]:
+    """Build a single aggregation counting notes per value of each field.
+
+    Output is one document with a key per field position ("f0", "f1", ...; facet names
+    cannot contain dots), each a list of {_id: value, count} sorted by count descending.
+    TAGS values are unwound so every tag counts separately. Notes without a value are
+    counted under a null value (not for TAGS).
+    """
+    facets: dict[str, list[dict[str, Any]]] = {}
+    for index, name in enumerate(field_names):
+        path = get_field_path(name)
+        field = get_field(space, name)
+        stages: list[dict[str, Any]] = []
+        if field is not None and field.type == FieldType.TAGS:
+            stages.append({"$unwind": f"${path}"})
+        stages.extend(
+            [
+                {"$group": {"_id": f"${path}", "count": {"$sum": 1}}},
+                {"$sort": {"count": -1, "_id": 1}},
+                {"$limit": MAX_FACET_BUCKETS},
+            ]
+        )
+        facets[get_facet_key(index)] = stages
+    return [{"$match": query}, {"$facet": facets}]
+
+
+def get_facet_key(index: int) -> str:
+    """Output key of the facet at the given field position."""
+    return f"f{index}"
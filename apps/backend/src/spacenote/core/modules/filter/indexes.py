@@ -0,0 +1,95 @@
+"""Compound note indexes derived from saved filters, and the full-text index."""
+
+import hashlib
+from collections.abc import Iterable
+
+from spacenote.core.modules.field.models import FieldType
+from spacenote.core.modules.field.normalize import has_shadow
+from spacenote.core.modules.filter.models import Filter, FilterOperator, get_field
+from spacenote.core.modules.filter.query_builder import build_mongo_sort, get_condition_path, get_field_path
+from spacenote.core.modules.space.models import Space
+
+# Names of indexes managed by FilterService start with this prefix
+MANAGED_INDEX_PREFIX = "filter_"
+
+# MongoDB limit on the number of keys in a compound index
+MAX_INDEX_KEYS = 32
+
+# Paths already served by the static (space_slug, number) indexes
+_BASE_INDEX_PATHS = {"space_slug", "number"}
+
+# Field types whose values are user-entered text, covered by the full-text index
+TEXT_SEARCH_FIELD_TYPES = frozenset({FieldType.STRING, FieldType.SELECT, FieldType.TAGS})
+
+
+def derive_filter_index(space: Space, filter: Filter) -> list[tuple[str, int]] | None:
+    """Derive compound index keys serving a saved filter, or None if existing indexes suffice.
+
+    Keys follow the ESR rule: space_slug and equality conditions first, then the sort
+    keys (so MongoDB can walk the index instead of sorting in memory), then range
+    conditions. At most one array (TAGS) field is included, since MongoDB cannot
+    index parallel arrays. Filters with full-text search use the text index instead.
+    """
+    if any(c.operator == FilterOperator.SEARCH for c in filter.conditions):
+        # $text queries are always served by the text index alone
+        return None
+
+    shadow_fields = {f.name for f in space.fields if has_shadow(f)}
+    equality: list[str] = []
+    ranges: list[str] = []
+    for condition in filter.conditions:
+        if not _is_indexable(space, condition.field):
+            continue
+        target = equality if condition.operator == FilterOperator.EQ else ranges
+        target.append(get_condition_path(condition, shadow_fields))
+
+    keys: list[tuple[str, int]] = [("space_slug", 1)]
+    keys.extend((path, 1) for path in equality)
+    keys.extend(build_mongo_sort(filter.sort))
+    keys.extend((path, 1) for path in ranges)
+
+    array_paths = {get_field_path(name) for name in _array_field_names(space, filter)}
+    result: list[tuple[str, int]] = []
+    seen: set[str] = set()
+    has_array = False
+    for path, direction in keys:
+        if path in seen:
+            continue
+        if path in array_paths:
+            if has_array:
+                continue
+            has_array = True
+        seen.add(path)
+        result.append((path, direction))
+
+    if seen <= _BASE_INDEX_PATHS:
+        return None
+    return result[:MAX_INDEX_KEYS]
+
+
+def derive_text_index_paths(spaces: Iterable[Space]) -> list[str]:
+    """Custom field paths the full-text index covers: text fields of all spaces, sorted.
+
+    Only user-entered text is indexed. A wildcard text index would also cover author,
+    the stored title (rendered from fields) and the normalized shadows, matching notes
+    on text they do not show or counting the same words twice.
+    """
+    return sorted({get_field_path(f.name) for space in spaces for f in space.fields if f.type in TEXT_SEARCH_FIELD_TYPES})
+
+
+def get_index_name(keys: list[tuple[str, int]]) -> str:
+    """Deterministic name for a managed index, identical for filters that derive the same keys."""
+    spec = ",".join(f"{path}:{direction}" for path, direction in keys)
+    return MANAGED_INDEX_PREFIX + hashlib.sha256(spec.encode()).hexdigest()[:16]
+
+
+def _is_indexable(space: Space, field_name: str) -> bool:
+    """Check if a condition field is worth indexing (known field with scalar or tag values)."""
+    field = get_field(space, field_name)
+    return field is not None and field.type not in (FieldType.IMAGE, FieldType.RECURRENCE)
+
+
+def _array_field_names(space: Space, filter: Filter) -> set[str]:
+    """Names of TAGS fields referenced by the filter's conditions or sort."""
+    names = {c.field for c in filter.conditions} | {s.removeprefix("-") for s in filter.sort}
+    return {name for name in names if (field := get_field(space, name)) is not None and field.type == FieldType.TAGS}
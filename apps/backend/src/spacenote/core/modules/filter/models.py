@@ -11,6 +11,7 @@ from spacenote.core.modules.field.models import (
     FieldValueType,
     NumericFieldOptions,
     SpaceField,
+    StringFieldOptions,
     UserFieldOptions,
 )
 from spacenote.core.schema import OpenAPIModel
@@ -38,6 +39,8 @@ class FilterOperator(StrEnum):
     GTE = "gte"
     LT = "lt"
     LTE = "lte"
+    # Full-text (only on SEARCH_FIELD)
+    SEARCH = "search"
 
 
 class FilterCondition(OpenAPIModel):
@@ -50,6 +53,9 @@ class FilterCondition(OpenAPIModel):
 
 ALL_FILTER_NAME = "all"
 
+# Pseudo system field for full-text search over all text of a note (search operator only)
+SEARCH_FIELD = "note.text"
+
 
 class Filter(OpenAPIModel):
     """Filter definition for a space."""
@@ -142,6 +148,8 @@ def get_system_field_definitions() -> dict[str, SpaceField]:
         "note.activity_at": SpaceField(
             name="note.activity_at", type=FieldType.DATETIME, required=True, options=DatetimeFieldOptions()
         ),
+        "note.title": SpaceField(name="note.title", type=FieldType.STRING, required=False, options=StringFieldOptions()),
+        SEARCH_FIELD: SpaceField(name=SEARCH_FIELD, type=FieldType.STRING, required=False, options=StringFieldOptions()),
     }
 
 
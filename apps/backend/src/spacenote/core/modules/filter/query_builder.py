@@ -1,8 +1,11 @@
 import re
+from collections.abc import Collection
 from typing import Any
 
-from spacenote.core.modules.field.models import FieldValueType
+from spacenote.core.modules.field.models import FieldValueType, SpecialValue
+from spacenote.core.modules.field.normalize import SHADOW_MAX_LENGTH, get_shadow_path, normalize_text, prefix_upper_bound
 from spacenote.core.modules.filter.models import FilterCondition, FilterOperator
+from spacenote.errors import ValidationError
 
 # System field name to MongoDB field mapping
 SYSTEM_FIELD_MAP: dict[str, str] = {
@@ -11,6 +14,7 @@ SYSTEM_FIELD_MAP: dict[str, str] = {
     "note.created_at": "created_at",
     "note.edited_at": "edited_at",
     "note.activity_at": "activity_at",
+    "note.title": "title",
 }
 
 
@@ -50,36 +54,142 @@ def build_condition_query(operator: FilterOperator, value: FieldValueType) -> Fi
             return {"$regex": f"^{re.escape(str(value))}", "$options": "i"}
         case FilterOperator.ENDSWITH:
             return {"$regex": f"{re.escape(str(value))}$", "$options": "i"}
+        case FilterOperator.SEARCH:
+            raise ValueError("Search conditions are compiled to $text by build_mongo_query")
 
 
-def build_mongo_query(conditions: list[FilterCondition], space_slug: str, current_user: str) -> dict[str, Any]:
-    """Build MongoDB query from filter conditions."""
+def build_mongo_query(
+    conditions: list[FilterCondition], space_slug: str, current_user: str, shadow_fields: Collection[str] = ()
+) -> dict[str, Any]:
+    """Build MongoDB query from filter conditions.
+
+    Args:
+        shadow_fields: Custom fields with normalized shadow values (see field.normalize);
+            startswith on them compiles to an index-friendly range on the shadow.
+    """
     query: dict[str, Any] = {"space_slug": space_slug}
+    search_terms: list[str] = []
 
     for condition in conditions:
+        if condition.operator == FilterOperator.SEARCH:
+            search_terms.append(str(condition.value))
+            continue
+
         value = condition.value
         # Resolve $me for USER fields
-        if value == "$me":
+        if value == SpecialValue.ME:
             value = current_user
 
         field_path = get_field_path(condition.field)
-        condition_query = build_condition_query(condition.operator, value)
-
-        if field_path in query:
-            # Multiple conditions on same field - use $and
-            existing = query.pop(field_path)
-            if "$and" not in query:
-                query["$and"] = []
-            query["$and"].append({field_path: existing})
-            query["$and"].append({field_path: condition_query})
-        else:
-            query[field_path] = condition_query
+        shadow_field = _get_shadow_field(condition, shadow_fields)
+        if shadow_field is not None:
+            prefix = normalize_text(str(value))
+            _add_condition(query, get_shadow_path(shadow_field), build_prefix_range(prefix[:SHADOW_MAX_LENGTH]))
+            if len(prefix) <= SHADOW_MAX_LENGTH:
+                continue
+            # Shadows are truncated — the range narrows candidates, the regex checks the rest
+
+        _add_condition(query, field_path, build_condition_query(condition.operator, value))
+
+    if search_terms:
+        query["$text"] = {"$search": build_text_search(search_terms)}
 
     return query
 
 
+def is_user_specific(conditions: list[FilterCondition]) -> bool:
+    """Check if compiled conditions depend on the current user beyond plain `$me` values.
+
+    `$me` used with eq/ne compiles to the literal value, so a query compiled with the
+    `$me` placeholder works for every user after `resolve_me`. With other operators the
+    user name is transformed (escaped into a regex, normalized into a range), so the
+    query must be compiled per user.
+    """
+    return any(
+        c.value == SpecialValue.ME and c.operator not in (FilterOperator.EQ, FilterOperator.NE, FilterOperator.SEARCH)
+        for c in conditions
+    )
+
+
+def resolve_me(query: dict[str, Any], current_user: str) -> dict[str, Any]:
+    """Copy of a compiled query with `$me` placeholder values replaced by the current user."""
+    return {key: _resolve_me_value(value, current_user) for key, value in query.items()}
+
+
+def _resolve_me_value(value: object, current_user: str) -> object:
+    if isinstance(value, dict):
+        return {key: _resolve_me_value(item, current_user) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_resolve_me_value(item, current_user) for item in value]
+    if value == SpecialValue.ME:
+        return current_user
+    return value
+
+
+def _add_condition(query: dict[str, Any], field_path: str, condition_query: object) -> None:
+    """Add condition on a path, combining with an existing condition on the same path via $and."""
+    if field_path in query:
+        # Multiple conditions on same field - use $and
+        existing = query.pop(field_path)
+        if "$and" not in query:
+            query["$and"] = []
+        query["$and"].append({field_path: existing})
+        query["$and"].append({field_path: condition_query})
+    else:
+        query[field_path] = condition_query
+
+
+def build_prefix_range(prefix: str) -> dict[str, str]:
+    """Range matching all strings that start with prefix (index-usable, unlike regex)."""
+    condition = {"$gte": prefix}
+    upper = prefix_upper_bound(prefix)
+    if upper is not None:
+        condition["$lt"] = upper
+    return condition
+
+
+def get_condition_path(condition: FilterCondition, shadow_fields: Collection[str] = ()) -> str:
+    """Document path a condition is evaluated on (the shadow path for rewritten startswith)."""
+    shadow_field = _get_shadow_field(condition, shadow_fields)
+    if shadow_field is not None:
+        return get_shadow_path(shadow_field)
+    return get_field_path(condition.field)
+
+
+def _get_shadow_field(condition: FilterCondition, shadow_fields: Collection[str]) -> str | None:
+    """Custom field name if the condition is a startswith served by its shadow, else None."""
+    if condition.operator != FilterOperator.STARTSWITH or not condition.field.startswith("note.fields."):
+        return None
+    name = condition.field.removeprefix("note.fields.")
+    return name if name in shadow_fields else None
+
+
+def build_text_search(terms: list[str]) -> str:
+    """Build $text search string where every word must be present.
+
+    Plain $text ORs words, so each word is quoted (quoted phrases are ANDed).
+    Words starting with "-" stay unquoted and exclude matching notes.
+
+    Raises:
+        ValidationError: If there is no word to match (MongoDB would return no notes at all)
+    """
+    words = [word for term in terms for word in term.replace('"', " ").split()]
+    if not any(not word.startswith("-") for word in words):
+        raise ValidationError("Search needs at least one word to match; '-word' only excludes notes matching other words")
+    return " ".join(word if word.startswith("-") else f'"{word}"' for word in words)
+
+
+def is_text_search(query: dict[str, Any]) -> bool:
+    """Check if a built query uses the full-text index (results are ordered by relevance)."""
+    return "$text" in query
+
+
 def build_mongo_sort(sort_fields: list[str]) -> list[tuple[str, int]]:
-    """Build MongoDB sort specification from field list."""
+    """Build MongoDB sort specification from field list.
+
+    Always ends with "number" as a unique tiebreaker, so the order is total
+    and can be used for keyset pagination.
+    """
     if not sort_fields:
         return [("number", -1)]
 
@@ -89,4 +199,47 @@ def build_mongo_sort(sort_fields: list[str]) -> list[tuple[str, int]]:
             result.append((get_field_path(field[1:]), -1))
         else:
             result.append((get_field_path(field), 1))
+
+    if all(path != "number" for path, _ in result):
+        result.append(("number", result[-1][1]))
     return result
+
+
+def get_sort_values(doc: dict[str, Any], sort_spec: list[tuple[str, int]]) -> list[Any]:
+    """Extract sort key values from a raw MongoDB document (missing values become None)."""
+    values: list[Any] = []
+    for path, _ in sort_spec:
+        value: Any = doc
+        for part in path.split("."):
+            value = value.get(part) if isinstance(value, dict) else None
+        values.append(value)
+    return values
+
+
+def build_keyset_query(sort_spec: list[tuple[str, int]], values: list[Any]) -> dict[str, Any]:
+    """Build query matching documents that come strictly after `values` in `sort_spec` order.
+
+    Follows MongoDB ordering where null/missing sorts before any other value:
+    first in ascending order, last in descending order.
+    """
+    branches: list[dict[str, Any]] = []
+    for i, (path, direction) in enumerate(sort_spec):
+        after = _build_after_condition(path, direction, values[i])
+        if after is None:
+            continue
+        prefix = {sort_spec[j][0]: values[j] for j in range(i)}
+        branches.append({"$and": [prefix, after]} if prefix else after)
+
+    if not branches:
+        # Nothing can follow the last item; match nothing
+        return {"_id": {"$exists": False}}
+    return branches[0] if len(branches) == 1 else {"$or": branches}
+
+
+def _build_after_condition(path: str, direction: int, value: object) -> dict[str, Any] | None:
+    """Condition for values strictly after `value` on a single key, or None if no value can follow."""
+    if value is None:
+        return {path: {"$ne": None}} if direction == 1 else None
+    if direction == 1:
+        return {path: {"$gt": value}}
+    return {"$or": [{path: {"$lt": value}}, {path: None}]}
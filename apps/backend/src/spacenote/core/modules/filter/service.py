@@ -1,9 +1,20 @@
+import asyncio
+from dataclasses import dataclass
 from typing import Any
 
 import structlog
 
+from spacenote.core.cache import SpaceVersionedCache
+from spacenote.core.modules.field.models import SpecialValue
+from spacenote.core.modules.field.normalize import has_shadow
 from spacenote.core.modules.filter import query_builder
 from spacenote.core.modules.filter.adhoc import parse_adhoc_query
+from spacenote.core.modules.filter.indexes import (
+    MANAGED_INDEX_PREFIX,
+    derive_filter_index,
+    derive_text_index_paths,
+    get_index_name,
+)
 from spacenote.core.modules.filter.models import ALL_FILTER_NAME, Filter
 from spacenote.core.modules.filter.validators import validate_filter
 from spacenote.core.service import Service
@@ -12,9 +23,41 @@ from spacenote.errors import NotFoundError, ValidationError
 logger = structlog.get_logger(__name__)
 
 
+@dataclass(frozen=True)
+class _CompiledQuery:
+    """Cached result of compiling a filter (plus adhoc query) into MongoDB query and sort."""
+
+    query: dict[str, Any]
+    sort_spec: list[tuple[str, int]]
+    user_specific: bool  # Compiled for one user; cached under a key including the user name
+
+
 class FilterService(Service):
     """Service for filter management."""
 
+    def __init__(self) -> None:
+        # Managed note index name → saved filters using it, as (space_slug, filter_name)
+        self._index_refs: dict[str, set[tuple[str, str]]] = {}
+        self._index_keys: dict[str, list[tuple[str, int]]] = {}
+        self._index_lock = asyncio.Lock()
+        self._index_tasks: set[asyncio.Task[None]] = set()
+        # Field paths the full-text index covers; None until first synced
+        self._text_index_paths: list[str] | None = None
+        # Compiled queries per (filter, adhoc query[, user]), invalidated when the space changes
+        self._query_cache: SpaceVersionedCache[_CompiledQuery] = SpaceVersionedCache()
+
+    async def on_start(self) -> None:
+        """Reconcile managed note indexes with saved filters (creates missing, drops unused)."""
+        self.sync_filter_indexes()
+        for name in await self.core.services.note.list_index_names():
+            if name.startswith(MANAGED_INDEX_PREFIX) and name not in self._index_refs:
+                self._schedule_index_apply(name)
+
+    async def on_stop(self) -> None:
+        """Wait for pending index operations."""
+        if self._index_tasks:
+            await asyncio.gather(*self._index_tasks, return_exceptions=True)
+
     async def add_filter(self, slug: str, filter: Filter) -> Filter:
         """Add a filter to a space."""
         # Resolved space for validation (has full field list including inherited)
@@ -43,7 +86,7 @@ class FilterService(Service):
         if not any(f.name == filter_name for f in space_doc.filters):
             # Filter not in own config — check if it exists in resolved (inherited from parent)
             resolved = self.core.services.space.get_space(slug)
-            if any(f.name == filter_name for f in resolved.filters):
+            if resolved.get_filter(filter_name) is not None:
                 raise ValidationError(f"Filter '{filter_name}' is inherited from parent and cannot be removed")
             raise NotFoundError(f"Filter '{filter_name}' not found in space")
 
@@ -108,7 +151,30 @@ class FilterService(Service):
     def build_query(
         self, space_slug: str, filter_name: str, current_user: str, adhoc_query: str | None = None
     ) -> tuple[dict[str, Any], list[tuple[str, int]]]:
-        """Build MongoDB query and sort spec for a filter."""
+        """Build MongoDB query and sort spec for a filter.
+
+        Compiled queries are cached until the space configuration changes, so repeated
+        requests skip parsing and validation. `$me` is compiled as a placeholder and
+        resolved per call, so one entry serves all users.
+        """
+        key: tuple[str | None, ...] = (filter_name, adhoc_query)
+        compiled = self._query_cache.get(space_slug, key)
+        if compiled is not None and compiled.user_specific:
+            compiled = self._query_cache.get(space_slug, (*key, current_user))
+        if compiled is None:
+            version = self._query_cache.get_version(space_slug)
+            compiled = self._compile_query(space_slug, filter_name, current_user, adhoc_query)
+            self._query_cache.set(space_slug, key, compiled, version)
+            if compiled.user_specific:
+                self._query_cache.set(space_slug, (*key, current_user), compiled, version)
+        return query_builder.resolve_me(compiled.query, current_user), list(compiled.sort_spec)
+
+    def invalidate_query_cache(self, space_slug: str) -> None:
+        """Forget compiled queries of a space. Called whenever its resolved configuration changes."""
+        self._query_cache.invalidate(space_slug)
+
+    def _compile_query(self, space_slug: str, filter_name: str, current_user: str, adhoc_query: str | None) -> _CompiledQuery:
+        """Parse, validate and compile filter conditions (with `$me` left as placeholder when possible)."""
         space = self.core.services.space.get_space(space_slug)
         filter_def = space.get_filter(filter_name)
         if not filter_def:
@@ -120,6 +186,80 @@ class FilterService(Service):
             adhoc_conditions = parse_adhoc_query(adhoc_query, space)
             conditions.extend(adhoc_conditions)
 
-        query = query_builder.build_mongo_query(conditions, space_slug, current_user)
+        user_specific = query_builder.is_user_specific(conditions)
+        # Shadow values can be relied on only once existing notes of the space are backfilled
+        shadow_fields = (
+            {f.name for f in space.fields if has_shadow(f)} if self.core.services.note.has_shadow_values(space_slug) else set()
+        )
+        query = query_builder.build_mongo_query(
+            conditions, space_slug, current_user if user_specific else SpecialValue.ME, shadow_fields
+        )
         sort_spec = query_builder.build_mongo_sort(filter_def.sort)
-        return query, sort_spec
+        return _CompiledQuery(query=query, sort_spec=sort_spec, user_specific=user_specific)
+
+    # --- Indexes ---
+
+    def sync_filter_indexes(self) -> None:
+        """Recompute which managed indexes saved filters need and apply changes in the background.
+
+        Filters deriving the same index keys share one index; it is reference-counted by
+        (space, filter) pairs and dropped once no filter uses it. Called whenever resolved
+        spaces change, so added, updated, removed and inherited filters are all covered.
+        The full-text index is rebuilt here too when the set of text fields changes.
+        """
+        spaces = self.core.services.space.list_all_spaces()
+        text_paths = derive_text_index_paths(spaces)
+        if text_paths != self._text_index_paths:
+            self._text_index_paths = text_paths
+            self._track_index_task(asyncio.create_task(self._apply_text_index(text_paths)))
+
+        refs: dict[str, set[tuple[str, str]]] = {}
+        keys_by_name: dict[str, list[tuple[str, int]]] = {}
+        for space in spaces:
+            for filter_def in space.filters:
+                keys = derive_filter_index(space, filter_def)
+                if keys is None:
+                    continue
+                name = get_index_name(keys)
+                keys_by_name[name] = keys
+                refs.setdefault(name, set()).add((space.slug, filter_def.name))
+
+        added = refs.keys() - self._index_refs.keys()
+        removed = self._index_refs.keys() - refs.keys()
+        self._index_refs = refs
+        self._index_keys = keys_by_name
+        for name in sorted(added | removed):
+            self._schedule_index_apply(name)
+
+    def _schedule_index_apply(self, name: str) -> None:
+        """Run _apply_index in a background task, keeping a reference until it finishes."""
+        self._track_index_task(asyncio.create_task(self._apply_index(name)))
+
+    def _track_index_task(self, task: asyncio.Task[None]) -> None:
+        """Keep a reference to a background index task until it finishes."""
+        self._index_tasks.add(task)
+        task.add_done_callback(self._index_tasks.discard)
+
+    async def _apply_index(self, name: str) -> None:
+        """Bring one managed index in line with current references (create if used, drop if not)."""
+        async with self._index_lock:
+            try:
+                if name in self._index_refs:
+                    await self.core.services.note.create_index(self._index_keys[name], name)
+                    logger.info("filter_index_created", name=name, keys=self._index_keys[name])
+                elif name in await self.core.services.note.list_index_names():
+                    await self.core.services.note.drop_index(name)
+                    logger.info("filter_index_dropped", name=name)
+            except Exception:
+                logger.exception("filter_index_sync_failed", name=name)
+
+    async def _apply_text_index(self, paths: list[str]) -> None:
+        """Rebuild the full-text index if it does not cover exactly the given field paths."""
+        async with self._index_lock:
+            if paths != self._text_index_paths:
+                return  # Superseded by a later sync
+            try:
+                if await self.core.services.note.sync_text_index(paths):
+                    logger.info("text_index_rebuilt", paths=paths)
+            except Exception:
+                logger.exception("text_index_sync_failed", paths=paths)
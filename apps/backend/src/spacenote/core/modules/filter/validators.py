@@ -15,6 +15,7 @@ from spacenote.core.modules.field.models import (
 from spacenote.core.modules.filter.models import (
     ALL_FILTER_NAME,
     FIELD_TYPE_OPERATORS,
+    SEARCH_FIELD,
     Filter,
     FilterCondition,
     FilterOperator,
@@ -23,15 +24,11 @@ from spacenote.core.modules.filter.models import (
 from spacenote.core.modules.space.models import Space
 from spacenote.errors import ValidationError
 
-DISPLAY_ONLY_COLUMNS = {"note.title"}
-
 
 def validate_default_columns(space: Space, columns: list[str]) -> list[str]:
     """Validate column references for notes list."""
     for column in columns:
-        if column in DISPLAY_ONLY_COLUMNS:
-            continue
-        if not get_field(space, column):
+        if column == SEARCH_FIELD or not get_field(space, column):
             raise ValidationError(f"Unknown column: {column}")
     return columns
 
@@ -264,6 +261,9 @@ def _validate_condition(condition: FilterCondition, space: Space) -> FilterCondi
     if not field:
         raise ValidationError(f"Unknown field in condition: {condition.field}")
 
+    if condition.field == SEARCH_FIELD or condition.operator == FilterOperator.SEARCH:
+        return _validate_search_condition(condition)
+
     allowed_operators = FIELD_TYPE_OPERATORS.get(field.type)
     if not allowed_operators:
         raise ValidationError(f"Field type '{field.type}' does not support filtering")
@@ -275,9 +275,18 @@ def _validate_condition(condition: FilterCondition, space: Space) -> FilterCondi
     return FilterCondition(field=condition.field, operator=condition.operator, value=validated_value)
 
 
+def _validate_search_condition(condition: FilterCondition) -> FilterCondition:
+    """Validate a full-text search condition."""
+    if condition.field != SEARCH_FIELD or condition.operator != FilterOperator.SEARCH:
+        raise ValidationError(f"Operator '{FilterOperator.SEARCH}' is only valid for '{SEARCH_FIELD}' and vice versa")
+    if not isinstance(condition.value, str) or not condition.value.strip():
+        raise ValidationError("Search value must be a non-empty string")
+    return FilterCondition(field=condition.field, operator=condition.operator, value=condition.value.strip())
+
+
 def _validate_sort_field(sort_field: str, space: Space) -> str:
     """Validate a single sort field."""
     field_name = sort_field.lstrip("-")
-    if not get_field(space, field_name):
+    if field_name == SEARCH_FIELD or not get_field(space, field_name):
         raise ValidationError(f"Unknown field in sort: {field_name}")
     return sort_field
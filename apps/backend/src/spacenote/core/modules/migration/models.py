@@ -0,0 +1,61 @@
+from datetime import datetime
+from enum import StrEnum
+
+from pydantic import Field
+
+from spacenote.core.db import MongoModel
+from spacenote.utils import now
+
+
+class MigrationJobType(StrEnum):
+    """
+    Kinds of note data migrations started by field definition changes.
+
+    UNSET_FIELD — remove values of a removed field.
+    BACKFILL_DEFAULT — fill empty values with the field's current default.
+    COERCE_VALUES — convert values to the field's current options (SELECT values only as
+    requested by value_map / clear_removed).
+    """
+
+    UNSET_FIELD = "unset_field"
+    BACKFILL_DEFAULT = "backfill_default"
+    COERCE_VALUES = "coerce_values"
+
+
+class MigrationJobStatus(StrEnum):
+    PENDING = "pending"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+
+class MigrationJob(MongoModel):
+    """Background migration of one field's values across the notes of a space. Processed by single worker.
+
+    Notes are processed in ascending number order; `last_number` is stored after every batch,
+    so a job interrupted by a restart continues where it stopped. Progress is written only
+    while `lease_holder` is unchanged, so a process that lost leadership cannot overwrite it.
+    """
+
+    number: int = Field(..., description="Sequential per space, unique with space_slug")
+    space_slug: str = Field(..., description="Space identifier")
+    field_name: str = Field(..., description="Field whose values are migrated")
+    job_type: MigrationJobType = Field(..., description="Type of migration")
+    value_map: dict[str, str | None] | None = Field(
+        default=None, description="COERCE_VALUES: SELECT values to replace (old → new, null clears)"
+    )
+    clear_removed: bool = Field(
+        default=False, description="COERCE_VALUES: clear SELECT values no longer allowed and not in value_map"
+    )
+
+    status: MigrationJobStatus = Field(default=MigrationJobStatus.PENDING, description="Job status")
+    lease_holder: str | None = Field(default=None, description="Server process processing the job (leader lease holder)")
+    created_at: datetime = Field(default_factory=now, description="Creation timestamp")
+    started_at: datetime | None = Field(default=None, description="When processing (last) started")
+    finished_at: datetime | None = Field(default=None, description="When the job completed or failed")
+
+    total: int | None = Field(default=None, description="Notes to process, counted when processing starts")
+    processed: int = Field(default=0, description="Notes processed so far")
+    modified: int = Field(default=0, description="Notes actually changed so far")
+    last_number: int = Field(default=0, description="Number of the last processed note (resume point)")
+    error: str | None = Field(default=None, description="Error message if the job failed")
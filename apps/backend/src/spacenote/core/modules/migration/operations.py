@@ -0,0 +1,137 @@
+"""Per-note updates applied by migration jobs."""
+
+from collections.abc import Mapping
+from decimal import Decimal
+from typing import Any
+
+from pymongo import UpdateOne
+
+from spacenote.core.modules.field.models import FieldType, FieldValueType, NumericFieldOptions, SelectFieldOptions, SpaceField
+from spacenote.core.modules.field.normalize import build_shadow_value, get_shadow_path, has_shadow
+from spacenote.core.modules.migration.models import MigrationJobType
+from spacenote.errors import ValidationError
+
+# Field types whose stored values are converted losslessly on every options change.
+# SELECT values are only replaced or cleared on explicit request (see validate_select_migration).
+COERCE_FIELD_TYPES = {FieldType.NUMERIC}
+
+
+def build_job_query(job_type: MigrationJobType, space_slug: str, field_name: str, after_number: int = 0) -> dict[str, Any]:
+    """Query for notes of a space that a job still has to look at, after the given note number."""
+    path = f"fields.{field_name}"
+    query: dict[str, Any] = {"space_slug": space_slug, "number": {"$gt": after_number}}
+    match job_type:
+        case MigrationJobType.UNSET_FIELD:
+            query[path] = {"$exists": True}
+        case MigrationJobType.BACKFILL_DEFAULT:
+            # Matches both null and missing values
+            query[path] = None
+        case MigrationJobType.COERCE_VALUES:
+            query[path] = {"$ne": None}
+    return query
+
+
+def build_unset_operation(doc: dict[str, Any], field_name: str) -> UpdateOne:
+    """Remove a field's value (and its shadow) from a note."""
+    return UpdateOne({"_id": doc["_id"]}, {"$unset": {f"fields.{field_name}": "", get_shadow_path(field_name): ""}})
+
+
+def build_backfill_operation(doc: dict[str, Any], field: SpaceField, default: FieldValueType) -> UpdateOne:
+    """Set an empty value to the default. Skipped by MongoDB if the note got a value meanwhile."""
+    path = f"fields.{field.name}"
+    update: dict[str, Any] = {path: default}
+    if has_shadow(field) and (shadow := build_shadow_value(default)) is not None:
+        update[get_shadow_path(field.name)] = shadow
+    return UpdateOne({"_id": doc["_id"], path: None}, {"$set": update})
+
+
+def build_coerce_operation(
+    doc: dict[str, Any],
+    field: SpaceField,
+    value_map: Mapping[str, str | None] | None = None,
+    *,
+    clear_removed: bool = False,
+) -> UpdateOne | None:
+    """Convert a note's value to the field's options, or None if it already conforms.
+
+    The update only applies while the note still holds the value it was computed from.
+    """
+    value = doc.get("fields", {}).get(field.name)
+    coerced = coerce_value(field, value, value_map, clear_removed=clear_removed)
+    if type(coerced) is type(value) and coerced == value:
+        return None
+    path = f"fields.{field.name}"
+    update: dict[str, Any] = {"$set": {path: coerced}}
+    if has_shadow(field):
+        if (shadow := build_shadow_value(coerced)) is None:
+            update["$unset"] = {get_shadow_path(field.name): ""}
+        else:
+            update["$set"][get_shadow_path(field.name)] = shadow
+    return UpdateOne({"_id": doc["_id"], path: value}, update)
+
+
+def coerce_value(
+    field: SpaceField,
+    value: FieldValueType,
+    value_map: Mapping[str, str | None] | None = None,
+    *,
+    clear_removed: bool = False,
+) -> FieldValueType:
+    """Bring a stored value in line with the field's current options.
+
+    SELECT values are only changed on request: values in value_map are replaced, and with
+    clear_removed, values no longer allowed are cleared. NUMERIC values are converted to the
+    current kind when that loses nothing (a non-integral number stays as is under "int").
+    Other values are returned unchanged.
+    """
+    if isinstance(field.options, SelectFieldOptions):
+        if isinstance(value, str) and value_map is not None and value in value_map:
+            return value_map[value]
+        if clear_removed and value not in field.options.values:
+            return None
+        return value
+    if (
+        isinstance(field.options, NumericFieldOptions)
+        and isinstance(value, int | float | Decimal)
+        and not isinstance(value, bool)
+    ):
+        return _convert_number(value, field.options.kind)
+    return value
+
+
+def _convert_number(value: float | Decimal, kind: str) -> int | float | Decimal:
+    """Convert a number to a numeric field kind, keeping it unchanged if conversion would lose precision."""
+    match kind:
+        case "int":
+            if isinstance(value, int):
+                return value
+            if isinstance(value, Decimal):
+                return int(value) if value.is_finite() and value == value.to_integral_value() else value
+            return int(value) if value.is_integer() else value
+        case "float":
+            return value if isinstance(value, float) else float(value)
+        case "decimal":
+            if isinstance(value, Decimal):
+                return value
+            return Decimal(value) if isinstance(value, int) else Decimal(str(value))
+    return value
+
+
+def validate_select_migration(
+    field: SpaceField, value_map: Mapping[str, str | None] | None, *, clear_removed: bool, has_static_default: bool
+) -> None:
+    """Check a requested SELECT value migration against the updated field.
+
+    Mapped values must be allowed by the field. A required field is never cleared
+    unless it has a static default to backfill the cleared values with.
+    """
+    if value_map is None and not clear_removed:
+        return
+    if not isinstance(field.options, SelectFieldOptions):
+        raise ValidationError("value_map and clear_removed_values apply to SELECT fields only")
+    for old_value, new_value in (value_map or {}).items():
+        if new_value is not None and new_value not in field.options.values:
+            raise ValidationError(f"Cannot map '{old_value}' to '{new_value}': not an allowed value")
+    clears = clear_removed or any(v is None for v in (value_map or {}).values())
+    if clears and field.required and not has_static_default:
+        raise ValidationError(f"Required field '{field.name}' needs a static default to clear values on existing notes")
@@ -0,0 +1,341 @@
+import asyncio
+import contextlib
+from collections.abc import Mapping
+from functools import cached_property
+from typing import Any
+
+import structlog
+from pymongo import ReturnDocument, UpdateOne
+from pymongo.asynchronous.collection import AsyncCollection
+
+from spacenote.core.db import Collection
+from spacenote.core.modules.counter.models import CounterType
+from spacenote.core.modules.field.models import FieldType, SpaceField
+from spacenote.core.modules.field.schema import is_dynamic_default
+from spacenote.core.modules.migration.models import MigrationJob, MigrationJobStatus, MigrationJobType
+from spacenote.core.modules.migration.operations import (
+    COERCE_FIELD_TYPES,
+    build_backfill_operation,
+    build_coerce_operation,
+    build_job_query,
+    build_unset_operation,
+    validate_select_migration,
+)
+from spacenote.core.pagination import PaginationResult
+from spacenote.core.service import Service
+from spacenote.errors import NotFoundError, ValidationError
+from spacenote.utils import now
+
+logger = structlog.get_logger(__name__)
+
+# Notes per bulk_write
+MIGRATION_BATCH_SIZE = 500
+
+# Pause between batches (seconds), leaves room for regular traffic on large spaces
+MIGRATION_BATCH_PAUSE = 0.2
+
+# Polling interval when no job is pending (seconds); new jobs of this process wake the worker immediately
+MIGRATION_POLL_INTERVAL = 10
+
+
+class MigrationService(Service):
+    """Applies field definition changes to existing notes in the background."""
+
+    def __init__(self) -> None:
+        self._worker_task: asyncio.Task[None] | None = None
+        self._wakeup = asyncio.Event()
+
+    @cached_property
+    def _collection(self) -> AsyncCollection[dict[str, Any]]:
+        return self.database.get_collection(Collection.MIGRATION_JOBS)
+
+    async def on_start(self) -> None:
+        """Create indexes."""
+        await self._collection.create_index([("space_slug", 1), ("number", 1)], unique=True)
+        await self._collection.create_index([("status", 1), ("created_at", 1)])
+
+    async def on_leader_start(self) -> None:
+        """Requeue jobs interrupted by a shutdown or a leadership change and start the worker.
+
+        Jobs held by a previous leader are requeued: that process no longer owns the lease and
+        stops before its next batch (see _process_job). This process's own jobs are requeued by on_stop.
+        """
+        if self._worker_task is not None:
+            return
+        result = await self._collection.update_many(
+            {"status": MigrationJobStatus.RUNNING, "lease_holder": {"$ne": self.core.services.cluster.process_id}},
+            {"$set": {"status": MigrationJobStatus.PENDING, "lease_holder": None}},
+        )
+        if result.modified_count:
+            logger.info("migration_jobs_resumed", count=result.modified_count)
+        self._worker_task = asyncio.create_task(self._run_worker())
+
+    async def on_leader_stop(self) -> None:
+        """Stop the worker; the new leader resumes the job in progress."""
+        await self.on_stop()
+
+    async def on_stop(self) -> None:
+        """Stop the worker task. A job in progress is requeued and resumes from its last batch."""
+        if self._worker_task is not None:
+            self._worker_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._worker_task
+            self._worker_task = None
+            with contextlib.suppress(Exception):
+                await self._collection.update_many(
+                    {"status": MigrationJobStatus.RUNNING, "lease_holder": self.core.services.cluster.process_id},
+                    {"$set": {"status": MigrationJobStatus.PENDING, "lease_holder": None}},
+                )
+
+    async def enqueue_field_removal(self, space_slugs: list[str], field_name: str) -> None:
+        """Queue removal of a removed field's values from notes."""
+        await self.enqueue(space_slugs, field_name, MigrationJobType.UNSET_FIELD)
+
+    def validate_field_update(
+        self, new_field: SpaceField, value_map: Mapping[str, str | None] | None, *, clear_removed: bool
+    ) -> None:
+        """Check a requested value migration before the field update is stored. Raises ValidationError."""
+        validate_select_migration(
+            new_field, value_map, clear_removed=clear_removed, has_static_default=_has_static_default(new_field)
+        )
+
+    async def enqueue_field_update(
+        self,
+        space_slugs: list[str],
+        old_field: SpaceField,
+        new_field: SpaceField,
+        value_map: Mapping[str, str | None] | None = None,
+        *,
+        clear_removed: bool = False,
+    ) -> None:
+        """Queue the migrations needed to bring existing notes in line with an updated field definition.
+
+        NUMERIC values are coerced on every options change. SELECT values are only replaced
+        (value_map) or cleared (clear_removed) on request, since an unknown value may be a
+        renamed option. Coercion is queued before backfill, so values cleared by coercion
+        get the default.
+        """
+        coerce_select = new_field.type == FieldType.SELECT and (bool(value_map) or clear_removed)
+        if coerce_select:
+            await self.enqueue(
+                space_slugs,
+                new_field.name,
+                MigrationJobType.COERCE_VALUES,
+                value_map=dict(value_map) if value_map else None,
+                clear_removed=clear_removed,
+            )
+        elif new_field.type in COERCE_FIELD_TYPES and new_field.options != old_field.options:
+            await self.enqueue(space_slugs, new_field.name, MigrationJobType.COERCE_VALUES)
+
+        clears_values = coerce_select and (clear_removed or any(v is None for v in (value_map or {}).values()))
+        default_changed = new_field.default != old_field.default
+        if (default_changed or clears_values) and _has_static_default(new_field):
+            await self.enqueue(space_slugs, new_field.name, MigrationJobType.BACKFILL_DEFAULT)
+
+    async def enqueue(
+        self,
+        space_slugs: list[str],
+        field_name: str,
+        job_type: MigrationJobType,
+        *,
+        value_map: dict[str, str | None] | None = None,
+        clear_removed: bool = False,
+    ) -> None:
+        """Queue a migration of a field's values in each of these spaces.
+
+        Jobs read the field definition when they run, so a pending job of the same kind
+        already covers the latest change and no duplicate is queued — unless the job
+        carries its own SELECT value migration.
+        """
+        explicit = value_map is not None or clear_removed
+        for slug in space_slugs:
+            if not explicit:
+                pending = await self._collection.find_one(
+                    {
+                        "space_slug": slug,
+                        "field_name": field_name,
+                        "job_type": job_type,
+                        "status": MigrationJobStatus.PENDING,
+                        "value_map": None,
+                        "clear_removed": {"$ne": True},
+                    }
+                )
+                if pending is not None:
+                    continue
+            number = await self.core.services.counter.get_next_sequence(slug, CounterType.MIGRATION_JOB)
+            job = MigrationJob(
+                number=number,
+                space_slug=slug,
+                field_name=field_name,
+                job_type=job_type,
+                value_map=value_map,
+                clear_removed=clear_removed,
+            )
+            await self._collection.insert_one(job.to_mongo())
+            logger.info("migration_job_queued", space_slug=slug, number=number, field_name=field_name, job_type=job_type)
+        self._wakeup.set()
+
+    async def has_unfinished_unset(self, space_slug: str, field_name: str) -> bool:
+        """Check if values of a removed field may still be present on notes of a space."""
+        doc = await self._collection.find_one(
+            {
+                "space_slug": space_slug,
+                "field_name": field_name,
+                "job_type": MigrationJobType.UNSET_FIELD,
+                "status": {"$ne": MigrationJobStatus.COMPLETED},
+            }
+        )
+        return doc is not None
+
+    async def get_migration_job(self, space_slug: str, number: int) -> MigrationJob:
+        """Get migration job by natural key."""
+        doc = await self._collection.find_one({"space_slug": space_slug, "number": number})
+        if not doc:
+            raise NotFoundError(f"Migration job {space_slug}#{number} not found")
+        return MigrationJob.model_validate(doc)
+
+    async def retry_migration_job(self, space_slug: str, number: int) -> MigrationJob:
+        """Requeue a failed job. It continues after the last note processed before the failure."""
+        job = await self.get_migration_job(space_slug, number)
+        if job.status != MigrationJobStatus.FAILED:
+            raise ValidationError(f"Only failed jobs can be retried; job {space_slug}#{number} is {job.status.value}")
+        await self._update_job(job, {"$set": {"status": MigrationJobStatus.PENDING, "error": None, "finished_at": None}})
+        self._wakeup.set()
+        logger.info("migration_job_retried", space_slug=space_slug, number=number)
+        return await self.get_migration_job(space_slug, number)
+
+    async def list_migration_jobs(
+        self, space_slug: str, status: MigrationJobStatus | None = None, limit: int = 50, offset: int = 0
+    ) -> PaginationResult[MigrationJob]:
+        """List migration jobs of a space, newest first."""
+        query: dict[str, Any] = {"space_slug": space_slug}
+        if status:
+            query["status"] = status
+        total = await self._collection.count_documents(query)
+        cursor = self._collection.find(query).sort("number", -1).skip(offset).limit(limit)
+        items = await MigrationJob.list_cursor(cursor)
+        return PaginationResult(items=items, total=total, limit=limit, offset=offset)
+
+    async def delete_migration_jobs_by_space(self, space_slug: str) -> int:
+        """Delete all migration jobs for a space."""
+        result = await self._collection.delete_many({"space_slug": space_slug})
+        return result.deleted_count
+
+    # --- Worker ---
+
+    async def _run_worker(self) -> None:
+        """Background worker loop: processes pending jobs one at a time, oldest first."""
+        while True:
+            job = await self._claim_pending_job()
+            if job is None:
+                self._wakeup.clear()
+                with contextlib.suppress(TimeoutError):
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=MIGRATION_POLL_INTERVAL)
+                continue
+
+            try:
+                await self._process_job(job)
+            except Exception as e:
+                logger.exception("migration_job_failed", space_slug=job.space_slug, number=job.number)
+                with contextlib.suppress(Exception):
+                    await self._update_job(
+                        job, {"$set": {"status": MigrationJobStatus.FAILED, "error": str(e), "finished_at": now()}}
+                    )
+
+    async def _claim_pending_job(self) -> MigrationJob | None:
+        """Mark the oldest pending job running and return it."""
+        doc = await self._collection.find_one_and_update(
+            {"status": MigrationJobStatus.PENDING},
+            {
+                "$set": {
+                    "status": MigrationJobStatus.RUNNING,
+                    "lease_holder": self.core.services.cluster.process_id,
+                    "started_at": now(),
+                }
+            },
+            sort=[("created_at", 1), ("_id", 1)],
+            return_document=ReturnDocument.AFTER,
+        )
+        return MigrationJob.model_validate(doc) if doc else None
+
+    async def _process_job(self, job: MigrationJob) -> None:
+        """Apply a job to its space's notes in throttled batches, storing progress after each batch."""
+        notes = self.database.get_collection(Collection.NOTES)
+        space_service = self.core.services.space
+        if job.total is None:
+            total = await notes.count_documents(build_job_query(job.job_type, job.space_slug, job.field_name))
+            job.total = total
+            await self._update_job(job, {"$set": {"total": total}})
+
+        while True:
+            # Fencing: stop if leadership moved to another process, which requeues the job
+            if not await self.core.services.cluster.holds_lease():
+                logger.warning("migration_job_fenced", space_slug=job.space_slug, number=job.number)
+                return
+            # Re-read every batch: the space may have been renamed or deleted, or the field changed again
+            current = await self._collection.find_one({"_id": job.id, "lease_holder": job.lease_holder}, {"space_slug": 1})
+            if current is None or not space_service.has_space(current["space_slug"]):
+                return
+            job.space_slug = current["space_slug"]
+            field = space_service.get_space(job.space_slug).get_field(job.field_name)
+            default = self.core.services.field.get_schema(job.space_slug).static_defaults.get(job.field_name)
+            # A required field is only cleared when a default replaces the cleared values
+            can_clear = field is not None and (not field.required or default is not None)
+            value_map = job.value_map if can_clear or job.value_map is None else _without_clears(job.value_map)
+
+            query = build_job_query(job.job_type, job.space_slug, job.field_name, job.last_number)
+            projection = {"number": 1, f"fields.{job.field_name}": 1}
+            docs = await notes.find(query, projection).sort("number", 1).limit(MIGRATION_BATCH_SIZE).to_list()
+            if not docs:
+                break
+
+            operations: list[UpdateOne] = []
+            for doc in docs:
+                operation: UpdateOne | None = None
+                match job.job_type:
+                    case MigrationJobType.UNSET_FIELD if field is None:
+                        operation = build_unset_operation(doc, job.field_name)
+                    case MigrationJobType.BACKFILL_DEFAULT if field is not None and default is not None:
+                        operation = build_backfill_operation(doc, field, default)
+                    case MigrationJobType.COERCE_VALUES if field is not None:
+                        operation = build_coerce_operation(doc, field, value_map, clear_removed=job.clear_removed and can_clear)
+                if operation is not None:
+                    operations.append(operation)
+
+            modified = (await notes.bulk_write(operations, ordered=False)).modified_count if operations else 0
+            job.last_number = docs[-1]["number"]
+            job.processed += len(docs)
+            job.modified += modified
+            await self._update_job(
+                job, {"$set": {"last_number": job.last_number, "processed": job.processed, "modified": job.modified}}
+            )
+            if modified:
+                self.core.services.note.invalidate_caches(job.space_slug)
+            await asyncio.sleep(MIGRATION_BATCH_PAUSE)
+
+        await self._update_job(job, {"$set": {"status": MigrationJobStatus.COMPLETED, "finished_at": now()}})
+        if job.modified and space_service.has_space(job.space_slug):
+            # Titles may show the migrated field
+            self.core.services.note.schedule_title_refresh([job.space_slug])
+        logger.info(
+            "migration_job_completed",
+            space_slug=job.space_slug,
+            number=job.number,
+            job_type=job.job_type,
+            processed=job.processed,
+            modified=job.modified,
+        )
+
+    async def _update_job(self, job: MigrationJob, update: dict[str, Any]) -> None:
+        """Update a job claimed by this process (no-op once another process has claimed it)."""
+        await self._collection.update_one({"_id": job.id, "lease_holder": job.lease_holder}, update)
+
+
+def _has_static_default(field: SpaceField) -> bool:
+    """Whether empty values of the field can be backfilled with a fixed default."""
+    return field.default is not None and not is_dynamic_default(field)
+
+
+def _without_clears(value_map: dict[str, str | None]) -> dict[str, str | None]:
+    """Value map without the entries that clear a value."""
+    return {old: new for old, new in value_map.items() if new is not None}
@@ -1,10 +1,10 @@
 from datetime import datetime
-from typing import Any
 
 from pydantic import Field
 
 from spacenote.core.db import MongoModel
 from spacenote.core.modules.field.models import FieldValueType
+from spacenote.core.schema import OpenAPIModel
 from spacenote.utils import now
 
 
@@ -19,10 +19,13 @@ class Note(MongoModel):
     commented_at: datetime | None = Field(default=None, description="Last comment timestamp")
     activity_at: datetime = Field(default_factory=now, description="Updated on: field edit, comment create/edit/delete")
     fields: dict[str, FieldValueType] = Field(..., description="Values for space-defined fields")
-    title: str = Field(default="", description="Computed from Space.templates['note:title'], not stored in MongoDB")
+    title: str = Field(
+        default="", description="Rendered from Space.templates['note:title'] on every write; stored, so sortable and filterable"
+    )
 
-    def to_mongo(self) -> dict[str, Any]:
-        """Exclude computed title field from MongoDB storage."""
-        data = super().to_mongo()
-        data.pop("title", None)
-        return data
+
+class FacetBucket(OpenAPIModel):
+    """Number of notes having one value of a field."""
+
+    value: str | None = Field(..., description="Field value (null counts notes without a value)")
+    count: int = Field(..., description="Number of matching notes with this value", ge=1)
@@ -1,34 +1,142 @@
+import asyncio
+import contextlib
+from collections.abc import AsyncIterator, Iterator
 from functools import cached_property
 from typing import Any
 
 import structlog
 from pydantic import BaseModel
+from pymongo import ReturnDocument, UpdateOne
 from pymongo.asynchronous.collection import AsyncCollection
+from pymongo.asynchronous.cursor import AsyncCursor
+from pymongo.errors import OperationFailure
 
+from spacenote.core.cache import SpaceVersionedCache
 from spacenote.core.db import Collection
+from spacenote.core.modules.cluster.models import CacheScope
 from spacenote.core.modules.counter.models import CounterType
-from spacenote.core.modules.field.models import FieldType, FieldValueType
+from spacenote.core.modules.field.models import FieldType, FieldValueType, StringFieldOptions
+from spacenote.core.modules.field.normalize import (
+    SHADOW_ROOT,
+    build_shadow_value,
+    build_shadow_values,
+    get_shadow_path,
+    has_shadow,
+)
 from spacenote.core.modules.field.validators import validate_transfer_schema_compatibility
-from spacenote.core.modules.note.models import Note
-from spacenote.core.pagination import PaginationResult
+from spacenote.core.modules.filter.facets import build_facet_pipeline, get_facet_key, validate_facet_fields
+from spacenote.core.modules.filter.models import ALL_FILTER_NAME
+from spacenote.core.modules.filter.query_builder import build_keyset_query, get_sort_values, is_text_search
+from spacenote.core.modules.note.models import FacetBucket, Note
+from spacenote.core.modules.space.models import Space
+from spacenote.core.pagination import (
+    CursorPaginationResult,
+    TotalMode,
+    count_documents_cached,
+    decode_cursor,
+    encode_cursor,
+)
 from spacenote.core.service import Service
 from spacenote.errors import NotFoundError, ValidationError
 from spacenote.utils import now
 
 logger = structlog.get_logger(__name__)
 
+# Progress document of the one-time shadow value backfill in the backfills collection
+SHADOW_BACKFILL_ID = "shadow_fields"
+
+# Note document attributes always fetched by list projections
+_SYSTEM_PATHS = ("space_slug", "number", "author", "created_at", "edited_at", "commented_at", "activity_at", "title")
+
+# Name of the full-text index backing the search operator
+TEXT_INDEX_NAME = "text_search"
+
+# MongoDB error code of a $text query without a text index
+_INDEX_NOT_FOUND = 27
+
+# Maximum note numbers per batch fetch
+MAX_BATCH_NOTES = 300
+
+# Notes per chunk of a streamed listing (titles are rendered once per chunk)
+STREAM_CHUNK_SIZE = 200
+
+# STRING kinds holding long text that can be shortened to an excerpt
+_LONG_TEXT_KINDS = {"text", "markdown", "json", "toml", "yaml"}
+
 
 class NoteService(Service):
     """Manages notes with custom fields in spaces."""
 
+    def __init__(self) -> None:
+        # Total counts per (space, filter, adhoc query, user), invalidated by note writes
+        self._count_cache: SpaceVersionedCache[int] = SpaceVersionedCache()
+        # Facet counts per (space, filter, adhoc query, user, fields), invalidated by note writes
+        self._facet_cache: SpaceVersionedCache[dict[str, list[FacetBucket]]] = SpaceVersionedCache()
+        self._backfill_task: asyncio.Task[None] | None = None
+        # Spaces whose notes all have shadow values; None once the backfill has covered every space
+        self._shadow_backfilled: set[str] | None = set()
+        # Running title re-renders per space, started on note:title template changes
+        self._title_tasks: dict[str, asyncio.Task[None]] = {}
+
     @cached_property
     def _collection(self) -> AsyncCollection[dict[str, Any]]:
         return self.database.get_collection(Collection.NOTES)
 
+    @cached_property
+    def _backfills_collection(self) -> AsyncCollection[dict[str, Any]]:
+        return self.database.get_collection(Collection.BACKFILLS)
+
     async def on_start(self) -> None:
         """Create indexes for space/number lookup and sorting."""
         await self._collection.create_index([("space_slug", 1), ("number", 1)], unique=True)
         await self._collection.create_index([("space_slug", 1)])
+        await self.load_backfill_state()
+
+    async def on_leader_start(self) -> None:
+        """Start backfills of derived note data (once per deployment, in the leader process)."""
+        if self._backfill_task is None or self._backfill_task.done():
+            self._backfill_task = asyncio.create_task(self._run_backfills())
+
+    async def on_stop(self) -> None:
+        """Stop background backfills and title re-renders that are still running."""
+        tasks = [*self._title_tasks.values()]
+        if self._backfill_task is not None:
+            tasks.append(self._backfill_task)
+        for task in tasks:
+            task.cancel()
+        for task in tasks:
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+
+    async def list_index_names(self) -> list[str]:
+        """List names of all indexes on the notes collection."""
+        return [index["name"] async for index in await self._collection.list_indexes()]
+
+    async def create_index(self, keys: list[tuple[str, int]], name: str) -> None:
+        """Create a named index on the notes collection (no-op if it already exists)."""
+        await self._collection.create_index(keys, name=name)
+
+    async def drop_index(self, name: str) -> None:
+        """Drop a named index from the notes collection."""
+        await self._collection.drop_index(name)
+
+    async def sync_text_index(self, paths: list[str]) -> bool:
+        """Make the full-text index cover exactly the given field paths; return True if it was rebuilt.
+
+        MongoDB allows one text index per collection and cannot alter it, so a changed
+        path set means drop and recreate; searches fail with a ValidationError meanwhile.
+        Language "none" disables stemming and stop words, so notes in any language are
+        tokenized the same way.
+        """
+        existing = (await self._collection.index_information()).get(TEXT_INDEX_NAME)
+        if existing is not None and sorted(existing.get("weights", {})) == paths:
+            return False
+        if existing is not None:
+            await self._collection.drop_index(TEXT_INDEX_NAME)
+        if paths:
+            keys: list[tuple[str, int | str]] = [("space_slug", 1), *((path, "text") for path in paths)]
+            await self._collection.create_index(keys, name=TEXT_INDEX_NAME, default_language="none")
+        return True
 
     async def list_notes(
         self,
@@ -38,34 +146,147 @@ class NoteService(Service):
         adhoc_query: str | None = None,
         limit: int = 50,
         offset: int = 0,
-    ) -> PaginationResult[Note]:
+        cursor: str | None = None,
+        total_mode: TotalMode = TotalMode.EXACT,
+        columns_only: bool = False,
+        excerpt_length: int | None = None,
+    ) -> CursorPaginationResult[Note]:
         """List paginated notes in space.
 
+        Supports both offset and keyset pagination. A `cursor` taken from the previous
+        page's `next_cursor` seeks directly past the last returned note using the filter's
+        sort keys, so deep pages cost the same as the first one.
+
         Args:
             filter_name: Filter to apply. If None, uses Space.default_filter.
+            cursor: Opaque keyset cursor. Cannot be combined with a non-zero offset.
+            total_mode: How to compute `total`; counts are cached until the next write to the space.
+            columns_only: Fetch only the filter's columns and sort fields; other custom fields
+                are absent from `Note.fields`.
+            excerpt_length: Truncate long text STRING values (text, markdown, json, ...) to this
+                many characters on the database side. Fields the list is sorted by are not truncated.
         """
-        if filter_name is None:
-            space = self.core.services.space.get_space(space_slug)
-            filter_name = space.default_filter
-            # Fallback if default_filter references a deleted filter
-            if not space.get_filter(filter_name):
-                filter_name = "all"
+        if cursor is not None and offset:
+            raise ValidationError("Cannot combine cursor with offset")
 
-        query, sort_spec = self.core.services.filter.build_query(space_slug, filter_name, current_user, adhoc_query)
+        space = self.core.services.space.get_space(space_slug)
+        filter_name = self._resolve_filter_name(space, filter_name)
 
-        total = await self._collection.count_documents(query)
-        cursor = self._collection.find(query).sort(sort_spec).skip(offset).limit(limit)
-        docs = await cursor.to_list()
+        query, sort_spec = self.core.services.filter.build_query(space_slug, filter_name, current_user, adhoc_query)
+        text_search = is_text_search(query)
+        if text_search and cursor is not None:
+            raise ValidationError("Cursor pagination is not supported for full-text search, use offset")
+
+        page_query = query
+        if cursor is not None:
+            page_query = {"$and": [query, build_keyset_query(sort_spec, decode_cursor(cursor, sort_spec))]}
+
+        # Fetch one extra document to know whether a next page exists
+        projection = self._build_list_projection(space, filter_name, sort_spec, columns_only, excerpt_length)
+        # Full-text matches are ordered by relevance first, then by the filter's sort
+        find_sort: list[tuple[str, Any]] = [("score", {"$meta": "textScore"}), *sort_spec] if text_search else list(sort_spec)
+        with _text_index_required():
+            total = await count_documents_cached(
+                self._collection,
+                query,
+                self._count_cache,
+                space_slug,
+                (filter_name, adhoc_query, current_user),
+                total_mode,
+            )
+            find_cursor = self._collection.find(page_query, projection).sort(find_sort).skip(offset).limit(limit + 1)
+            docs = await find_cursor.to_list()
+        next_cursor = None
+        if len(docs) > limit:
+            docs = docs[:limit]
+            if not text_search:
+                next_cursor = encode_cursor(sort_spec, get_sort_values(docs[-1], sort_spec))
+
+        if projection is not None:
+            for doc in docs:
+                doc.setdefault("fields", {})
         items = [Note.model_validate(doc) for doc in docs]
-        self._set_titles(items)
+        self._ensure_titles(items)
+
+        return CursorPaginationResult(items=items, total=total, limit=limit, offset=offset, next_cursor=next_cursor)
 
-        return PaginationResult(items=items, total=total, limit=limit, offset=offset)
+    async def get_note_facets(
+        self,
+        space_slug: str,
+        current_user: str,
+        field_names: list[str],
+        filter_name: str | None = None,
+        adhoc_query: str | None = None,
+    ) -> dict[str, list[FacetBucket]]:
+        """Count notes per value of SELECT/TAGS/USER fields among notes matching a filter.
+
+        All fields are counted in one $facet aggregation. Results are cached until the
+        next note write to the space.
+
+        Args:
+            field_names: Fields in filter syntax (note.author, note.fields.{name}).
+            filter_name: Filter to apply. If None, uses Space.default_filter.
+        """
+        space = self.core.services.space.get_space(space_slug)
+        field_names = validate_facet_fields(space, field_names)
+        filter_name = self._resolve_filter_name(space, filter_name)
+
+        cache_key = (filter_name, adhoc_query, current_user, tuple(field_names))
+        facets = self._facet_cache.get(space_slug, cache_key)
+        if facets is not None:
+            return facets
+
+        version = self._facet_cache.get_version(space_slug)
+        query, _ = self.core.services.filter.build_query(space_slug, filter_name, current_user, adhoc_query)
+        with _text_index_required():
+            docs = await (await self._collection.aggregate(build_facet_pipeline(space, query, field_names))).to_list()
+        result = docs[0] if docs else {}
+        facets = {
+            name: [FacetBucket(value=bucket["_id"], count=bucket["count"]) for bucket in result.get(get_facet_key(index), [])]
+            for index, name in enumerate(field_names)
+        }
+        self._facet_cache.set(space_slug, cache_key, facets, version)
+        return facets
+
+    def stream_notes(
+        self, space_slug: str, current_user: str, filter_name: str | None = None, adhoc_query: str | None = None
+    ) -> AsyncIterator[list[Note]]:
+        """Iterate over all notes matching a filter in chunks, straight from the database cursor.
+
+        The filter and query are validated before this returns, so errors surface before
+        iteration starts. Memory use is bounded by the chunk size, whatever the number of notes.
+        """
+        space = self.core.services.space.get_space(space_slug)
+        filter_name = self._resolve_filter_name(space, filter_name)
+        query, sort_spec = self.core.services.filter.build_query(space_slug, filter_name, current_user, adhoc_query)
+        find_sort: list[tuple[str, Any]] = (
+            [("score", {"$meta": "textScore"}), *sort_spec] if is_text_search(query) else list(sort_spec)
+        )
+        cursor = self._collection.find(query).sort(find_sort).batch_size(STREAM_CHUNK_SIZE)
+        return self._iter_note_chunks(cursor)
+
+    async def _iter_note_chunks(self, cursor: AsyncCursor[dict[str, Any]]) -> AsyncIterator[list[Note]]:
+        """Yield notes from a cursor in chunks of STREAM_CHUNK_SIZE."""
+        try:
+            chunk: list[Note] = []
+            with _text_index_required():
+                async for doc in cursor:
+                    chunk.append(Note.model_validate(doc))
+                    if len(chunk) >= STREAM_CHUNK_SIZE:
+                        self._ensure_titles(chunk)
+                        yield chunk
+                        chunk = []
+            if chunk:
+                self._ensure_titles(chunk)
+                yield chunk
+        finally:
+            await cursor.close()
 
     async def list_all_notes(self, space_slug: str) -> list[Note]:
         """List all notes in space without pagination."""
         cursor = self._collection.find({"space_slug": space_slug}).sort("number", 1)
         notes = await Note.list_cursor(cursor)
-        self._set_titles(notes)
+        self._ensure_titles(notes)
         return notes
 
     async def get_note(self, space_slug: str, number: int) -> Note:
@@ -74,9 +295,26 @@ class NoteService(Service):
         if not doc:
             raise NotFoundError(f"Note not found: space_slug={space_slug}, number={number}")
         note = Note.model_validate(doc)
-        self._set_title(note)
+        self._ensure_titles([note])
         return note
 
+    async def get_notes_by_numbers(self, space_slug: str, numbers: list[int]) -> list[Note]:
+        """Get several notes of a space in one query, in the order of `numbers`.
+
+        Numbers without a note are skipped; duplicates are returned once.
+        """
+        numbers = list(dict.fromkeys(numbers))
+        if len(numbers) > MAX_BATCH_NOTES:
+            raise ValidationError(f"Too many note numbers (max {MAX_BATCH_NOTES})")
+        if not numbers:
+            return []
+
+        cursor = self._collection.find({"space_slug": space_slug, "number": {"$in": numbers}})
+        notes_by_number = {note.number: note for note in await Note.list_cursor(cursor)}
+        notes = [notes_by_number[n] for n in numbers if n in notes_by_number]
+        self._ensure_titles(notes)
+        return notes
+
     async def create_note(self, space_slug: str, author: str, raw_fields: dict[str, str]) -> Note:
         """Create note from raw fields."""
         logger.debug("create_note_request", space_slug=space_slug, raw_fields=raw_fields)
@@ -96,8 +334,8 @@ class NoteService(Service):
 
         note = Note(space_slug=space_slug, number=next_number, author=author, fields=parsed_fields)
 
-        await self._collection.insert_one(note.to_mongo())
-        self._set_title(note)
+        await self._collection.insert_one(self._to_document(space, note))
+        self.invalidate_caches(space_slug)
         logger.debug("note_created", space_slug=space_slug, number=next_number, author=author)
         await self.core.services.telegram.notify_activity_note_created(note)
         await self.core.services.telegram.notify_mirror_create(note)
@@ -118,12 +356,32 @@ class NoteService(Service):
             space_slug, raw_fields, current_fields=old_note.fields, current_user=current_user, partial=True
         )
 
+        space = self.core.services.space.get_space(space_slug)
         timestamp = now()
         update_doc: dict[str, Any] = {"edited_at": timestamp, "activity_at": timestamp}
+        changed_fields = [name for name, value in parsed_fields.items() if old_note.fields.get(name) != value]
+        title_deps = self.core.services.template.get_template_dependencies(space, "note:title")
+        if title_deps.reads_note_changes(("edited_at", "activity_at"), changed_fields):
+            updated_note = old_note.model_copy(
+                update={"fields": {**old_note.fields, **parsed_fields}, "edited_at": timestamp, "activity_at": timestamp}
+            )
+            update_doc["title"] = self.core.services.template.render_note_title(space, updated_note)
+        unset_doc: dict[str, Any] = {}
         for field_name, field_value in parsed_fields.items():
             update_doc[f"fields.{field_name}"] = field_value.model_dump() if isinstance(field_value, BaseModel) else field_value
-
-        await self._collection.update_one({"space_slug": space_slug, "number": number}, {"$set": update_doc})
+            field = space.get_field(field_name)
+            if field is not None and has_shadow(field):
+                shadow = build_shadow_value(field_value)
+                if shadow is None:
+                    unset_doc[get_shadow_path(field_name)] = ""
+                else:
+                    update_doc[get_shadow_path(field_name)] = shadow
+
+        update: dict[str, Any] = {"$set": update_doc}
+        if unset_doc:
+            update["$unset"] = unset_doc
+        await self._collection.update_one({"space_slug": space_slug, "number": number}, update)
+        self.invalidate_caches(space_slug)
 
         logger.debug("note_updated", space_slug=space_slug, number=number, updated_fields=list(parsed_fields.keys()))
         note = await self.get_note(space_slug, number)
@@ -134,9 +392,12 @@ class NoteService(Service):
             if old_note.fields.get(name) != note.fields.get(name)
         }
 
+        changed_attributes = ["edited_at", "activity_at"]
+        if note.title != old_note.title:
+            changed_attributes.append("title")
         if not skip_activity_notification:
-            await self.core.services.telegram.notify_activity_note_updated(note, changes, current_user)
-        await self.core.services.telegram.notify_mirror_update(note)
+            await self.core.services.telegram.notify_activity_note_updated(note, changes, current_user, changed_attributes)
+        await self.core.services.telegram.notify_mirror_update(note, changed_attributes, list(changes))
 
         return note, changes
 
@@ -146,11 +407,30 @@ class NoteService(Service):
         if commented:
             update_doc["commented_at"] = update_doc["activity_at"]
 
-        await self._collection.update_one({"space_slug": space_slug, "number": number}, {"$set": update_doc})
+        space = self.core.services.space.get_space(space_slug)
+        title_deps = self.core.services.template.get_template_dependencies(space, "note:title")
+        if not title_deps.reads_note_changes(update_doc, ()):
+            await self._collection.update_one({"space_slug": space_slug, "number": number}, {"$set": update_doc})
+            self.invalidate_caches(space_slug)
+            return
+
+        # The title template shows activity timestamps: re-render it with the new values
+        doc = await self._collection.find_one_and_update(
+            {"space_slug": space_slug, "number": number}, {"$set": update_doc}, return_document=ReturnDocument.AFTER
+        )
+        self.invalidate_caches(space_slug)
+        if doc is not None:
+            note = Note.model_validate(doc)
+            title = self.core.services.template.render_note_title(space, note)
+            if title != note.title:
+                await self._collection.update_one(
+                    {"_id": doc["_id"], "activity_at": note.activity_at}, {"$set": {"title": title}}
+                )
 
     async def delete_notes_by_space(self, space_slug: str) -> int:
         """Delete all notes in a space and return count of deleted notes."""
         result = await self._collection.delete_many({"space_slug": space_slug})
+        self.invalidate_caches(space_slug)
         return result.deleted_count
 
     async def import_notes(self, notes: list[Note]) -> int:
@@ -158,7 +438,11 @@ class NoteService(Service):
         if not notes:
             return 0
 
-        await self._collection.insert_many([n.to_mongo() for n in notes])
+        await self._collection.insert_many(
+            [self._to_document(self.core.services.space.get_space(n.space_slug), n) for n in notes]
+        )
+        for space_slug in {n.space_slug for n in notes}:
+            self.invalidate_caches(space_slug)
         return len(notes)
 
     async def transfer_note(self, source_slug: str, note_number: int, target_slug: str) -> Note:
@@ -192,11 +476,11 @@ class NoteService(Service):
         await self.core.services.comment.transfer_note_comments(source_slug, note_number, target_slug, new_number)
 
         # Insert new note
-        await self._collection.insert_one(new_note.to_mongo())
+        await self._collection.insert_one(self._to_document(target_space, new_note))
+        self.invalidate_caches(target_slug)
 
         # Update Telegram mirrors
         await self.core.services.telegram.notify_mirror_delete(source_slug, note_number)
-        self._set_title(new_note)
         await self.core.services.telegram.notify_mirror_create(new_note)
 
         # Delete source note and related data
@@ -204,22 +488,237 @@ class NoteService(Service):
         await self.core.services.attachment.delete_attachments_by_note(source_slug, note_number)
         self.core.services.image.delete_images_by_note(source_slug, note_number)
         await self._collection.delete_one({"space_slug": source_slug, "number": note_number})
+        self.invalidate_caches(source_slug)
         await self.core.services.counter.delete_counters_by_note(source_slug, note_number)
         logger.info("note_transferred", source=f"{source_slug}#{note_number}", target=f"{target_slug}#{new_number}")
         return new_note
 
-    def _set_title(self, note: Note) -> None:
-        """Compute and set note title from template."""
-        space = self.core.services.space.get_space(note.space_slug)
-        note.title = self.core.services.template.render_note_title(space, note)
+    def has_shadow_values(self, space_slug: str) -> bool:
+        """Whether every note of a space has its shadow values, so filters may match on them."""
+        return self._shadow_backfilled is None or space_slug in self._shadow_backfilled
 
-    def _set_titles(self, notes: list[Note]) -> None:
-        """Compute and set titles for multiple notes. All notes must be from the same space."""
-        if not notes:
+    async def load_backfill_state(self) -> None:
+        """Read shadow value backfill progress written by the leader (no-op once complete)."""
+        if self._shadow_backfilled is None:
             return
-        space_slug = notes[0].space_slug
-        if any(n.space_slug != space_slug for n in notes):
-            raise ValueError("All notes must be from the same space")
+        doc = await self._backfills_collection.find_one({"_id": SHADOW_BACKFILL_ID})
+        if doc is not None:
+            self._set_shadow_backfilled(None if doc.get("complete") else set(doc.get("spaces", [])))
+
+    def _set_shadow_backfilled(self, spaces: set[str] | None) -> None:
+        """Update backfill progress; compiled queries of newly covered spaces are rebuilt to use shadows."""
+        previous = self._shadow_backfilled
+        self._shadow_backfilled = spaces
+        if spaces is None:
+            changed = [space.slug for space in self.core.services.space.list_all_spaces()]
+        else:
+            changed = list(spaces - (previous or set()))
+        for slug in changed:
+            self.core.services.filter.invalidate_query_cache(slug)
+
+    async def backfill_shadow_fields(self, batch_size: int = 500) -> int:
+        """Populate missing normalized shadow values of existing notes. Returns number of updated notes.
+
+        Runs in the background on startup. Until a space is done, filters on it keep matching
+        on the field values themselves; progress is stored in the backfills collection and
+        announced to other processes, and after the first full run the backfill is skipped.
+        """
+        if self._shadow_backfilled is None:
+            return 0
+        updated = 0
+        for space in self.core.services.space.list_all_spaces():
+            shadowed = [f.name for f in space.fields if has_shadow(f)]
+            query = {
+                "space_slug": space.slug,
+                "$or": [{f"fields.{name}": {"$type": "string"}, get_shadow_path(name): {"$exists": False}} for name in shadowed],
+            }
+            while shadowed and (docs := await self._collection.find(query, {"fields": 1}).limit(batch_size).to_list()):
+                operations = [
+                    UpdateOne(
+                        {"_id": doc["_id"]},
+                        {"$set": {get_shadow_path(k): v for k, v in build_shadow_values(space.fields, doc["fields"]).items()}},
+                    )
+                    for doc in docs
+                ]
+                await self._collection.bulk_write(operations, ordered=False)
+                updated += len(operations)
+            await self._backfills_collection.update_one(
+                {"_id": SHADOW_BACKFILL_ID}, {"$addToSet": {"spaces": space.slug}}, upsert=True
+            )
+            self._set_shadow_backfilled({*(self._shadow_backfilled or ()), space.slug})
+            self.core.services.cluster.publish(CacheScope.NOTES, space.slug)
+        # Notes written from now on get shadow values on write, including in spaces created later
+        await self._backfills_collection.update_one({"_id": SHADOW_BACKFILL_ID}, {"$set": {"complete": True}}, upsert=True)
+        self._set_shadow_backfilled(None)
+        self.core.services.cluster.publish(CacheScope.NOTES)
+        if updated:
+            logger.info("note_shadow_fields_backfilled", count=updated)
+        return updated
+
+    async def _run_backfills(self) -> None:
+        """Bring derived data of existing notes up to date (background task started on startup)."""
+        try:
+            await self.backfill_shadow_fields()
+            for space in self.core.services.space.list_all_spaces():
+                await self.refresh_titles(space.slug, only_missing=True)
+        except Exception:
+            logger.exception("note_backfill_failed")
+
+    async def refresh_titles(self, space_slug: str, *, only_missing: bool = False, batch_size: int = 500) -> int:
+        """Re-render stored titles of a space's notes. Returns number of changed notes.
+
+        Only changed titles are written. A note whose activity_at moved while the batch was
+        processed is skipped: the write that moved it already stored an up-to-date title.
+
+        Args:
+            only_missing: Only render notes stored before titles were persisted.
+        """
         space = self.core.services.space.get_space(space_slug)
+        query: dict[str, Any] = {"space_slug": space_slug}
+        if only_missing:
+            query["title"] = {"$exists": False}
+
+        updated = 0
+        batch: list[Note] = []
+        async for doc in self._collection.find(query).batch_size(batch_size):
+            batch.append(Note.model_validate(doc))
+            if len(batch) >= batch_size:
+                updated += await self._write_titles(space, batch, force=only_missing)
+                batch = []
+        if batch:
+            updated += await self._write_titles(space, batch, force=only_missing)
+        if updated:
+            self.invalidate_caches(space_slug)
+            logger.info("note_titles_refreshed", space_slug=space_slug, updated=updated)
+        return updated
+
+    async def _write_titles(self, space: Space, notes: list[Note], *, force: bool) -> int:
+        """Render titles of a batch and store those that changed (all if `force`). Returns modified count."""
+        titles = self.core.services.template.render_note_titles(space, notes)
+        requests = [
+            UpdateOne({"_id": note.id, "activity_at": note.activity_at}, {"$set": {"title": title}})
+            for note, title in zip(notes, titles, strict=True)
+            if force or title != note.title
+        ]
+        if not requests:
+            return 0
+        return (await self._collection.bulk_write(requests, ordered=False)).modified_count
+
+    def schedule_title_refresh(self, space_slugs: list[str]) -> None:
+        """Re-render titles of these spaces in the background (after a note:title template change).
+
+        A refresh still running for a space is restarted, so the latest template wins.
+        """
+        for slug in space_slugs:
+            if (task := self._title_tasks.get(slug)) is not None:
+                task.cancel()
+            self._title_tasks[slug] = asyncio.create_task(self._run_title_refresh(slug))
+
+    async def _run_title_refresh(self, space_slug: str) -> None:
+        """Background wrapper for refresh_titles."""
+        try:
+            await self.refresh_titles(space_slug)
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            logger.exception("note_title_refresh_failed", space_slug=space_slug)
+        finally:
+            if self._title_tasks.get(space_slug) is asyncio.current_task():
+                del self._title_tasks[space_slug]
+
+    def invalidate_caches(self, space_slug: str, *, broadcast: bool = True) -> None:
+        """Mark cached list data (totals, facets) of a space stale. Called after every note write.
+
+        With broadcast, other server processes drop their cached data of the space too.
+        """
+        self._count_cache.invalidate(space_slug)
+        self._facet_cache.invalidate(space_slug)
+        if broadcast:
+            self.core.services.cluster.publish(CacheScope.NOTES, space_slug)
+
+    def _resolve_filter_name(self, space: Space, filter_name: str | None) -> str:
+        """Filter to apply: the requested one, else the space default (falling back to 'all')."""
+        if filter_name is not None:
+            return filter_name
+        # Fallback if default_filter references a deleted filter
+        if not space.get_filter(space.default_filter):
+            return ALL_FILTER_NAME
+        return space.default_filter
+
+    def _build_list_projection(
+        self,
+        space: Space,
+        filter_name: str,
+        sort_spec: list[tuple[str, int]],
+        columns_only: bool,
+        excerpt_length: int | None,
+    ) -> dict[str, Any] | None:
+        """Build find() projection for list_notes, or None to fetch whole documents."""
+        if not columns_only and excerpt_length is None:
+            return None
+
+        if columns_only:
+            # Table columns (B001: filter's own, falling back to the 'all' filter) and sort fields
+            filter_def = space.get_filter(filter_name)
+            columns = filter_def.default_columns if filter_def else []
+            if not columns and (all_filter := space.get_filter(ALL_FILTER_NAME)):
+                columns = all_filter.default_columns
+            names = {c.removeprefix("note.fields.") for c in columns if c.startswith("note.fields.")}
+            names |= {path.removeprefix("fields.") for path, _ in sort_spec if path.startswith("fields.")}
+            fields = [f for f in space.fields if f.name in names]
+        else:
+            fields = list(space.fields)
+
+        projection: dict[str, Any] = dict.fromkeys(_SYSTEM_PATHS, 1)
+        # The next page cursor is built from the sort values of the last note, so they stay whole
+        sort_paths = {path for path, _ in sort_spec}
+        for field in fields:
+            path = f"fields.{field.name}"
+            if (
+                excerpt_length is not None
+                and path not in sort_paths
+                and isinstance(field.options, StringFieldOptions)
+                and field.options.kind in _LONG_TEXT_KINDS
+            ):
+                # Truncate strings server-side; keep null/missing values as they are
+                projection[path] = {
+                    "$cond": [
+                        {"$eq": [{"$type": f"${path}"}, "string"]},
+                        {"$substrCP": [f"${path}", 0, excerpt_length]},
+                        f"${path}",
+                    ]
+                }
+            else:
+                projection[path] = 1
+        return projection
+
+    def _to_document(self, space: Space, note: Note) -> dict[str, Any]:
+        """Build MongoDB document for a new note, rendering its title and derived shadow values."""
+        note.title = self.core.services.template.render_note_title(space, note)
+        doc = note.to_mongo()
+        doc[SHADOW_ROOT] = build_shadow_values(space.fields, note.fields)
+        return doc
+
+    def _ensure_titles(self, notes: list[Note]) -> None:
+        """Render titles of notes stored before titles were persisted (until the backfill reaches them).
+
+        Such documents have no `title` attribute at all; a stored empty title is a rendered one.
+        """
         for note in notes:
-            note.title = self.core.services.template.render_note_title(space, note)
+            if "title" not in note.model_fields_set:
+                note.title = self.core.services.template.render_note_title(
+                    self.core.services.space.get_space(note.space_slug), note
+                )
+
+
+@contextlib.contextmanager
+def _text_index_required() -> Iterator[None]:
+    """Report full-text searches run while the text index is missing (being rebuilt) as a ValidationError."""
+    try:
+        yield
+    except OperationFailure as e:
+        if e.code != _INDEX_NOT_FOUND:
+            raise
+        raise ValidationError(
+            "Full-text search is unavailable: no text fields are indexed yet or the search index is being rebuilt"
+        ) from e
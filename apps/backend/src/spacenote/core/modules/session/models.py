@@ -17,3 +17,7 @@ class Session(MongoModel):
     username: str = Field(..., description="Username that owns this session")
     auth_token: str = Field(..., description="Unique authentication token")
     created_at: datetime = Field(default_factory=now, description="Session creation timestamp")
+    last_seen_at: datetime = Field(
+        default_factory=now,
+        description="Last authenticated use (coarse, see SESSION_TOUCH_INTERVAL); sessions expire relative to it",
+    )
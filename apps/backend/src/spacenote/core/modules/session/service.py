@@ -1,34 +1,94 @@
+import asyncio
+import contextlib
 import secrets
+from dataclasses import dataclass
+from datetime import datetime, timedelta
 from functools import cached_property
 from typing import Any
 
 import structlog
+from pymongo import UpdateOne
 from pymongo.asynchronous.collection import AsyncCollection
+from pymongo.errors import OperationFailure
 
+from spacenote.core.cache import ExpiringCache
 from spacenote.core.db import Collection
+from spacenote.core.modules.cluster.models import CacheScope
 from spacenote.core.modules.session.models import AuthToken, Session
+from spacenote.core.modules.session.tokens import (
+    create_signed_token,
+    is_signed_token,
+    read_token_claims,
+    verify_signed_token,
+)
 from spacenote.core.modules.user.models import User
 from spacenote.core.service import Service
 from spacenote.errors import AuthenticationError
+from spacenote.utils import now
 
 logger = structlog.get_logger(__name__)
 
+# Sessions kept in memory; least recently used ones are reloaded from the database on next use
+SESSION_CACHE_SIZE = 10_000
+
+# Resolution of last_seen_at (seconds): a session is touched at most once per interval
+SESSION_TOUCH_INTERVAL = 300
+
+# How often touched sessions are written to the database (seconds)
+SESSION_FLUSH_INTERVAL = 60
+
+
+@dataclass(slots=True)
+class CachedSession:
+    """Session state kept in memory."""
+
+    username: str
+    last_seen_at: datetime
+
 
 class SessionService(Service):
-    """Manages authentication sessions with in-memory cache."""
+    """Manages authentication sessions with in-memory cache.
+
+    Opaque tokens: sessions expire SESSION_TTL_SECONDS after their last use (sliding
+    expiry). Uses are recorded in memory and written to `last_seen_at` in periodic bulk writes.
+
+    Signed tokens (config.session_secret set): the token carries username and expiry and
+    is verified without a database lookup, so restarts and new workers start warm. Their
+    expiry is fixed at SESSION_TTL_SECONDS after login (uses are not recorded). Logout
+    and password changes add the token ids to `revoked_tokens`, held in memory.
+    """
 
     SESSION_TTL_SECONDS = 2592000  # 30 days
 
     def __init__(self) -> None:
-        self._authenticated_users: dict[AuthToken, User] = {}
+        self._sessions: ExpiringCache[AuthToken, CachedSession] = ExpiringCache(SESSION_CACHE_SIZE)
+        # Token → last_seen_at not yet written to the database
+        self._pending_touches: dict[AuthToken, datetime] = {}
+        self._flush_task: asyncio.Task[None] | None = None
+        # Revoked signed token id → token expiry (entries are dropped once the token has expired)
+        self._revoked: dict[str, datetime] = {}
 
     @cached_property
     def _collection(self) -> AsyncCollection[dict[str, Any]]:
         return self.database.get_collection(Collection.SESSIONS)
 
+    @cached_property
+    def _revoked_collection(self) -> AsyncCollection[dict[str, Any]]:
+        return self.database.get_collection(Collection.REVOKED_TOKENS)
+
+    @property
+    def _ttl(self) -> timedelta:
+        return timedelta(seconds=self.SESSION_TTL_SECONDS)
+
     async def create_session(self, username: str) -> AuthToken:
-        """Create new session and return authentication token."""
-        auth_token = AuthToken(secrets.token_urlsafe(32))
+        """Create new session and return authentication token.
+
+        Signed tokens are recorded as sessions too, so they can be revoked per user.
+        """
+        if secret := self.core.config.session_secret:
+            auth_token = create_signed_token(secret, username, now() + self._ttl)
+        else:
+            auth_token = AuthToken(secrets.token_urlsafe(32))
         session = Session(username=username, auth_token=auth_token)
         await self._collection.insert_one(session.to_mongo())
         logger.debug("session_created", username=username, token_length=len(auth_token))
@@ -36,40 +96,144 @@ class SessionService(Service):
 
     async def get_authenticated_user(self, auth_token: AuthToken) -> User:
         """Get authenticated user by token, checking cache first."""
-        if auth_token in self._authenticated_users:
-            return self._authenticated_users[auth_token]
-
-        session_doc = await self._collection.find_one({"auth_token": auth_token})
-        if session_doc is None:
-            raise AuthenticationError("Invalid or expired session")
-
-        session = Session.model_validate(session_doc)
+        current = now()
+        if is_signed_token(auth_token):
+            return self._get_signed_token_user(auth_token, current)
+
+        session = self._sessions.get(auth_token, current)
+        if session is None:
+            session_doc = await self._collection.find_one({"auth_token": auth_token})
+            if session_doc is None:
+                raise AuthenticationError("Invalid or expired session")
+            stored = Session.model_validate(session_doc)
+            # The TTL monitor removes expired documents only about once a minute
+            if stored.last_seen_at + self._ttl <= current:
+                raise AuthenticationError("Invalid or expired session")
+            session = CachedSession(username=stored.username, last_seen_at=stored.last_seen_at)
+            self._sessions.set(auth_token, session, session.last_seen_at + self._ttl)
 
         if not self.core.services.user.has_user(session.username):
             raise AuthenticationError("Invalid or expired session")
 
-        user = self.core.services.user.get_user(session.username)
-        self._authenticated_users[auth_token] = user
-        return user
+        self._touch(auth_token, session, current)
+        return self.core.services.user.get_user(session.username)
 
-    async def is_auth_token_valid(self, auth_token: AuthToken) -> bool:
-        """Check if authentication token is valid."""
-        try:
-            await self.get_authenticated_user(auth_token)
-        except AuthenticationError:
-            return False
-        else:
-            return True
+    def _get_signed_token_user(self, auth_token: AuthToken, current: datetime) -> User:
+        """Verify a signed token from memory only."""
+        secret = self.core.config.session_secret
+        claims = verify_signed_token(secret, auth_token, current) if secret else None
+        if claims is None or claims.token_id in self._revoked or not self.core.services.user.has_user(claims.username):
+            raise AuthenticationError("Invalid or expired session")
+        return self.core.services.user.get_user(claims.username)
 
     async def invalidate_session(self, auth_token: AuthToken) -> None:
         """Invalidate session by removing from cache and database."""
-        self._authenticated_users.pop(auth_token, None)
+        self._sessions.pop(auth_token)
+        self._pending_touches.pop(auth_token, None)
         await self._collection.delete_one({"auth_token": auth_token})
+        await self._revoke_signed_tokens([auth_token])
+        self.core.services.cluster.publish(CacheScope.SESSIONS)
         logger.debug("session_invalidated")
 
+    async def invalidate_user_sessions(self, username: str, keep: AuthToken | None = None) -> int:
+        """Invalidate all sessions of a user (except `keep`), e.g. after a password change. Returns their number."""
+        query: dict[str, Any] = {"username": username}
+        if keep is not None:
+            query["auth_token"] = {"$ne": keep}
+        tokens = [AuthToken(doc["auth_token"]) async for doc in self._collection.find(query, {"auth_token": 1})]
+        if not tokens:
+            return 0
+        for token in tokens:
+            self._sessions.pop(token)
+            self._pending_touches.pop(token, None)
+        await self._collection.delete_many({"auth_token": {"$in": tokens}})
+        await self._revoke_signed_tokens(tokens)
+        self.core.services.cluster.publish(CacheScope.SESSIONS)
+        logger.debug("user_sessions_invalidated", username=username, count=len(tokens))
+        return len(tokens)
+
+    async def load_revocations(self) -> None:
+        """Reload the revoked signed token ids from the database."""
+        query = {"expires_at": {"$gt": now()}}
+        self._revoked = {doc["token_id"]: doc["expires_at"] async for doc in self._revoked_collection.find(query)}
+
+    async def _revoke_signed_tokens(self, tokens: list[AuthToken]) -> None:
+        """Add signed tokens among these to the revocation set. Opaque tokens are skipped."""
+        claims = [c for c in map(read_token_claims, tokens) if c is not None and c.expires_at > now()]
+        if not claims:
+            return
+        for c in claims:
+            self._revoked[c.token_id] = c.expires_at
+        operations = [
+            UpdateOne(
+                {"token_id": c.token_id},
+                {"$set": {"token_id": c.token_id, "username": c.username, "expires_at": c.expires_at, "revoked_at": now()}},
+                upsert=True,
+            )
+            for c in claims
+        ]
+        await self._revoked_collection.bulk_write(operations, ordered=False)
+
+    def clear_cache(self) -> None:
+        """Drop all cached sessions; they are loaded again from the database on next use."""
+        self._sessions.clear()
+
+    def _touch(self, auth_token: AuthToken, session: CachedSession, current: datetime) -> None:
+        """Extend a session on use. The database write is deferred to the next flush."""
+        if current - session.last_seen_at < timedelta(seconds=SESSION_TOUCH_INTERVAL):
+            return
+        session.last_seen_at = current
+        self._sessions.set(auth_token, session, current + self._ttl)
+        self._pending_touches[auth_token] = current
+
+    async def _flush_touches(self) -> None:
+        """Write pending last_seen_at updates in one bulk write."""
+        pending, self._pending_touches = self._pending_touches, {}
+        if not pending:
+            return
+        operations = [
+            UpdateOne({"auth_token": token}, {"$max": {"last_seen_at": last_seen_at}}) for token, last_seen_at in pending.items()
+        ]
+        try:
+            await self._collection.bulk_write(operations, ordered=False)
+        except Exception:
+            # Retry with the next flush, keeping newer touches
+            for token, last_seen_at in pending.items():
+                self._pending_touches.setdefault(token, last_seen_at)
+            raise
+
+    async def _run_flusher(self) -> None:
+        """Background loop: flush pending touches and drop expired revocations every SESSION_FLUSH_INTERVAL seconds."""
+        while True:
+            await asyncio.sleep(SESSION_FLUSH_INTERVAL)
+            current = now()
+            self._revoked = {token_id: exp for token_id, exp in self._revoked.items() if exp > current}
+            try:
+                await self._flush_touches()
+            except Exception:
+                logger.exception("session_touch_flush_failed")
+
     async def on_start(self) -> None:
-        """Create database indexes on startup."""
+        """Create database indexes on startup and start the touch flusher."""
         await self._collection.create_index("auth_token", unique=True)
         await self._collection.create_index("username")
-        await self._collection.create_index("created_at", expireAfterSeconds=self.SESSION_TTL_SECONDS)
+        # Sessions created before sliding expiry: start from creation time, then move
+        # the TTL index from created_at to last_seen_at
+        await self._collection.update_many({"last_seen_at": {"$exists": False}}, [{"$set": {"last_seen_at": "$created_at"}}])
+        with contextlib.suppress(OperationFailure):
+            await self._collection.drop_index("created_at_1")
+        await self._collection.create_index("last_seen_at", expireAfterSeconds=self.SESSION_TTL_SECONDS)
+        await self._revoked_collection.create_index("token_id", unique=True)
+        await self._revoked_collection.create_index("expires_at", expireAfterSeconds=0)
+        await self.load_revocations()
+        self._flush_task = asyncio.create_task(self._run_flusher())
         logger.debug("session_service_started", ttl_seconds=self.SESSION_TTL_SECONDS)
+
+    async def on_stop(self) -> None:
+        """Stop the flusher and write remaining touches."""
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._flush_task
+        with contextlib.suppress(Exception):
+            await self._flush_touches()
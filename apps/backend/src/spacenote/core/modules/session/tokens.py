@@ -0,0 +1,66 @@
+"""Signed session tokens, verifiable without a database lookup.
+
+Format: `s1.{username}.{expires_at}.{token_id}.{signature}` — expires_at in Unix seconds,
+token_id random (used for revocation), signature HMAC-SHA256 over everything before it.
+Usernames are slugs and token ids URL-safe base64, so no part contains a dot.
+"""
+
+import base64
+import hashlib
+import hmac
+import secrets
+from dataclasses import dataclass
+from datetime import UTC, datetime
+
+from spacenote.core.modules.session.models import AuthToken
+
+SIGNED_TOKEN_PREFIX = "s1."  # noqa: S105
+
+
+@dataclass(frozen=True, slots=True)
+class TokenClaims:
+    """Contents of a signed token."""
+
+    username: str
+    expires_at: datetime
+    token_id: str
+
+
+def is_signed_token(token: str) -> bool:
+    """Whether a token uses the signed format (opaque tokens never start with the prefix)."""
+    return token.startswith(SIGNED_TOKEN_PREFIX)
+
+
+def create_signed_token(secret: str, username: str, expires_at: datetime) -> AuthToken:
+    """Issue a signed token for a user, valid until expires_at."""
+    payload = f"{SIGNED_TOKEN_PREFIX}{username}.{int(expires_at.timestamp())}.{secrets.token_urlsafe(12)}"
+    return AuthToken(f"{payload}.{_sign(secret, payload)}")
+
+
+def read_token_claims(token: str) -> TokenClaims | None:
+    """Parse a signed token without checking signature or expiry, or None if malformed."""
+    if not is_signed_token(token):
+        return None
+    parts = token.removeprefix(SIGNED_TOKEN_PREFIX).split(".")
+    if len(parts) != 4 or not parts[1].isdigit():
+        return None
+    username, expires, token_id, _ = parts
+    return TokenClaims(username=username, expires_at=datetime.fromtimestamp(int(expires), UTC), token_id=token_id)
+
+
+def verify_signed_token(secret: str, token: str, current_time: datetime) -> TokenClaims | None:
+    """Claims of a token with a valid signature that has not expired, else None."""
+    claims = read_token_claims(token)
+    if claims is None:
+        return None
+    payload, _, signature = token.rpartition(".")
+    if not hmac.compare_digest(signature, _sign(secret, payload)):
+        return None
+    if claims.expires_at <= current_time:
+        return None
+    return claims
+
+
+def _sign(secret: str, payload: str) -> str:
+    digest = hmac.new(secret.encode("utf-8"), payload.encode("utf-8"), hashlib.sha256).digest()
+    return base64.urlsafe_b64encode(digest).rstrip(b"=").decode("ascii")
@@ -2,8 +2,9 @@ from __future__ import annotations
 
 from datetime import datetime
 from enum import StrEnum
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 
-from pydantic import BaseModel, Field, model_validator
+from pydantic import BaseModel, Field, PrivateAttr, field_validator, model_validator
 
 from spacenote.core.db import MongoModel
 from spacenote.core.modules.field.models import SpaceField
@@ -30,6 +31,33 @@ class Member(BaseModel):
         return self
 
 
+class SpaceLookups:
+    """Name-keyed views of a space's fields, filters and members.
+
+    Built once for cached resolved spaces (see SpaceService._resolve_space). Each view
+    remembers the list it was built from and is only used while the space still holds
+    that same list, so a space whose lists are replaced falls back to scanning.
+    """
+
+    __slots__ = ("fields", "fields_source", "filters", "filters_source", "members", "members_source", "permissions")
+
+    def __init__(self, space: Space) -> None:
+        self.fields_source = space.fields
+        self.fields = {f.name: f for f in space.fields}
+        self.filters_source = space.filters
+        self.filters = {f.name: f for f in space.filters}
+        self.members_source = space.members
+        self.members = {m.username: m for m in space.members}
+        self.permissions = {m.username: _effective_permissions(m) for m in space.members}
+
+
+def _effective_permissions(member: Member) -> frozenset[Permission]:
+    """Permissions a member has, with 'all' expanded to every permission."""
+    if Permission.ALL in member.permissions:
+        return frozenset(Permission)
+    return frozenset(member.permissions)
+
+
 class Space(MongoModel):
     """Space entity."""
 
@@ -57,19 +85,49 @@ class Space(MongoModel):
     timezone: str = Field("UTC", description="Space timezone in IANA format (e.g., Atlantic/Reykjavik)")
     created_at: datetime = Field(default_factory=now, description="Timestamp when the space was created")
 
+    _lookups: SpaceLookups | None = PrivateAttr(default=None)
+
+    @field_validator("timezone")
+    @classmethod
+    def validate_timezone(cls, value: str) -> str:
+        """Reject names that are not IANA timezones (checked against the tz database)."""
+        try:
+            ZoneInfo(value)
+        except (ZoneInfoNotFoundError, ValueError) as e:
+            raise ValueError(f"Unknown timezone: {value}") from e
+        return value
+
+    def build_lookups(self) -> None:
+        """Precompute name-keyed lookups (for spaces kept in the cache)."""
+        self._lookups = SpaceLookups(self)
+
     def has_member(self, username: str) -> bool:
         """Check if username is a member of this space."""
-        return any(m.username == username for m in self.members)
+        return self.get_member(username) is not None
 
     def get_member(self, username: str) -> Member | None:
         """Get member by username."""
+        lookups = self._lookups
+        if lookups is not None and lookups.members_source is self.members:
+            return lookups.members.get(username)
         for m in self.members:
             if m.username == username:
                 return m
         return None
 
+    def get_member_permissions(self, username: str) -> frozenset[Permission]:
+        """Get permissions of a member ('all' expanded to every permission); empty for non-members."""
+        lookups = self._lookups
+        if lookups is not None and lookups.members_source is self.members:
+            return lookups.permissions.get(username, frozenset())
+        member = self.get_member(username)
+        return _effective_permissions(member) if member else frozenset()
+
     def get_field(self, name: str) -> SpaceField | None:
         """Get field definition by name."""
+        lookups = self._lookups
+        if lookups is not None and lookups.fields_source is self.fields:
+            return lookups.fields.get(name)
         for field in self.fields:
             if field.name == name:
                 return field
@@ -77,6 +135,9 @@ class Space(MongoModel):
 
     def get_filter(self, name: str) -> Filter | None:
         """Get filter definition by name."""
+        lookups = self._lookups
+        if lookups is not None and lookups.filters_source is self.filters:
+            return lookups.filters.get(name)
         for f in self.filters:
             if f.name == name:
                 return f
@@ -1,3 +1,4 @@
+from collections.abc import Iterable
 from functools import cached_property
 from typing import Any
 
@@ -6,6 +7,7 @@ from pymongo.asynchronous.collection import AsyncCollection
 
 from spacenote.core.db import Collection
 from spacenote.core.modules.attachment import storage as attachment_storage
+from spacenote.core.modules.cluster.models import CacheScope
 from spacenote.core.modules.field.validators import validate_transfer_schema_compatibility
 from spacenote.core.modules.filter.models import ALL_FILTER_NAME, create_default_all_filter
 from spacenote.core.modules.image import storage as image_storage
@@ -25,6 +27,10 @@ class SpaceService(Service):
         # Resolved view — parent fields/filters/templates merged into child spaces.
         # All read operations use this cache; mutations use _space_documents for ownership checks.
         self._resolved_spaces: dict[str, Space] = {}
+        # Membership index: username → slugs of spaces the user is a member of,
+        # and slug → member usernames it was built from (to update it incrementally)
+        self._user_spaces: dict[str, set[str]] = {}
+        self._space_members: dict[str, frozenset[str]] = {}
 
     @cached_property
     def _collection(self) -> AsyncCollection[dict[str, Any]]:
@@ -53,8 +59,9 @@ class SpaceService(Service):
         return list(self._resolved_spaces.values())
 
     def list_user_spaces(self, username: str) -> list[Space]:
-        """List resolved spaces where user is a member."""
-        return [space for space in self._resolved_spaces.values() if space.has_member(username)]
+        """List resolved spaces where user is a member, oldest first."""
+        spaces = [self._resolved_spaces[slug] for slug in self._user_spaces.get(username, ())]
+        return sorted(spaces, key=lambda space: (space.created_at, space.slug))
 
     # --- Create ---
 
@@ -240,9 +247,14 @@ class SpaceService(Service):
             Collection.ATTACHMENTS,
             Collection.TELEGRAM_TASKS,
             Collection.TELEGRAM_MIRRORS,
+            Collection.MIGRATION_JOBS,
         ]
         for col_name in collections:
             await self.database.get_collection(col_name).update_many({"space_slug": old_slug}, {"$set": {"space_slug": new_slug}})
+        self.core.services.note.invalidate_caches(old_slug)
+        self.core.services.comment.invalidate_caches(old_slug)
+        self.core.services.filter.invalidate_query_cache(old_slug)
+        self.core.services.counter.discard_blocks(old_slug)
 
         await self._collection.update_one({"slug": old_slug}, {"$set": {"slug": new_slug}})
 
@@ -254,9 +266,11 @@ class SpaceService(Service):
 
         del self._space_documents[old_slug]
         self._resolved_spaces.pop(old_slug, None)
+        self._index_members(old_slug, ())
 
         # Reload all caches since children's parent references changed
         await self.update_all_spaces_cache()
+        self.core.services.cluster.publish(CacheScope.SPACES)
         return self.get_space(new_slug)
 
     # --- Delete ---
@@ -272,6 +286,7 @@ class SpaceService(Service):
 
         await self.core.services.telegram.delete_telegram_tasks_by_space(slug)
         await self.core.services.telegram.delete_telegram_mirrors_by_space(slug)
+        await self.core.services.migration.delete_migration_jobs_by_space(slug)
         await self.core.services.attachment.delete_attachments_by_space(slug)
         self.core.services.image.delete_images_by_space(slug)
         await self.core.services.comment.delete_comments_by_space(slug)
@@ -280,6 +295,9 @@ class SpaceService(Service):
         await self._collection.delete_one({"slug": slug})
         del self._space_documents[slug]
         self._resolved_spaces.pop(slug, None)
+        self._index_members(slug, ())
+        self._on_resolved_spaces_changed([slug])
+        self.core.services.cluster.publish(CacheScope.SPACES)
 
     # --- Low-level ---
 
@@ -320,7 +338,16 @@ class SpaceService(Service):
         return [slug for slug, space in self._space_documents.items() if space.parent == parent_slug]
 
     def _resolve_space(self, space: Space) -> Space:
-        """Compute resolved space by merging parent's fields/filters/templates into child."""
+        """Compute resolved space by merging parent's fields/filters/templates into child.
+
+        The result gets precomputed lookups, so field/filter/member access on cached spaces is O(1).
+        """
+        resolved = self._merge_parent(space)
+        resolved.build_lookups()
+        return resolved
+
+    def _merge_parent(self, space: Space) -> Space:
+        """Merge parent's fields/filters/templates into a child space (root spaces are returned as is)."""
         if space.parent is None:
             return space
 
@@ -375,6 +402,11 @@ class SpaceService(Service):
         spaces = await Space.list_cursor(self._collection.find())
         self._space_documents = {space.slug: space for space in spaces}
         self._rebuild_resolved_cache()
+        self._user_spaces = {}
+        self._space_members = {}
+        for space in spaces:
+            self._index_members(space.slug, [m.username for m in space.members])
+        self._on_resolved_spaces_changed(list(self._resolved_spaces))
 
     async def update_space_cache(self, slug: str) -> Space:
         """Reload a specific space cache from database and rebuild resolved cache."""
@@ -383,13 +415,45 @@ class SpaceService(Service):
             raise NotFoundError(f"Space '{slug}' not found")
         self._space_documents[slug] = Space.model_validate(space)
         self._resolved_spaces[slug] = self._resolve_space(self._space_documents[slug])
+        self._index_members(slug, [m.username for m in self._space_documents[slug].members])
+        changed_slugs = [slug]
         # If this space is a parent, its children inherit from it —
         # rebuild their resolved caches so they pick up the changes.
         if self._space_documents[slug].parent is None:
             for child_slug in self.get_child_slugs(slug):
                 self._resolved_spaces[child_slug] = self._resolve_space(self._space_documents[child_slug])
+                changed_slugs.append(child_slug)
+        self._on_resolved_spaces_changed(changed_slugs)
+        self.core.services.cluster.publish(CacheScope.SPACES)
         return self._resolved_spaces[slug]
 
+    def _index_members(self, slug: str, usernames: Iterable[str]) -> None:
+        """Update the membership index for a space's current members (empty for a removed space)."""
+        members = frozenset(usernames)
+        previous = self._space_members.get(slug, frozenset())
+        for username in previous - members:
+            slugs = self._user_spaces[username]
+            slugs.discard(slug)
+            if not slugs:
+                del self._user_spaces[username]
+        for username in members - previous:
+            self._user_spaces.setdefault(username, set()).add(slug)
+        if members:
+            self._space_members[slug] = members
+        else:
+            self._space_members.pop(slug, None)
+
+    def _on_resolved_spaces_changed(self, slugs: list[str]) -> None:
+        """Refresh data derived from the resolved config of these spaces (changed or deleted)."""
+        for slug in slugs:
+            # Filter definitions may have changed — cached totals keyed by filter name are outdated
+            # Not broadcast: other processes run this hook themselves when they reload spaces
+            self.core.services.note.invalidate_caches(slug, broadcast=False)
+            self.core.services.filter.invalidate_query_cache(slug)
+        self.core.services.field.refresh_schemas(slugs)
+        self.core.services.filter.sync_filter_indexes()
+        self.core.services.template.refresh_compiled_templates(slugs)
+
     async def on_start(self) -> None:
         """Initialize indexes and cache."""
         await self._collection.create_index([("slug", 1)], unique=True)
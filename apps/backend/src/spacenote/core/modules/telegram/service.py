@@ -1,6 +1,7 @@
 import asyncio
 import contextlib
 import html
+from collections.abc import Iterable
 from functools import cached_property
 from pathlib import Path
 from typing import Any
@@ -79,24 +80,32 @@ class TelegramService(Service):
         return self.database.get_collection(Collection.TELEGRAM_MIRRORS)
 
     async def on_start(self) -> None:
-        """Create indexes and start worker if token configured."""
+        """Create indexes and set up the bot if token configured."""
         # Tasks indexes
         await self._tasks_collection.create_index([("space_slug", 1), ("number", 1)], unique=True)
         await self._tasks_collection.create_index([("status", 1), ("created_at", 1), ("number", 1)])
         # Mirrors index
         await self._mirrors_collection.create_index([("space_slug", 1), ("note_number", 1)], unique=True)
 
-        # Start worker if telegram bot token is configured
         if self.core.config.telegram_bot_token:
             self._bot = telegram.Bot(token=self.core.config.telegram_bot_token)
+
+    async def on_leader_start(self) -> None:
+        """Start the delivery worker if the bot is configured (tasks are delivered by the leader process only)."""
+        if self._bot is not None and self._worker_task is None:
             self._worker_task = asyncio.create_task(self._run_worker())
 
+    async def on_leader_stop(self) -> None:
+        """Stop the delivery worker; another process took over."""
+        await self.on_stop()
+
     async def on_stop(self) -> None:
         """Stop the worker task gracefully."""
         if self._worker_task is not None:
             self._worker_task.cancel()
             with contextlib.suppress(asyncio.CancelledError):
                 await self._worker_task
+            self._worker_task = None
 
     async def set_activity_channel(self, slug: str, channel: str | None) -> Space:
         """Set or clear the activity channel. Independent from mirror; no validation beyond presence."""
@@ -329,7 +338,20 @@ class TelegramService(Service):
             TelegramTaskType.ACTIVITY_NOTE_CREATED, note.space_slug, note.number, {"note": note.model_dump()}
         )
 
-    async def notify_activity_note_updated(self, note: Note, changes: dict[str, tuple[Any, Any]], edited_by: str) -> None:
+    async def notify_activity_note_updated(
+        self,
+        note: Note,
+        changes: dict[str, tuple[Any, Any]],
+        edited_by: str,
+        changed_attributes: Iterable[str] = (),
+    ) -> None:
+        """Enqueue activity message for a note edit, unless nothing the template shows has changed."""
+        deps = self.core.services.template.get_template_dependencies(
+            self.core.services.space.get_space(note.space_slug), f"telegram:{TelegramTaskType.ACTIVITY_NOTE_UPDATED}"
+        )
+        if not (changes and "changes" in deps.variables) and not deps.reads_note_changes(changed_attributes, changes):
+            logger.debug("telegram_activity_skipped", space_slug=note.space_slug, note_number=note.number)
+            return
         await self._enqueue_activity_task(
             TelegramTaskType.ACTIVITY_NOTE_UPDATED,
             note.space_slug,
@@ -379,8 +401,21 @@ class TelegramService(Service):
         """Create task for note mirror creation."""
         await self._enqueue_mirror_task(TelegramTaskType.MIRROR_CREATE, note)
 
-    async def notify_mirror_update(self, note: Note) -> None:
-        """Create task for note mirror update."""
+    async def notify_mirror_update(
+        self, note: Note, changed_attributes: Iterable[str] | None = None, changed_fields: Iterable[str] | None = None
+    ) -> None:
+        """Create task for note mirror update.
+
+        When the changed note attributes and fields are given, the task is skipped if the
+        telegram:mirror template reads none of them (the message would not change).
+        """
+        if changed_attributes is not None and changed_fields is not None:
+            deps = self.core.services.template.get_template_dependencies(
+                self.core.services.space.get_space(note.space_slug), "telegram:mirror"
+            )
+            if not deps.reads_note_changes(changed_attributes, changed_fields):
+                logger.debug("telegram_mirror_update_skipped", space_slug=note.space_slug, note_number=note.number)
+                return
         await self._enqueue_mirror_task(TelegramTaskType.MIRROR_UPDATE, note)
 
     async def notify_mirror_delete(self, space_slug: str, note_number: int) -> None:
@@ -0,0 +1,70 @@
+"""Static analysis of which note data a Liquid template reads."""
+
+from collections.abc import Iterable
+from dataclasses import dataclass, replace
+from functools import lru_cache
+from typing import Self
+
+from liquid import Template
+
+
+@dataclass(frozen=True)
+class TemplateDependencies:
+    """Note attributes and fields a template reads.
+
+    Conservative: any access that cannot be resolved statically (the whole `note`
+    object, a loop over `note.fields`, a dynamic key) is reported as reading everything
+    at that level.
+    """
+
+    reads_whole_note: bool  # `note` used as a value (assigned, printed, iterated)
+    reads_all_fields: bool  # `note.fields` used as a value or with a dynamic key
+    note_attributes: frozenset[str]  # top-level note attributes, e.g. "number", "title", "fields"
+    note_fields: frozenset[str]  # custom field names read via note.fields.{name}
+    variables: frozenset[str]  # all global variables read, e.g. "note", "space", "changes"
+
+    def reads_note_attribute(self, name: str) -> bool:
+        """Check if the template may read a top-level note attribute."""
+        return self.reads_whole_note or name in self.note_attributes
+
+    def reads_note_field(self, name: str) -> bool:
+        """Check if the template may read a custom field value."""
+        return self.reads_whole_note or self.reads_all_fields or name in self.note_fields
+
+    def reads_note_changes(self, attributes: Iterable[str], fields: Iterable[str]) -> bool:
+        """Check if the template may read any of the changed note attributes or custom fields."""
+        return any(self.reads_note_attribute(name) for name in attributes) or any(self.reads_note_field(name) for name in fields)
+
+    def with_fields(self, names: Iterable[str]) -> Self:
+        """Copy that also reads these custom fields (read outside Liquid, e.g. the telegram:mirror photo directive)."""
+        return replace(self, note_fields=self.note_fields | frozenset(names))
+
+
+@lru_cache(maxsize=512)
+def analyze_template(source: str) -> TemplateDependencies:
+    """Extract note dependencies from template source (parsed once per distinct source)."""
+    analysis = Template(source).analyze()
+
+    reads_whole_note = False
+    reads_all_fields = False
+    attributes: set[str] = set()
+    fields: set[str] = set()
+    for variable in analysis.variables.get("note", []):
+        segments = variable.segments
+        if len(segments) < 2 or not isinstance(segments[1], str):
+            reads_whole_note = True
+            continue
+        attributes.add(segments[1])
+        if segments[1] == "fields":
+            if len(segments) < 3 or not isinstance(segments[2], str):
+                reads_all_fields = True
+            else:
+                fields.add(segments[2])
+
+    return TemplateDependencies(
+        reads_whole_note=reads_whole_note,
+        reads_all_fields=reads_all_fields,
+        note_attributes=frozenset(attributes),
+        note_fields=frozenset(fields),
+        variables=frozenset(analysis.globals),
+    )
@@ -0,0 +1,43 @@
+"""Lazy template contexts over Pydantic models."""
+
+from collections.abc import Iterator, Mapping
+from functools import cache
+
+from pydantic import BaseModel
+
+
+class ModelContext(Mapping[str, object]):
+    """Read-only template view of a model that serializes attributes on first access.
+
+    Templates see the same values as in `model.model_dump()`, but only attributes the
+    template actually reads are dumped (once each), so rendering a title that reads
+    `note.number` does not serialize all fields, and a space context shared across a
+    page of notes does not re-serialize filters, members and templates per note.
+    """
+
+    __slots__ = ("_model", "_values")
+
+    def __init__(self, model: BaseModel) -> None:
+        self._model = model
+        self._values: dict[str, object] = {}
+
+    def __getitem__(self, key: str) -> object:
+        if key in self._values:
+            return self._values[key]
+        if key not in _dump_keys(type(self._model)):
+            raise KeyError(key)
+        value = self._model.model_dump(include={key}).get(key)
+        self._values[key] = value
+        return value
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(_dump_keys(type(self._model)))
+
+    def __len__(self) -> int:
+        return len(_dump_keys(type(self._model)))
+
+
+@cache
+def _dump_keys(model_type: type[BaseModel]) -> dict[str, None]:
+    """Attribute names included in model_dump() of a model class, in order."""
+    return dict.fromkeys(name for name, info in model_type.model_fields.items() if not info.exclude)
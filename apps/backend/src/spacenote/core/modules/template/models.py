@@ -0,0 +1,13 @@
+from pydantic import Field
+
+from spacenote.core.metrics import HistogramSnapshot
+from spacenote.core.schema import OpenAPIModel
+
+
+class TemplateRenderStats(OpenAPIModel):
+    """Render timings of one space template since server start."""
+
+    space_slug: str = Field(..., description="Space identifier")
+    template_key: str = Field(..., description="Template key, e.g. 'note:title'")
+    budget_exceeded: int = Field(..., description="Renders aborted by a render limit (default template used instead)", ge=0)
+    durations: HistogramSnapshot = Field(..., description="Render durations in seconds")
@@ -0,0 +1,112 @@
+"""Liquid environment enforcing render limits on user-supplied templates.
+
+Templates render synchronously on the event loop, so an expensive template stalls every
+concurrent request. Renders are capped by total loop iterations, output size, local
+variable size and wall time; exceeding any limit raises a `ResourceLimitError`.
+"""
+
+from collections.abc import Iterator, Mapping
+from contextlib import contextmanager
+from contextvars import ContextVar
+from time import monotonic
+from typing import Any
+
+from liquid import BoundTemplate, Environment, RenderContext
+from liquid.builtin.tags.for_tag import ForLoop
+from liquid.exceptions import ResourceLimitError
+from liquid.output import LimitedStringIO
+
+# Total iterations across (nested) loops per render
+LOOP_ITERATION_LIMIT = 10_000
+
+# Rendered output size in bytes (Telegram messages are at most 4096 characters)
+OUTPUT_STREAM_LIMIT = 64 * 1024
+
+# Size of values assigned inside a template, in bytes
+LOCAL_NAMESPACE_LIMIT = 256 * 1024
+
+# Wall-time budget per render, in seconds
+RENDER_TIME_BUDGET = 0.05
+
+
+class RenderTimeLimitError(ResourceLimitError):
+    """Render took longer than RENDER_TIME_BUDGET."""
+
+
+# Deadline (monotonic clock) of the render in progress; renders are synchronous, and
+# contexts copied by `render`/`include` see the same value
+_render_deadline: ContextVar[float | None] = ContextVar("render_deadline", default=None)
+
+
+def _check_deadline() -> None:
+    deadline = _render_deadline.get()
+    if deadline is not None and monotonic() > deadline:
+        raise RenderTimeLimitError("render time budget exceeded", token=None)
+
+
+def _budgeted_iter(it: Iterator[Any]) -> Iterator[Any]:
+    for item in it:
+        _check_deadline()
+        yield item
+
+
+class SandboxContext(RenderContext):
+    """Render context that enforces the render deadline on every loop iteration.
+
+    Loops are the only way a template's render time can grow beyond its size, and a loop
+    body need not write any output.
+    """
+
+    @contextmanager
+    def loop(self, namespace: Mapping[str, object], forloop: ForLoop) -> Iterator[RenderContext]:
+        _check_deadline()
+        forloop.it = _budgeted_iter(forloop.it)
+        with super().loop(namespace, forloop) as context:
+            yield context
+
+
+class _BudgetedOutput(LimitedStringIO):
+    """Output stream that also enforces the render deadline on every write."""
+
+    def write(self, s: str, /) -> int:
+        _check_deadline()
+        return super().write(s)
+
+
+class BudgetedTemplate(BoundTemplate):
+    """Template whose renders are bounded by the sandbox limits."""
+
+    context_class = SandboxContext
+
+    def render(self, *args: object, **kwargs: object) -> str:
+        """Render with the output size and wall-time budget enforced."""
+        return self._render_limited(monotonic() + RENDER_TIME_BUDGET, dict(*args, **kwargs))
+
+    def render_deterministic(self, *args: object, **kwargs: object) -> str:
+        """Render with the loop, output and variable size limits but no wall-time budget.
+
+        Whether a limit is hit then does not depend on server load, so the output can be stored.
+        """
+        return self._render_limited(None, dict(*args, **kwargs))
+
+    def _render_limited(self, deadline: float | None, variables: dict[str, object]) -> str:
+        context = self.context_class(self, globals=self.make_globals(variables))
+        buffer = _BudgetedOutput(OUTPUT_STREAM_LIMIT)
+        reset_token = _render_deadline.set(deadline)
+        try:
+            self.render_with_context(context, buffer)
+        finally:
+            _render_deadline.reset(reset_token)
+        return buffer.getvalue()
+
+
+class SandboxEnvironment(Environment):
+    """Liquid environment for space templates."""
+
+    loop_iteration_limit = LOOP_ITERATION_LIMIT
+    output_stream_limit = OUTPUT_STREAM_LIMIT
+    local_namespace_limit = LOCAL_NAMESPACE_LIMIT
+    template_class = BudgetedTemplate
+
+
+SANDBOX = SandboxEnvironment()
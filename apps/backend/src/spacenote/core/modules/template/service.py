@@ -1,23 +1,48 @@
-from typing import Any
+import hashlib
+import time
+from collections import OrderedDict
+from typing import Any, cast
 
 import structlog
 from liquid import Template
-from liquid.exceptions import LiquidError
+from liquid.exceptions import LiquidError, ResourceLimitError
 
+from spacenote.core.metrics import Histogram
 from spacenote.core.modules.field.models import FieldType
 from spacenote.core.modules.note.models import Note
 from spacenote.core.modules.space.models import Space
 from spacenote.core.modules.telegram.utils import parse_photo_directive
+from spacenote.core.modules.template.analysis import TemplateDependencies, analyze_template
+from spacenote.core.modules.template.context import ModelContext
 from spacenote.core.modules.template.defaults import DEFAULT_TEMPLATES
+from spacenote.core.modules.template.models import TemplateRenderStats
+from spacenote.core.modules.template.sandbox import SANDBOX, BudgetedTemplate
 from spacenote.core.service import Service
 from spacenote.errors import ValidationError
 
 logger = structlog.get_logger(__name__)
 
+# Maximum compiled templates kept in memory (least recently used are evicted)
+COMPILED_CACHE_SIZE = 1024
+
+# Template keys rendered on the server with Liquid (web:* templates are rendered by clients)
+_SERVER_TEMPLATE_PREFIXES = ("note:title", "telegram:")
+
 
 class TemplateService(Service):
     """Service for template management and rendering."""
 
+    def __init__(self) -> None:
+        # Parsed templates keyed by source hash, shared by all spaces using the same source
+        self._compiled: OrderedDict[str, BudgetedTemplate] = OrderedDict()
+        # Source hashes of each space's effective server-side templates
+        self._space_hashes: dict[str, set[str]] = {}
+        # Lazy context of the last rendered space; resolved spaces are replaced on every change
+        self._space_context: tuple[Space, ModelContext] | None = None
+        # Render durations and aborted renders per (space, template key)
+        self._render_durations: dict[tuple[str, str], Histogram] = {}
+        self._render_exceeded: dict[tuple[str, str], int] = {}
+
     async def set_template(self, slug: str, key: str, content: str) -> Space:
         """Set or remove a template for the space. Empty content removes the template."""
         space = self.core.services.space.get_space(slug)
@@ -70,11 +95,44 @@ class TemplateService(Service):
             space = await self.core.services.space.update_space_document(slug, {"$set": {f"templates.{key}": content}})
             logger.debug("template_set", space_slug=slug, key=key)
 
+        if key == "note:title":
+            # Stored titles are outdated in this space and in children inheriting the template
+            space_service = self.core.services.space
+            affected = [slug] + [
+                child
+                for child in space_service.get_child_slugs(slug)
+                if key not in space_service.get_space_document(child).templates
+            ]
+            self.core.services.note.schedule_title_refresh(affected)
+
         return space
 
+    def get_template_dependencies(self, space: Space, template_key: str) -> TemplateDependencies:
+        """Analyze which note data the effective template (own, inherited or default) reads."""
+        source = space.templates.get(template_key) or DEFAULT_TEMPLATES.get(template_key) or ""
+        dependencies = analyze_template(source)
+        if template_key == "telegram:mirror":
+            # The photo directive is a Liquid comment, invisible to the analysis
+            photo_field, _ = parse_photo_directive(source)
+            if photo_field:
+                dependencies = dependencies.with_fields([photo_field])
+        return dependencies
+
     def render_note_title(self, space: Space, note: Note) -> str:
         """Render note title from template."""
-        return self._render(space, "note:title", {"note": note.model_dump(), "space": space.model_dump()})
+        return self.render_note_titles(space, [note])[0]
+
+    def render_note_titles(self, space: Space, notes: list[Note]) -> list[str]:
+        """Render titles of several notes of one space, sharing one lazy space context.
+
+        Titles are stored, so they are rendered without the wall-time budget: a title must
+        not fall back to the default template just because the server was busy.
+        """
+        space_context = self._get_space_context(space)
+        return [
+            self._render(space, "note:title", {"note": ModelContext(note), "space": space_context}, deterministic=True)
+            for note in notes
+        ]
 
     def render_telegram(self, space: Space, template_key: str, payload: dict[str, Any]) -> str:
         """Render telegram template. Payload is passed directly as context."""
@@ -89,11 +147,100 @@ class TemplateService(Service):
 
         return self._render(space, template_key, context)
 
-    def _render(self, space: Space, template_key: str, context: dict[str, Any]) -> str:
-        """Render template with fallback to defaults."""
+    def refresh_compiled_templates(self, slugs: list[str]) -> None:
+        """Compile the current templates of these spaces and forget sources no longer used.
+
+        Called whenever resolved spaces change (including startup, which pre-warms the
+        cache for all spaces), so renders never parse on the request path.
+        """
+        space_service = self.core.services.space
+        # Deleted or renamed spaces
+        for slug in [slug for slug in self._space_hashes if not space_service.has_space(slug)]:
+            del self._space_hashes[slug]
+
+        for slug in slugs:
+            if not space_service.has_space(slug):
+                continue
+            space = space_service.get_space(slug)
+            hashes: set[str] = set()
+            for key in {*DEFAULT_TEMPLATES, *space.templates}:
+                source = space.templates.get(key) or DEFAULT_TEMPLATES.get(key)
+                if not source or not key.startswith(_SERVER_TEMPLATE_PREFIXES):
+                    continue
+                try:
+                    self._get_compiled(source)
+                except LiquidError as e:
+                    logger.warning("template_compile_failed", space_slug=slug, template_key=key, error=str(e))
+                    continue
+                hashes.add(_source_hash(source))
+            self._space_hashes[slug] = hashes
+
+        in_use = set().union(*self._space_hashes.values())
+        for source_hash in [h for h in self._compiled if h not in in_use]:
+            del self._compiled[source_hash]
+
+    def _get_space_context(self, space: Space) -> ModelContext:
+        """Lazy template context of a space, reused while the same resolved space is rendered."""
+        if self._space_context is None or self._space_context[0] is not space:
+            self._space_context = (space, ModelContext(space))
+        return self._space_context[1]
+
+    def _get_compiled(self, source: str) -> BudgetedTemplate:
+        """Get parsed template for source, parsing it on first use (LRU cache)."""
+        source_hash = _source_hash(source)
+        template = self._compiled.get(source_hash)
+        if template is None:
+            template = cast(BudgetedTemplate, SANDBOX.from_string(source))
+            self._compiled[source_hash] = template
+            while len(self._compiled) > COMPILED_CACHE_SIZE:
+                self._compiled.popitem(last=False)
+        else:
+            self._compiled.move_to_end(source_hash)
+        return template
+
+    def _render(self, space: Space, template_key: str, context: dict[str, Any], *, deterministic: bool = False) -> str:
+        """Render template with fallback to defaults.
+
+        Args:
+            deterministic: Skip the wall-time budget (see BudgetedTemplate.render_deterministic).
+        """
         template_str = space.templates.get(template_key) or DEFAULT_TEMPLATES.get(template_key)
         if not template_str:
             logger.warning("template_not_found", space_slug=space.slug, template_key=template_key)
             return ""
-        template = Template(template_str)
-        return template.render(**context)
+
+        stats_key = (space.slug, template_key)
+        started = time.perf_counter()
+        try:
+            return _render_compiled(self._get_compiled(template_str), context, deterministic=deterministic)
+        except ResourceLimitError as e:
+            # Loop, output size or time budget exceeded: fall back to the built-in template
+            self._render_exceeded[stats_key] = self._render_exceeded.get(stats_key, 0) + 1
+            logger.warning("template_render_limit_exceeded", space_slug=space.slug, template_key=template_key, error=e.message)
+            default = DEFAULT_TEMPLATES.get(template_key)
+            if not default or default == template_str:
+                return ""
+            return _render_compiled(self._get_compiled(default), context, deterministic=deterministic)
+        finally:
+            self._render_durations.setdefault(stats_key, Histogram()).observe(time.perf_counter() - started)
+
+    def get_render_stats(self) -> list[TemplateRenderStats]:
+        """Render timings per space template since server start."""
+        return [
+            TemplateRenderStats(
+                space_slug=space_slug,
+                template_key=template_key,
+                budget_exceeded=self._render_exceeded.get((space_slug, template_key), 0),
+                durations=histogram.snapshot(),
+            )
+            for (space_slug, template_key), histogram in sorted(self._render_durations.items())
+        ]
+
+
+def _render_compiled(template: BudgetedTemplate, context: dict[str, Any], *, deterministic: bool) -> str:
+    return template.render_deterministic(**context) if deterministic else template.render(**context)
+
+
+def _source_hash(source: str) -> str:
+    """Cache key of a template source."""
+    return hashlib.sha256(source.encode()).hexdigest()
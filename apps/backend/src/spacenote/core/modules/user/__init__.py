@@ -1,5 +1,6 @@
 from spacenote.core.modules.user.models import User as User
 from spacenote.core.modules.user.models import UserView as UserView
+from spacenote.core.modules.user.password import get_hash_cost as get_hash_cost
 from spacenote.core.modules.user.password import hash_password as hash_password
 from spacenote.core.modules.user.password import verify_password_hash as verify_password_hash
 from spacenote.core.modules.user.service import UserService as UserService
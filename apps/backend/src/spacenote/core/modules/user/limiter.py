@@ -0,0 +1,62 @@
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+from spacenote.errors import RateLimitError
+
+
+class LoginLimiter:
+    """Admission control for login attempts.
+
+    Caps attempts in progress per client IP, per username and in total. Attempts over
+    a cap are rejected instead of queued, so a burst of logins cannot pile up password
+    checks ahead of regular traffic. Counters live in the event loop thread; no locking.
+    """
+
+    def __init__(self, per_ip: int, per_username: int, total: int) -> None:
+        self._per_ip = per_ip
+        self._per_username = per_username
+        self._total = total
+        self._by_ip: dict[str, int] = {}
+        self._by_username: dict[str, int] = {}
+        self._in_flight = 0
+        self.rejected = 0
+
+    @property
+    def in_flight(self) -> int:
+        """Number of login attempts in progress."""
+        return self._in_flight
+
+    @contextmanager
+    def admit(self, username: str, client_ip: str | None) -> Iterator[None]:
+        """Hold a slot for one login attempt. Raises RateLimitError if a cap is reached."""
+        if (
+            self._in_flight >= self._total
+            or self._by_username.get(username, 0) >= self._per_username
+            or (client_ip is not None and self._by_ip.get(client_ip, 0) >= self._per_ip)
+        ):
+            self.rejected += 1
+            raise RateLimitError("Too many login attempts, try again later")
+
+        self._in_flight += 1
+        _increment(self._by_username, username)
+        if client_ip is not None:
+            _increment(self._by_ip, client_ip)
+        try:
+            yield
+        finally:
+            self._in_flight -= 1
+            _decrement(self._by_username, username)
+            if client_ip is not None:
+                _decrement(self._by_ip, client_ip)
+
+
+def _increment(counts: dict[str, int], key: str) -> None:
+    counts[key] = counts.get(key, 0) + 1
+
+
+def _decrement(counts: dict[str, int], key: str) -> None:
+    """Decrement a counter, dropping it at zero so idle keys do not accumulate."""
+    if counts[key] <= 1:
+        del counts[key]
+    else:
+        counts[key] -= 1
@@ -5,6 +5,8 @@ from datetime import datetime
 from pydantic import BaseModel, Field
 
 from spacenote.core.db import MongoModel
+from spacenote.core.metrics import HistogramSnapshot
+from spacenote.core.schema import OpenAPIModel
 from spacenote.utils import now
 
 
@@ -27,3 +29,16 @@ class UserView(BaseModel):
     def from_domain(cls, user: User) -> UserView:
         """Create view model from domain model."""
         return cls(username=user.username, is_admin=user.is_admin)
+
+
+class PasswordHashingStats(OpenAPIModel):
+    """Password hashing and login admission metrics since server start."""
+
+    cost: int = Field(..., description="bcrypt cost factor used for new password hashes")
+    stored_costs: dict[int, int] = Field(..., description="Number of users per cost factor of their stored hash")
+    workers: int = Field(..., description="Threads of the password hashing executor", ge=1)
+    hash_durations: HistogramSnapshot = Field(..., description="Durations of password hashing in seconds")
+    verify_durations: HistogramSnapshot = Field(..., description="Durations of password checks in seconds")
+    queue_waits: HistogramSnapshot = Field(..., description="Time hashing operations waited for an executor thread, in seconds")
+    logins_in_flight: int = Field(..., description="Login attempts currently in progress", ge=0)
+    logins_rejected: int = Field(..., description="Login attempts rejected by admission control", ge=0)
@@ -1,5 +1,8 @@
 import bcrypt
 
+# bcrypt cost factor (log2 of key expansion rounds) for new hashes; one hash takes roughly 0.2-0.3 s at 12
+BCRYPT_ROUNDS = 12
+
 
 def hash_password(password: str) -> str:
     """Hash password using bcrypt.
@@ -10,7 +13,7 @@ def hash_password(password: str) -> str:
     Returns:
         Bcrypt hash as UTF-8 string
     """
-    return bcrypt.hashpw(password.encode("utf-8"), bcrypt.gensalt()).decode("utf-8")
+    return bcrypt.hashpw(password.encode("utf-8"), bcrypt.gensalt(rounds=BCRYPT_ROUNDS)).decode("utf-8")
 
 
 def verify_password_hash(password: str, password_hash: str) -> bool:
@@ -24,3 +27,11 @@ def verify_password_hash(password: str, password_hash: str) -> bool:
         True if password matches hash, False otherwise
     """
     return bcrypt.checkpw(password.encode("utf-8"), password_hash.encode("utf-8"))
+
+
+def get_hash_cost(password_hash: str) -> int | None:
+    """Cost factor stored in a bcrypt hash ("$2b$12$..." → 12), or None if the hash is malformed."""
+    parts = password_hash.split("$")
+    if len(parts) < 4 or not parts[2].isdigit():
+        return None
+    return int(parts[2])
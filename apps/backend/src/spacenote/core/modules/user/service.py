@@ -1,3 +1,8 @@
+import asyncio
+import time
+from collections import Counter
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from functools import cached_property
 from types import MappingProxyType
 from typing import Any
@@ -6,20 +11,43 @@ import structlog
 from pymongo.asynchronous.collection import AsyncCollection
 
 from spacenote.core.db import Collection
-from spacenote.core.modules.user.models import User
-from spacenote.core.modules.user.password import hash_password, verify_password_hash
+from spacenote.core.metrics import Histogram
+from spacenote.core.modules.cluster.models import CacheScope
+from spacenote.core.modules.user.limiter import LoginLimiter
+from spacenote.core.modules.user.models import PasswordHashingStats, User
+from spacenote.core.modules.user.password import BCRYPT_ROUNDS, get_hash_cost, hash_password, verify_password_hash
 from spacenote.core.modules.user.validators import validate_password, validate_username
 from spacenote.core.service import Service
 from spacenote.errors import NotFoundError, ValidationError
 
 logger = structlog.get_logger(__name__)
 
+# Threads hashing passwords. bcrypt releases the GIL while hashing, so hashes run in
+# parallel with the event loop; the bound caps the CPU a burst of logins can take.
+PASSWORD_HASH_WORKERS = 2
+
+# Login attempts in progress allowed per client IP (from X-Forwarded-For of trusted proxies, see
+# config.forwarded_allow_ips), per username and in total
+LOGIN_LIMIT_PER_IP = 4
+LOGIN_LIMIT_PER_USERNAME = 2
+LOGIN_LIMIT_TOTAL = 16
+
+# Upper bounds (seconds) of password hashing histogram buckets
+PASSWORD_DURATION_BUCKETS = (0.001, 0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
 
 class UserService(Service):
     """Manages users with in-memory cache."""
 
     def __init__(self) -> None:
         self._users: dict[str, User] = {}
+        self._hash_executor = ThreadPoolExecutor(max_workers=PASSWORD_HASH_WORKERS, thread_name_prefix="password-hash")
+        self._login_limiter = LoginLimiter(
+            per_ip=LOGIN_LIMIT_PER_IP, per_username=LOGIN_LIMIT_PER_USERNAME, total=LOGIN_LIMIT_TOTAL
+        )
+        self._hash_durations = Histogram(PASSWORD_DURATION_BUCKETS)
+        self._verify_durations = Histogram(PASSWORD_DURATION_BUCKETS)
+        self._queue_waits = Histogram(PASSWORD_DURATION_BUCKETS)
 
     @cached_property
     def _collection(self) -> AsyncCollection[dict[str, Any]]:
@@ -50,32 +78,39 @@ class UserService(Service):
 
         validate_username(username)
         validate_password(password)
-        user = User(username=username, password_hash=hash_password(password), is_admin=is_admin)
+        user = User(username=username, password_hash=await self._hash_password(password), is_admin=is_admin)
         await self._collection.insert_one(user.to_mongo())
         return await self.update_user_cache(username)
 
-    def verify_password(self, username: str, password: str) -> bool:
+    async def verify_password(self, username: str, password: str) -> bool:
         """Verify password against stored hash."""
         if not self.has_user(username):
             return False
         user = self._users[username]
-        return verify_password_hash(password, user.password_hash)
+        return await self._verify_password_hash(password, user.password_hash)
+
+    async def verify_login(self, username: str, password: str, client_ip: str | None = None) -> bool:
+        """Verify login credentials under admission control. Raises RateLimitError if too many attempts are in progress."""
+        with self._login_limiter.admit(username, client_ip):
+            return await self.verify_password(username, password)
 
     async def change_password(self, username: str, old_password: str, new_password: str) -> None:
         """Change user password after verifying current password."""
         user = self.get_user(username)
-        if not verify_password_hash(old_password, user.password_hash):
+        if not await self._verify_password_hash(old_password, user.password_hash):
             raise ValidationError("Invalid current password")
 
         validate_password(new_password)
-        await self._collection.update_one({"username": username}, {"$set": {"password_hash": hash_password(new_password)}})
+        password_hash = await self._hash_password(new_password)
+        await self._collection.update_one({"username": username}, {"$set": {"password_hash": password_hash}})
         await self.update_user_cache(username)
 
     async def set_password(self, username: str, new_password: str) -> None:
         """Set user password (no old password required)."""
         self.get_user(username)
         validate_password(new_password)
-        await self._collection.update_one({"username": username}, {"$set": {"password_hash": hash_password(new_password)}})
+        password_hash = await self._hash_password(new_password)
+        await self._collection.update_one({"username": username}, {"$set": {"password_hash": password_hash}})
         await self.update_user_cache(username)
 
     async def set_admin(self, username: str, is_admin: bool) -> User:
@@ -90,12 +125,53 @@ class UserService(Service):
         if user.is_admin:
             raise ValidationError("Cannot delete admin user")
 
-        for space in self.core.services.space.list_all_spaces():
-            if space.has_member(username):
-                raise ValidationError(f"Cannot delete user '{username}': member of space '{space.slug}'")
+        if spaces := self.core.services.space.list_user_spaces(username):
+            raise ValidationError(f"Cannot delete user '{username}': member of space '{spaces[0].slug}'")
 
         await self._collection.delete_one({"username": username})
         del self._users[username]
+        self.core.services.cluster.publish(CacheScope.USERS)
+
+    def get_password_hashing_stats(self) -> PasswordHashingStats:
+        """Password hashing and login admission metrics since server start."""
+        stored_costs = Counter(get_hash_cost(user.password_hash) for user in self._users.values())
+        return PasswordHashingStats(
+            cost=BCRYPT_ROUNDS,
+            stored_costs={cost: count for cost, count in sorted(stored_costs.items()) if cost is not None},
+            workers=PASSWORD_HASH_WORKERS,
+            hash_durations=self._hash_durations.snapshot(),
+            verify_durations=self._verify_durations.snapshot(),
+            queue_waits=self._queue_waits.snapshot(),
+            logins_in_flight=self._login_limiter.in_flight,
+            logins_rejected=self._login_limiter.rejected,
+        )
+
+    async def _hash_password(self, password: str) -> str:
+        """Hash a password in the hashing executor."""
+        return await self._run_hashing(self._hash_durations, hash_password, password)
+
+    async def _verify_password_hash(self, password: str, password_hash: str) -> bool:
+        """Check a password against a hash in the hashing executor."""
+        return await self._run_hashing(self._verify_durations, verify_password_hash, password, password_hash)
+
+    async def _run_hashing[T](self, durations: Histogram, func: Callable[..., T], *args: str) -> T:
+        """Run a bcrypt operation off the event loop, recording queue wait and duration."""
+        submitted = time.perf_counter()
+        timings: list[float] = []
+
+        def timed() -> T:
+            started = time.perf_counter()
+            try:
+                return func(*args)
+            finally:
+                timings.extend((started - submitted, time.perf_counter() - started))
+
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self._hash_executor, timed)
+        finally:
+            if timings:
+                self._queue_waits.observe(timings[0])
+                durations.observe(timings[1])
 
     async def ensure_admin_user_exists(self) -> None:
         """Create default admin user if not exists."""
@@ -116,6 +192,7 @@ class UserService(Service):
         if user is None:
             raise NotFoundError(f"User '{username}' not found")
         self._users[username] = User.model_validate(user)
+        self.core.services.cluster.publish(CacheScope.USERS)
         return self._users[username]
 
     async def on_start(self) -> None:
@@ -126,3 +203,7 @@ class UserService(Service):
         await self.update_all_users_cache()
         await self.ensure_admin_user_exists()
         logger.debug("user_service_started", user_count=len(self._users))
+
+    async def on_stop(self) -> None:
+        """Shut down the hashing executor."""
+        self._hash_executor.shutdown(wait=False, cancel_futures=True)
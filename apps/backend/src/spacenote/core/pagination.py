@@ -1,10 +1,106 @@
+import base64
+import binascii
+from collections.abc import Hashable, Mapping
+from enum import StrEnum
+from typing import Any, TypeIs
+
+import bson
+from bson.codec_options import CodecOptions, TypeRegistry
+from bson.decimal128 import DecimalDecoder, DecimalEncoder
+from bson.errors import BSONError
 from pydantic import BaseModel, Field
+from pymongo.asynchronous.collection import AsyncCollection
+
+from spacenote.core.cache import SpaceVersionedCache
+from spacenote.errors import ValidationError
+
+# Same codecs as the database, so cursor values compare exactly like stored values
+_CURSOR_CODEC_OPTIONS: CodecOptions[dict[str, Any]] = CodecOptions(
+    type_registry=TypeRegistry([DecimalEncoder(), DecimalDecoder()]), tz_aware=True
+)
+
+# How old a count from before the latest write may be and still serve as an estimate
+ESTIMATE_MAX_STALE_SECONDS = 60.0
+
+
+class TotalMode(StrEnum):
+    """How list endpoints compute the total item count."""
+
+    EXACT = "exact"  # Up-to-date count (cached until the next write)
+    ESTIMATE = "estimate"  # May be slightly outdated after recent writes
+    NONE = "none"  # Skip counting (infinite scroll)
 
 
 class PaginationResult[T](BaseModel):
     """Pagination result wrapper for list endpoints."""
 
     items: list[T] = Field(..., description="List of items in current page")
-    total: int = Field(..., description="Total number of items across all pages", ge=0)
+    total: int | None = Field(..., description="Total number of items across all pages (null when counting was skipped)", ge=0)
     limit: int = Field(..., description="Maximum items per page", ge=1)
     offset: int = Field(..., description="Number of items skipped", ge=0)
+
+
+class CursorPaginationResult[T](PaginationResult[T]):
+    """Pagination result that also supports keyset (cursor) pagination."""
+
+    next_cursor: str | None = Field(
+        default=None, description="Opaque cursor for the next page (pass as 'cursor'). Null when there are no more items"
+    )
+
+
+def encode_cursor(sort_spec: list[tuple[str, int]], values: list[Any]) -> str:
+    """Encode sort key values of the last returned item into an opaque cursor."""
+    payload = {"s": [[path, direction] for path, direction in sort_spec], "v": values}
+    return base64.urlsafe_b64encode(bson.encode(payload, codec_options=_CURSOR_CODEC_OPTIONS)).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, sort_spec: list[tuple[str, int]]) -> list[Any]:
+    """Decode cursor into sort key values.
+
+    Raises:
+        ValidationError: If cursor is malformed or was issued for a different sort order
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        payload = bson.decode(raw, codec_options=_CURSOR_CODEC_OPTIONS)
+    except binascii.Error, BSONError, ValueError:
+        raise ValidationError("Invalid cursor") from None
+
+    cursor_spec = payload.get("s")
+    if not _is_sort_spec(cursor_spec):
+        raise ValidationError("Invalid cursor")
+    if [tuple(item) for item in cursor_spec] != list(sort_spec):
+        raise ValidationError("Cursor does not match the current filter sort order")
+    values = payload.get("v")
+    if not isinstance(values, list) or len(values) != len(sort_spec):
+        raise ValidationError("Invalid cursor")
+    return values
+
+
+def _is_sort_spec(value: object) -> TypeIs[list[list[Any]]]:
+    """Check that a decoded cursor holds a sort spec: a list of [path, direction] pairs."""
+    return isinstance(value, list) and all(
+        isinstance(item, list) and len(item) == 2 and isinstance(item[0], str) and type(item[1]) is int and item[1] in (1, -1)
+        for item in value
+    )
+
+
+async def count_documents_cached(
+    collection: AsyncCollection[dict[str, Any]],
+    query: Mapping[str, Any],
+    cache: SpaceVersionedCache[int],
+    space_slug: str,
+    key: Hashable,
+    mode: TotalMode,
+) -> int | None:
+    """Count documents matching query, reusing counts cached per space write version."""
+    if mode == TotalMode.NONE:
+        return None
+
+    max_stale_age = ESTIMATE_MAX_STALE_SECONDS if mode == TotalMode.ESTIMATE else None
+    total = cache.get(space_slug, key, max_stale_age=max_stale_age)
+    if total is None:
+        version = cache.get_version(space_slug)
+        total = await collection.count_documents(query)
+        cache.set(space_slug, key, total, version)
+    return total
@@ -35,3 +35,9 @@ class Service:
 
     async def on_stop(self) -> None:
         """Cleanup service on application shutdown."""
+
+    async def on_leader_start(self) -> None:
+        """Start background work that must run in a single server process (see ClusterService)."""
+
+    async def on_leader_stop(self) -> None:
+        """Stop background work started by on_leader_start (leadership lost to another process)."""
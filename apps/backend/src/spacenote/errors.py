@@ -35,6 +35,13 @@ class ValidationError(UserError):
     """Raised when user input fails validation."""
 
 
+class RateLimitError(UserError):
+    """Raised when too many requests of a kind are in progress."""
+
+    def __init__(self, message: str = "Too many requests") -> None:
+        super().__init__(message)
+
+
 class ImageProcessingError(UserError):
     """Raised when image is still being processed."""
 
@@ -4,6 +4,7 @@ from fastapi import Depends, Request
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 
 from spacenote.app import App
+from spacenote.core.modules.access.models import Principal
 from spacenote.core.modules.session.models import AuthToken
 from spacenote.errors import AuthenticationError
 
@@ -15,29 +16,38 @@ async def get_app(request: Request) -> App:
     return cast(App, request.app.state.app)
 
 
-async def get_auth_token(
+async def get_principal(
     request: Request,
     app: Annotated[App, Depends(get_app)],
     credentials: Annotated[HTTPAuthorizationCredentials | None, Depends(bearer_scheme)] = None,
-) -> AuthToken:
-    """Get and validate auth token from Authorization Bearer header or cookie."""
+) -> Principal:
+    """Resolve the authenticated caller from Authorization Bearer header or cookie.
 
+    Resolved once per request and kept in `request.state.principal`.
+    """
+    principal: Principal | None = getattr(request.state, "principal", None)
+    if principal is not None:
+        return principal
+
+    tokens: list[str] = []
     # Check Bearer token first (preferred)
     if credentials and credentials.scheme == "Bearer":
-        auth_token = AuthToken(credentials.credentials)
-        if await app.is_auth_token_valid(auth_token):
-            return auth_token
-
+        tokens.append(credentials.credentials)
     # Fallback to cookie
-    token = request.cookies.get("token")
-    if token:
-        auth_token = AuthToken(token)
-        if await app.is_auth_token_valid(auth_token):
-            return auth_token
+    if token := request.cookies.get("token"):
+        tokens.append(token)
+
+    for token in tokens:
+        try:
+            principal = await app.authenticate(AuthToken(token))
+        except AuthenticationError:
+            continue
+        request.state.principal = principal
+        return principal
 
     raise AuthenticationError
 
 
 # Type aliases for dependencies
 AppDep = Annotated[App, Depends(get_app)]
-AuthTokenDep = Annotated[AuthToken, Depends(get_auth_token)]
+PrincipalDep = Annotated[Principal, Depends(get_principal)]
@@ -10,6 +10,7 @@ from spacenote.errors import (
     BackupError,
     ImageProcessingError,
     NotFoundError,
+    RateLimitError,
     UserError,
     ValidationError,
 )
@@ -36,6 +37,7 @@ async def user_error_handler(request: Request, exc: Exception) -> JSONResponse:
         AccessDeniedError: status.HTTP_403_FORBIDDEN,
         NotFoundError: status.HTTP_404_NOT_FOUND,
         ValidationError: status.HTTP_400_BAD_REQUEST,
+        RateLimitError: status.HTTP_429_TOO_MANY_REQUESTS,
         ImageProcessingError: status.HTTP_202_ACCEPTED,
         BackupError: status.HTTP_500_INTERNAL_SERVER_ERROR,
     }
@@ -7,7 +7,7 @@ from spacenote.core.modules.attachment.models import Attachment, PendingAttachme
 from spacenote.core.modules.image.processor import parse_webp_option
 from spacenote.core.pagination import PaginationResult
 from spacenote.errors import ValidationError
-from spacenote.web.deps import AppDep, AuthTokenDep
+from spacenote.web.deps import AppDep, PrincipalDep
 from spacenote.web.openapi import ErrorResponse
 
 router = APIRouter(tags=["attachments"])
@@ -24,10 +24,10 @@ router = APIRouter(tags=["attachments"])
         401: {"model": ErrorResponse, "description": "Not authenticated"},
     },
 )
-async def upload_pending_attachment(file: UploadFile, app: AppDep, auth_token: AuthTokenDep) -> PendingAttachment:
+async def upload_pending_attachment(file: UploadFile, app: AppDep, principal: PrincipalDep) -> PendingAttachment:
     content = await file.read()
     return await app.upload_pending_attachment(
-        auth_token,
+        principal,
         filename=file.filename or "unnamed",
         content=content,
         mime_type=file.content_type or "application/octet-stream",
@@ -46,11 +46,11 @@ async def upload_pending_attachment(file: UploadFile, app: AppDep, auth_token: A
 )
 async def list_pending_attachments(
     app: AppDep,
-    auth_token: AuthTokenDep,
+    principal: PrincipalDep,
     limit: Annotated[int, Query(ge=1, le=100, description="Maximum items to return")] = 50,
     offset: Annotated[int, Query(ge=0, description="Number of items to skip")] = 0,
 ) -> PaginationResult[PendingAttachment]:
-    return await app.list_pending_attachments(auth_token, limit, offset)
+    return await app.list_pending_attachments(principal, limit, offset)
 
 
 @router.delete(
@@ -66,8 +66,8 @@ async def list_pending_attachments(
         404: {"model": ErrorResponse, "description": "Attachment not found"},
     },
 )
-async def delete_pending_attachment(number: int, app: AppDep, auth_token: AuthTokenDep) -> None:
-    await app.delete_pending_attachment(auth_token, number)
+async def delete_pending_attachment(number: int, app: AppDep, principal: PrincipalDep) -> None:
+    await app.delete_pending_attachment(principal, number)
 
 
 @router.post(
@@ -83,10 +83,10 @@ async def delete_pending_attachment(number: int, app: AppDep, auth_token: AuthTo
         404: {"model": ErrorResponse, "description": "Space not found"},
     },
 )
-async def upload_space_attachment(space_slug: str, file: UploadFile, app: AppDep, auth_token: AuthTokenDep) -> Attachment:
+async def upload_space_attachment(space_slug: str, file: UploadFile, app: AppDep, principal: PrincipalDep) -> Attachment:
     content = await file.read()
     return await app.upload_space_attachment(
-        auth_token,
+        principal,
         space_slug,
         filename=file.filename or "unnamed",
         content=content,
@@ -108,11 +108,11 @@ async def upload_space_attachment(space_slug: str, file: UploadFile, app: AppDep
     },
 )
 async def upload_note_attachment(
-    space_slug: str, note_number: int, file: UploadFile, app: AppDep, auth_token: AuthTokenDep
+    space_slug: str, note_number: int, file: UploadFile, app: AppDep, principal: PrincipalDep
 ) -> Attachment:
     content = await file.read()
     return await app.upload_note_attachment(
-        auth_token,
+        principal,
         space_slug,
         note_number,
         filename=file.filename or "unnamed",
@@ -132,8 +132,8 @@ async def upload_note_attachment(
         404: {"model": ErrorResponse, "description": "Space not found"},
     },
 )
-async def list_space_attachments(space_slug: str, app: AppDep, auth_token: AuthTokenDep) -> list[Attachment]:
-    return await app.list_space_attachments(auth_token, space_slug)
+async def list_space_attachments(space_slug: str, app: AppDep, principal: PrincipalDep) -> list[Attachment]:
+    return await app.list_space_attachments(principal, space_slug)
 
 
 @router.get(
@@ -147,8 +147,8 @@ async def list_space_attachments(space_slug: str, app: AppDep, auth_token: AuthT
         404: {"model": ErrorResponse, "description": "Space or note not found"},
     },
 )
-async def list_note_attachments(space_slug: str, note_number: int, app: AppDep, auth_token: AuthTokenDep) -> list[Attachment]:
-    return await app.list_note_attachments(auth_token, space_slug, note_number)
+async def list_note_attachments(space_slug: str, note_number: int, app: AppDep, principal: PrincipalDep) -> list[Attachment]:
+    return await app.list_note_attachments(principal, space_slug, note_number)
 
 
 @router.get(
@@ -170,7 +170,7 @@ async def list_note_attachments(space_slug: str, note_number: int, app: AppDep,
 async def download_pending_attachment(
     number: int,
     app: AppDep,
-    auth_token: AuthTokenDep,
+    principal: PrincipalDep,
     output_format: Annotated[str | None, Query(alias="format")] = None,
     option: str | None = None,
 ) -> Response:
@@ -179,10 +179,10 @@ async def download_pending_attachment(
 
     if output_format == "webp":
         options = parse_webp_option(option)
-        webp_data = await app.get_attachment_as_webp(auth_token, None, None, number, options)
+        webp_data = await app.get_attachment_as_webp(principal, None, None, number, options)
         return Response(content=webp_data, media_type="image/webp")
 
-    pending, content = await app.download_pending_attachment(auth_token, number)
+    pending, content = await app.download_pending_attachment(principal, number)
     return Response(
         content=content,
         media_type=pending.mime_type,
@@ -210,7 +210,7 @@ async def download_space_attachment(
     space_slug: str,
     number: int,
     app: AppDep,
-    auth_token: AuthTokenDep,
+    principal: PrincipalDep,
     output_format: Annotated[str | None, Query(alias="format")] = None,
     option: str | None = None,
 ) -> Response:
@@ -219,10 +219,10 @@ async def download_space_attachment(
 
     if output_format == "webp":
         options = parse_webp_option(option)
-        webp_data = await app.get_attachment_as_webp(auth_token, space_slug, None, number, options)
+        webp_data = await app.get_attachment_as_webp(principal, space_slug, None, number, options)
         return Response(content=webp_data, media_type="image/webp")
 
-    attachment, content = await app.download_space_attachment(auth_token, space_slug, number)
+    attachment, content = await app.download_space_attachment(principal, space_slug, number)
     return Response(
         content=content,
         media_type=attachment.mime_type,
@@ -251,7 +251,7 @@ async def download_note_attachment(
     note_number: int,
     number: int,
     app: AppDep,
-    auth_token: AuthTokenDep,
+    principal: PrincipalDep,
     output_format: Annotated[str | None, Query(alias="format")] = None,
     option: str | None = None,
 ) -> Response:
@@ -260,10 +260,10 @@ async def download_note_attachment(
 
     if output_format == "webp":
         options = parse_webp_option(option)
-        webp_data = await app.get_attachment_as_webp(auth_token, space_slug, note_number, number, options)
+        webp_data = await app.get_attachment_as_webp(principal, space_slug, note_number, number, options)
         return Response(content=webp_data, media_type="image/webp")
 
-    attachment, content = await app.download_note_attachment(auth_token, space_slug, note_number, number)
+    attachment, content = await app.download_note_attachment(principal, space_slug, note_number, number)
     return Response(
         content=content,
         media_type=attachment.mime_type,
@@ -1,7 +1,7 @@
-from fastapi import APIRouter, Response
+from fastapi import APIRouter, Request, Response
 from pydantic import BaseModel, Field
 
-from spacenote.web.deps import AppDep, AuthTokenDep
+from spacenote.web.deps import AppDep, PrincipalDep
 from spacenote.web.openapi import ErrorResponse
 
 router = APIRouter(tags=["auth"])
@@ -28,11 +28,13 @@ class LoginResponse(BaseModel):
     responses={
         200: {"description": "Successfully authenticated"},
         401: {"model": ErrorResponse, "description": "Invalid credentials"},
+        429: {"model": ErrorResponse, "description": "Too many login attempts in progress"},
     },
 )
-async def login(login_data: LoginRequest, app: AppDep, response: Response) -> LoginResponse:
+async def login(login_data: LoginRequest, app: AppDep, request: Request, response: Response) -> LoginResponse:
     """Authenticate user and create session."""
-    token = await app.login(login_data.username, login_data.password)
+    client_ip = request.client.host if request.client else None
+    token = await app.login(login_data.username, login_data.password, client_ip)
 
     response.set_cookie(
         key="token",
@@ -57,6 +59,6 @@ async def login(login_data: LoginRequest, app: AppDep, response: Response) -> Lo
         401: {"model": ErrorResponse, "description": "Not authenticated"},
     },
 )
-async def logout(app: AppDep, auth_token: AuthTokenDep, response: Response) -> None:
-    await app.logout(auth_token)
+async def logout(app: AppDep, principal: PrincipalDep, response: Response) -> None:
+    await app.logout(principal)
     response.delete_cookie("token")
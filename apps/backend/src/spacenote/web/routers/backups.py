@@ -2,7 +2,7 @@ from fastapi import APIRouter
 from fastapi.responses import FileResponse
 
 from spacenote.core.modules.backup.models import BackupInfo
-from spacenote.web.deps import AppDep, AuthTokenDep
+from spacenote.web.deps import AppDep, PrincipalDep
 from spacenote.web.openapi import ErrorResponse
 
 router = APIRouter(tags=["backup"])
@@ -20,8 +20,8 @@ router = APIRouter(tags=["backup"])
         403: {"model": ErrorResponse, "description": "System admin privileges required"},
     },
 )
-async def create_backup(app: AppDep, auth_token: AuthTokenDep) -> BackupInfo:
-    return await app.create_backup(auth_token)
+async def create_backup(app: AppDep, principal: PrincipalDep) -> BackupInfo:
+    return await app.create_backup(principal)
 
 
 @router.get(
@@ -35,8 +35,8 @@ async def create_backup(app: AppDep, auth_token: AuthTokenDep) -> BackupInfo:
         403: {"model": ErrorResponse, "description": "System admin privileges required"},
     },
 )
-async def list_backups(app: AppDep, auth_token: AuthTokenDep) -> list[BackupInfo]:
-    return await app.list_backups(auth_token)
+async def list_backups(app: AppDep, principal: PrincipalDep) -> list[BackupInfo]:
+    return await app.list_backups(principal)
 
 
 @router.get(
@@ -51,8 +51,8 @@ async def list_backups(app: AppDep, auth_token: AuthTokenDep) -> list[BackupInfo
         404: {"model": ErrorResponse, "description": "Backup not found"},
     },
 )
-async def download_backup(filename: str, app: AppDep, auth_token: AuthTokenDep) -> FileResponse:
-    path = await app.get_backup_path(auth_token, filename)
+async def download_backup(filename: str, app: AppDep, principal: PrincipalDep) -> FileResponse:
+    path = await app.get_backup_path(principal, filename)
     return FileResponse(path=path, media_type="application/gzip", filename=filename)
 
 
@@ -69,5 +69,5 @@ async def download_backup(filename: str, app: AppDep, auth_token: AuthTokenDep)
         404: {"model": ErrorResponse, "description": "Backup not found"},
     },
 )
-async def delete_backup(filename: str, app: AppDep, auth_token: AuthTokenDep) -> None:
-    await app.delete_backup(auth_token, filename)
+async def delete_backup(filename: str, app: AppDep, principal: PrincipalDep) -> None:
+    await app.delete_backup(principal, filename)
@@ -4,8 +4,8 @@ from fastapi import APIRouter, Query
 from pydantic import BaseModel, Field
 
 from spacenote.core.modules.comment.models import Comment
-from spacenote.core.pagination import PaginationResult
-from spacenote.web.deps import AppDep, AuthTokenDep
+from spacenote.core.pagination import PaginationResult, TotalMode
+from spacenote.web.deps import AppDep, PrincipalDep
 from spacenote.web.openapi import ErrorResponse
 
 router = APIRouter(tags=["comments"])
@@ -41,11 +41,15 @@ async def list_comments(
     space_slug: str,
     note_number: int,
     app: AppDep,
-    auth_token: AuthTokenDep,
+    principal: PrincipalDep,
     limit: Annotated[int, Query(ge=1, le=100, description="Maximum items to return")] = 50,
     offset: Annotated[int, Query(ge=0, description="Number of items to skip")] = 0,
+    total_mode: Annotated[
+        TotalMode,
+        Query(alias="total", description="Total count mode: exact, estimate (may lag recent writes) or none (skip)"),
+    ] = TotalMode.EXACT,
 ) -> PaginationResult[Comment]:
-    return await app.list_comments(auth_token, space_slug, note_number, limit, offset)
+    return await app.list_comments(principal, space_slug, note_number, limit, offset, total_mode)
 
 
 @router.get(
@@ -60,8 +64,8 @@ async def list_comments(
         404: {"model": ErrorResponse, "description": "Space, note, or comment not found"},
     },
 )
-async def get_comment(space_slug: str, note_number: int, number: int, app: AppDep, auth_token: AuthTokenDep) -> Comment:
-    return await app.get_comment(auth_token, space_slug, note_number, number)
+async def get_comment(space_slug: str, note_number: int, number: int, app: AppDep, principal: PrincipalDep) -> Comment:
+    return await app.get_comment(principal, space_slug, note_number, number)
 
 
 @router.post(
@@ -79,10 +83,10 @@ async def get_comment(space_slug: str, note_number: int, number: int, app: AppDe
     },
 )
 async def create_comment(
-    space_slug: str, note_number: int, request: CreateCommentRequest, app: AppDep, auth_token: AuthTokenDep
+    space_slug: str, note_number: int, request: CreateCommentRequest, app: AppDep, principal: PrincipalDep
 ) -> Comment:
     return await app.create_comment(
-        auth_token, space_slug, note_number, request.content, request.parent_number, request.raw_fields
+        principal, space_slug, note_number, request.content, request.parent_number, request.raw_fields
     )
 
 
@@ -99,9 +103,9 @@ async def create_comment(
     },
 )
 async def update_comment(
-    space_slug: str, note_number: int, number: int, request: UpdateCommentRequest, app: AppDep, auth_token: AuthTokenDep
+    space_slug: str, note_number: int, number: int, request: UpdateCommentRequest, app: AppDep, principal: PrincipalDep
 ) -> Comment:
-    return await app.update_comment(auth_token, space_slug, note_number, number, request.content)
+    return await app.update_comment(principal, space_slug, note_number, number, request.content)
 
 
 @router.delete(
@@ -117,5 +121,5 @@ async def update_comment(
         404: {"model": ErrorResponse, "description": "Space, note, or comment not found"},
     },
 )
-async def delete_comment(space_slug: str, note_number: int, number: int, app: AppDep, auth_token: AuthTokenDep) -> None:
-    await app.delete_comment(auth_token, space_slug, note_number, number)
+async def delete_comment(space_slug: str, note_number: int, number: int, app: AppDep, principal: PrincipalDep) -> None:
+    await app.delete_comment(principal, space_slug, note_number, number)
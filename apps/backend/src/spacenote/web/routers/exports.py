@@ -2,7 +2,7 @@ from fastapi import APIRouter
 
 from spacenote.core.modules.export.models import ExportData
 from spacenote.core.modules.space.models import Space
-from spacenote.web.deps import AppDep, AuthTokenDep
+from spacenote.web.deps import AppDep, PrincipalDep
 from spacenote.web.openapi import ErrorResponse
 
 router = APIRouter(tags=["export"])
@@ -23,10 +23,10 @@ router = APIRouter(tags=["export"])
 async def export_space(
     space_slug: str,
     app: AppDep,
-    auth_token: AuthTokenDep,
+    principal: PrincipalDep,
     include_data: bool = False,
 ) -> ExportData:
-    return await app.export_space(auth_token, space_slug, include_data)
+    return await app.export_space(principal, space_slug, include_data)
 
 
 @router.post(
@@ -44,7 +44,7 @@ async def export_space(
 )
 async def import_space(
     app: AppDep,
-    auth_token: AuthTokenDep,
+    principal: PrincipalDep,
     data: ExportData,
 ) -> Space:
-    return await app.import_space(auth_token, data)
+    return await app.import_space(principal, data)
@@ -4,7 +4,7 @@ from fastapi import APIRouter
 from pydantic import BaseModel, Field
 
 from spacenote.core.modules.field.models import FieldValueType, SpaceField
-from spacenote.web.deps import AppDep, AuthTokenDep
+from spacenote.web.deps import AppDep, PrincipalDep
 from spacenote.web.openapi import ErrorResponse
 
 router = APIRouter(tags=["fields"])
@@ -16,6 +16,12 @@ class UpdateFieldRequest(BaseModel):
     required: bool = Field(..., description="Whether this field is required")
     options: dict[str, Any] = Field(default_factory=dict, description="Field type-specific options")
     default: FieldValueType = Field(None, description="Default value for this field")
+    value_map: dict[str, str | None] | None = Field(
+        None, description="SELECT only: replace stored values on existing notes (old value → new value, null clears)"
+    )
+    clear_removed_values: bool = Field(
+        False, description="SELECT only: clear stored values that are no longer allowed and not in value_map"
+    )
 
 
 @router.post(
@@ -25,22 +31,28 @@ class UpdateFieldRequest(BaseModel):
     operation_id="addField",
     responses={
         200: {"description": "Returns validated field"},
-        400: {"model": ErrorResponse, "description": "Invalid field data or field name already exists"},
+        400: {
+            "model": ErrorResponse,
+            "description": "Invalid field data, field name already exists or is still being removed from notes",
+        },
         401: {"model": ErrorResponse, "description": "Not authenticated"},
         403: {"model": ErrorResponse, "description": "Space management permission required"},
         404: {"model": ErrorResponse, "description": "Space not found"},
     },
 )
-async def add_field(space_slug: str, field: SpaceField, app: AppDep, auth_token: AuthTokenDep) -> SpaceField:
+async def add_field(space_slug: str, field: SpaceField, app: AppDep, principal: PrincipalDep) -> SpaceField:
     """Add field to space (space admin only). Returns validated field."""
-    return await app.add_field(auth_token, space_slug, field)
+    return await app.add_field(principal, space_slug, field)
 
 
 @router.put(
     "/spaces/{space_slug}/fields/{field_name}",
     summary="Update field in space",
     description="Update a field's properties in a space. Requires 'all' permission in the space. "
-    "Only required, options, and default can be changed. Type and name cannot be modified.",
+    "Only required, options, and default can be changed. Type and name cannot be modified. "
+    "Existing notes are updated by background migration jobs: NUMERIC values are converted to the new kind, "
+    "SELECT values are replaced or cleared only as requested by value_map / clear_removed_values, "
+    "empty values get a new static default (also after values were cleared).",
     operation_id="updateField",
     responses={
         200: {"description": "Returns updated field"},
@@ -55,23 +67,26 @@ async def update_field(
     field_name: str,
     update_data: UpdateFieldRequest,
     app: AppDep,
-    auth_token: AuthTokenDep,
+    principal: PrincipalDep,
 ) -> SpaceField:
     """Update field in space (space admin only). Returns validated field."""
     return await app.update_field(
-        auth_token,
+        principal,
         space_slug,
         field_name,
         update_data.required,
         update_data.options,
         update_data.default,
+        update_data.value_map,
+        clear_removed_values=update_data.clear_removed_values,
     )
 
 
 @router.delete(
     "/spaces/{space_slug}/fields/{field_name}",
     summary="Remove field from space",
-    description="Remove a field definition from a space. Requires 'all' permission in the space.",
+    description="Remove a field definition from a space. Values stored on existing notes are removed by a "
+    "background migration job. Requires 'all' permission in the space.",
     operation_id="removeField",
     status_code=204,
     responses={
@@ -81,6 +96,6 @@ async def update_field(
         404: {"model": ErrorResponse, "description": "Space or field not found"},
     },
 )
-async def remove_field(space_slug: str, field_name: str, app: AppDep, auth_token: AuthTokenDep) -> None:
+async def remove_field(space_slug: str, field_name: str, app: AppDep, principal: PrincipalDep) -> None:
     """Remove field from space (space admin only)."""
-    await app.remove_field(auth_token, space_slug, field_name)
+    await app.remove_field(principal, space_slug, field_name)
@@ -1,7 +1,7 @@
 from fastapi import APIRouter
 
 from spacenote.core.modules.filter.models import Filter
-from spacenote.web.deps import AppDep, AuthTokenDep
+from spacenote.web.deps import AppDep, PrincipalDep
 from spacenote.web.openapi import ErrorResponse
 
 router = APIRouter(tags=["filters"])
@@ -20,9 +20,9 @@ router = APIRouter(tags=["filters"])
         404: {"model": ErrorResponse, "description": "Space not found"},
     },
 )
-async def add_filter(space_slug: str, filter: Filter, app: AppDep, auth_token: AuthTokenDep) -> Filter:
+async def add_filter(space_slug: str, filter: Filter, app: AppDep, principal: PrincipalDep) -> Filter:
     """Add filter to space (space admin only). Returns validated filter."""
-    return await app.add_filter(auth_token, space_slug, filter)
+    return await app.add_filter(principal, space_slug, filter)
 
 
 @router.put(
@@ -40,9 +40,9 @@ async def add_filter(space_slug: str, filter: Filter, app: AppDep, auth_token: A
         404: {"model": ErrorResponse, "description": "Space or filter not found"},
     },
 )
-async def update_filter(space_slug: str, filter_name: str, filter: Filter, app: AppDep, auth_token: AuthTokenDep) -> Filter:
+async def update_filter(space_slug: str, filter_name: str, filter: Filter, app: AppDep, principal: PrincipalDep) -> Filter:
     """Update filter in space (space admin only). Returns validated filter."""
-    return await app.update_filter(auth_token, space_slug, filter_name, filter)
+    return await app.update_filter(principal, space_slug, filter_name, filter)
 
 
 @router.delete(
@@ -58,6 +58,6 @@ async def update_filter(space_slug: str, filter_name: str, filter: Filter, app:
         404: {"model": ErrorResponse, "description": "Space or filter not found"},
     },
 )
-async def remove_filter(space_slug: str, filter_name: str, app: AppDep, auth_token: AuthTokenDep) -> None:
+async def remove_filter(space_slug: str, filter_name: str, app: AppDep, principal: PrincipalDep) -> None:
     """Remove filter from space (space admin only)."""
-    await app.remove_filter(auth_token, space_slug, filter_name)
+    await app.remove_filter(principal, space_slug, filter_name)
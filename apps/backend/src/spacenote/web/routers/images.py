@@ -1,7 +1,7 @@
 from fastapi import APIRouter
 from fastapi.responses import FileResponse
 
-from spacenote.web.deps import AppDep, AuthTokenDep
+from spacenote.web.deps import AppDep, PrincipalDep
 from spacenote.web.openapi import ErrorResponse
 
 router = APIRouter(tags=["images"])
@@ -21,7 +21,7 @@ router = APIRouter(tags=["images"])
     },
 )
 async def download_image(
-    space_slug: str, note_number: int, field_name: str, app: AppDep, auth_token: AuthTokenDep
+    space_slug: str, note_number: int, field_name: str, app: AppDep, principal: PrincipalDep
 ) -> FileResponse:
-    path = await app.get_image_path(auth_token, space_slug, note_number, field_name)
+    path = await app.get_image_path(principal, space_slug, note_number, field_name)
     return FileResponse(path=path, media_type="image/webp")
@@ -1,7 +1,7 @@
 from fastapi import APIRouter
 
 from spacenote.core.modules.log.models import ErrorLog
-from spacenote.web.deps import AppDep, AuthTokenDep
+from spacenote.web.deps import AppDep, PrincipalDep
 from spacenote.web.openapi import ErrorResponse
 
 router = APIRouter(tags=["logs"])
@@ -18,5 +18,5 @@ router = APIRouter(tags=["logs"])
         403: {"model": ErrorResponse, "description": "System admin privileges required"},
     },
 )
-async def get_error_log(app: AppDep, auth_token: AuthTokenDep) -> ErrorLog:
-    return await app.get_error_log(auth_token)
+async def get_error_log(app: AppDep, principal: PrincipalDep) -> ErrorLog:
+    return await app.get_error_log(principal)
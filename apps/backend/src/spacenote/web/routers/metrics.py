@@ -0,0 +1,38 @@
+from fastapi import APIRouter
+
+from spacenote.core.modules.template.models import TemplateRenderStats
+from spacenote.core.modules.user.models import PasswordHashingStats
+from spacenote.web.deps import AppDep, PrincipalDep
+from spacenote.web.openapi import ErrorResponse
+
+router = APIRouter(tags=["metrics"])
+
+
+@router.get(
+    "/admin/metrics/templates",
+    summary="Get template render metrics",
+    description="Render duration histograms and aborted renders per space template since server start (admin only).",
+    operation_id="getTemplateRenderStats",
+    responses={
+        200: {"description": "Render statistics per space template"},
+        401: {"model": ErrorResponse, "description": "Not authenticated"},
+        403: {"model": ErrorResponse, "description": "System admin privileges required"},
+    },
+)
+async def get_template_render_stats(app: AppDep, principal: PrincipalDep) -> list[TemplateRenderStats]:
+    return await app.get_template_render_stats(principal)
+
+
+@router.get(
+    "/admin/metrics/passwords",
+    summary="Get password hashing metrics",
+    description="bcrypt cost, hashing durations and login admission counters since server start (admin only).",
+    operation_id="getPasswordHashingStats",
+    responses={
+        200: {"description": "Password hashing statistics"},
+        401: {"model": ErrorResponse, "description": "Not authenticated"},
+        403: {"model": ErrorResponse, "description": "System admin privileges required"},
+    },
+)
+async def get_password_hashing_stats(app: AppDep, principal: PrincipalDep) -> PasswordHashingStats:
+    return await app.get_password_hashing_stats(principal)
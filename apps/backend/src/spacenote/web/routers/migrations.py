@@ -0,0 +1,68 @@
+from typing import Annotated
+
+from fastapi import APIRouter, Query
+
+from spacenote.core.modules.migration.models import MigrationJob, MigrationJobStatus
+from spacenote.core.pagination import PaginationResult
+from spacenote.web.deps import AppDep, PrincipalDep
+from spacenote.web.openapi import ErrorResponse
+
+router = APIRouter(tags=["migrations"])
+
+
+@router.get(
+    "/spaces/{space_slug}/migrations",
+    summary="List migration jobs",
+    description="Get migration jobs of a space, newest first. Jobs are queued when fields are removed or their "
+    "options or default change, and update existing notes in the background. Requires 'all' permission in the space.",
+    operation_id="listMigrationJobs",
+    responses={
+        200: {"description": "Paginated list of migration jobs with progress"},
+        401: {"model": ErrorResponse, "description": "Not authenticated"},
+        403: {"model": ErrorResponse, "description": "Space management permission required"},
+        404: {"model": ErrorResponse, "description": "Space not found"},
+    },
+)
+async def list_migration_jobs(
+    space_slug: str,
+    app: AppDep,
+    principal: PrincipalDep,
+    status: Annotated[MigrationJobStatus | None, Query(description="Filter by status")] = None,
+    limit: Annotated[int, Query(ge=1, le=100, description="Maximum items to return")] = 50,
+    offset: Annotated[int, Query(ge=0, description="Number of items to skip")] = 0,
+) -> PaginationResult[MigrationJob]:
+    return await app.list_migration_jobs(principal, space_slug, status, limit, offset)
+
+
+@router.get(
+    "/spaces/{space_slug}/migrations/{number}",
+    summary="Get migration job",
+    description="Get a single migration job with its progress. Requires 'all' permission in the space.",
+    operation_id="getMigrationJob",
+    responses={
+        200: {"description": "Migration job details"},
+        401: {"model": ErrorResponse, "description": "Not authenticated"},
+        403: {"model": ErrorResponse, "description": "Space management permission required"},
+        404: {"model": ErrorResponse, "description": "Space or job not found"},
+    },
+)
+async def get_migration_job(space_slug: str, number: int, app: AppDep, principal: PrincipalDep) -> MigrationJob:
+    return await app.get_migration_job(principal, space_slug, number)
+
+
+@router.post(
+    "/spaces/{space_slug}/migrations/{number}/retry",
+    summary="Retry migration job",
+    description="Requeue a failed migration job. It continues after the last note processed before the failure. "
+    "Only `failed` jobs can be retried. Requires 'all' permission in the space.",
+    operation_id="retryMigrationJob",
+    responses={
+        200: {"description": "Requeued migration job"},
+        400: {"model": ErrorResponse, "description": "Job is not failed"},
+        401: {"model": ErrorResponse, "description": "Not authenticated"},
+        403: {"model": ErrorResponse, "description": "Space management permission required"},
+        404: {"model": ErrorResponse, "description": "Space or job not found"},
+    },
+)
+async def retry_migration_job(space_slug: str, number: int, app: AppDep, principal: PrincipalDep) -> MigrationJob:
+    return await app.retry_migration_job(principal, space_slug, number)
@@ -1,12 +1,14 @@
+from collections.abc import AsyncIterator
 from typing import Annotated
 
 from fastapi import APIRouter, Query
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
 
-from spacenote.core.modules.note.models import Note
-from spacenote.core.pagination import PaginationResult
+from spacenote.core.modules.note.models import FacetBucket, Note
+from spacenote.core.pagination import CursorPaginationResult, TotalMode
 from spacenote.core.schema import OpenAPIModel
-from spacenote.web.deps import AppDep, AuthTokenDep
+from spacenote.web.deps import AppDep, PrincipalDep
 from spacenote.web.openapi import ErrorResponse
 
 router = APIRouter(tags=["notes"])
@@ -50,6 +52,7 @@ class TransferNoteResponse(OpenAPIModel):
     operation_id="listNotes",
     responses={
         200: {"description": "Paginated list of notes"},
+        400: {"model": ErrorResponse, "description": "Invalid filter, query or cursor"},
         401: {"model": ErrorResponse, "description": "Not authenticated"},
         403: {"model": ErrorResponse, "description": "Not a member of this space"},
         404: {"model": ErrorResponse, "description": "Space not found"},
@@ -58,15 +61,116 @@ class TransferNoteResponse(OpenAPIModel):
 async def list_notes(
     space_slug: str,
     app: AppDep,
-    auth_token: AuthTokenDep,
+    principal: PrincipalDep,
     filter_name: Annotated[
         str | None, Query(alias="filter", description="Filter name to apply. If not provided, uses space's default_filter")
     ] = None,
     q: Annotated[str | None, Query(description="Adhoc query string")] = None,
     limit: Annotated[int, Query(ge=1, le=100, description="Maximum items to return")] = 50,
     offset: Annotated[int, Query(ge=0, description="Number of items to skip")] = 0,
-) -> PaginationResult[Note]:
-    return await app.list_notes(auth_token, space_slug, filter_name, q, limit, offset)
+    cursor: Annotated[
+        str | None, Query(description="Keyset cursor from a previous page's next_cursor (use instead of offset)")
+    ] = None,
+    total_mode: Annotated[
+        TotalMode,
+        Query(alias="total", description="Total count mode: exact, estimate (may lag recent writes) or none (skip)"),
+    ] = TotalMode.EXACT,
+    columns_only: Annotated[
+        bool, Query(description="Return only the filter's columns and sort fields (plus system fields and title)")
+    ] = False,
+    excerpt_length: Annotated[
+        int | None, Query(alias="excerpt", ge=1, le=10000, description="Truncate long text fields to this many characters")
+    ] = None,
+) -> CursorPaginationResult[Note]:
+    return await app.list_notes(
+        principal, space_slug, filter_name, q, limit, offset, cursor, total_mode, columns_only, excerpt_length
+    )
+
+
+@router.get(
+    "/spaces/{space_slug}/notes/stream",
+    summary="Stream filtered notes",
+    description="Stream all notes matching a filter as newline-delimited JSON (one Note per line), "
+    "in the filter's sort order and without a size limit. Only space members can view notes.",
+    operation_id="streamNotes",
+    response_class=StreamingResponse,
+    responses={
+        200: {"description": "Notes as NDJSON", "content": {"application/x-ndjson": {}}},
+        400: {"model": ErrorResponse, "description": "Invalid filter or query"},
+        401: {"model": ErrorResponse, "description": "Not authenticated"},
+        403: {"model": ErrorResponse, "description": "Not a member of this space"},
+        404: {"model": ErrorResponse, "description": "Space or filter not found"},
+    },
+)
+async def stream_notes(
+    space_slug: str,
+    app: AppDep,
+    principal: PrincipalDep,
+    filter_name: Annotated[
+        str | None, Query(alias="filter", description="Filter to apply. If not provided, uses space's default_filter")
+    ] = None,
+    q: Annotated[str | None, Query(description="Adhoc query string")] = None,
+) -> StreamingResponse:
+    chunks = await app.stream_notes(principal, space_slug, filter_name, q)
+    return StreamingResponse(_to_ndjson(chunks), media_type="application/x-ndjson")
+
+
+async def _to_ndjson(chunks: AsyncIterator[list[Note]]) -> AsyncIterator[str]:
+    """Serialize note chunks to NDJSON, one write per chunk."""
+    async for notes in chunks:
+        yield "".join(note.model_dump_json() + "\n" for note in notes)
+
+
+@router.get(
+    "/spaces/{space_slug}/notes/facets",
+    summary="Count notes per field value",
+    description="Count notes matching a filter per value of SELECT, TAGS and USER fields. "
+    "Returns up to 100 most frequent values per field. Only space members can view notes.",
+    operation_id="getNoteFacets",
+    responses={
+        200: {"description": "Value counts keyed by field name"},
+        400: {"model": ErrorResponse, "description": "Invalid facet field, filter or query"},
+        401: {"model": ErrorResponse, "description": "Not authenticated"},
+        403: {"model": ErrorResponse, "description": "Not a member of this space"},
+        404: {"model": ErrorResponse, "description": "Space or filter not found"},
+    },
+)
+async def get_note_facets(
+    space_slug: str,
+    app: AppDep,
+    principal: PrincipalDep,
+    field_names: Annotated[
+        list[str], Query(alias="field", description="Field to count (note.author or note.fields.{name}), repeatable")
+    ],
+    filter_name: Annotated[
+        str | None, Query(alias="filter", description="Filter to apply. If not provided, uses space's default_filter")
+    ] = None,
+    q: Annotated[str | None, Query(description="Adhoc query string")] = None,
+) -> dict[str, list[FacetBucket]]:
+    return await app.get_note_facets(principal, space_slug, field_names, filter_name, q)
+
+
+@router.get(
+    "/spaces/{space_slug}/notes/batch",
+    summary="Get notes by numbers",
+    description="Get up to 300 notes of a space in one request, in the order of the given numbers. "
+    "Numbers without a note are skipped. Only space members can view notes.",
+    operation_id="getNotesByNumbers",
+    responses={
+        200: {"description": "Found notes"},
+        400: {"model": ErrorResponse, "description": "Too many note numbers"},
+        401: {"model": ErrorResponse, "description": "Not authenticated"},
+        403: {"model": ErrorResponse, "description": "Not a member of this space"},
+        404: {"model": ErrorResponse, "description": "Space not found"},
+    },
+)
+async def get_notes_by_numbers(
+    space_slug: str,
+    app: AppDep,
+    principal: PrincipalDep,
+    numbers: Annotated[list[int], Query(alias="number", description="Note number, repeatable")],
+) -> list[Note]:
+    return await app.get_notes_by_numbers(principal, space_slug, numbers)
 
 
 @router.get(
@@ -81,8 +185,8 @@ async def list_notes(
         404: {"model": ErrorResponse, "description": "Space or note not found"},
     },
 )
-async def get_note(space_slug: str, number: int, app: AppDep, auth_token: AuthTokenDep) -> Note:
-    return await app.get_note(auth_token, space_slug, number)
+async def get_note(space_slug: str, number: int, app: AppDep, principal: PrincipalDep) -> Note:
+    return await app.get_note(principal, space_slug, number)
 
 
 @router.post(
@@ -99,8 +203,8 @@ async def get_note(space_slug: str, number: int, app: AppDep, auth_token: AuthTo
         404: {"model": ErrorResponse, "description": "Space not found"},
     },
 )
-async def create_note(space_slug: str, request: CreateNoteRequest, app: AppDep, auth_token: AuthTokenDep) -> Note:
-    return await app.create_note(auth_token, space_slug, request.raw_fields)
+async def create_note(space_slug: str, request: CreateNoteRequest, app: AppDep, principal: PrincipalDep) -> Note:
+    return await app.create_note(principal, space_slug, request.raw_fields)
 
 
 @router.patch(
@@ -116,8 +220,8 @@ async def create_note(space_slug: str, request: CreateNoteRequest, app: AppDep,
         404: {"model": ErrorResponse, "description": "Space or note not found"},
     },
 )
-async def update_note(space_slug: str, number: int, request: UpdateNoteRequest, app: AppDep, auth_token: AuthTokenDep) -> Note:
-    return await app.update_note(auth_token, space_slug, number, request.raw_fields)
+async def update_note(space_slug: str, number: int, request: UpdateNoteRequest, app: AppDep, principal: PrincipalDep) -> Note:
+    return await app.update_note(principal, space_slug, number, request.raw_fields)
 
 
 @router.post(
@@ -134,7 +238,7 @@ async def update_note(space_slug: str, number: int, request: UpdateNoteRequest,
     },
 )
 async def transfer_note(
-    space_slug: str, number: int, request: TransferNoteRequest, app: AppDep, auth_token: AuthTokenDep
+    space_slug: str, number: int, request: TransferNoteRequest, app: AppDep, principal: PrincipalDep
 ) -> TransferNoteResponse:
-    note = await app.transfer_note(auth_token, space_slug, number, request.target_space)
+    note = await app.transfer_note(principal, space_slug, number, request.target_space)
     return TransferNoteResponse(space_slug=note.space_slug, number=note.number)
@@ -2,7 +2,7 @@ from fastapi import APIRouter
 from pydantic import BaseModel, Field
 
 from spacenote.core.modules.user.models import UserView
-from spacenote.web.deps import AppDep, AuthTokenDep
+from spacenote.web.deps import AppDep, PrincipalDep
 from spacenote.web.openapi import ErrorResponse
 
 router = APIRouter(tags=["profile"])
@@ -25,9 +25,9 @@ class ChangePasswordRequest(BaseModel):
         401: {"model": ErrorResponse, "description": "Not authenticated"},
     },
 )
-async def get_profile(app: AppDep, auth_token: AuthTokenDep) -> UserView:
+async def get_profile(app: AppDep, principal: PrincipalDep) -> UserView:
     """Get current authenticated user profile."""
-    return await app.get_current_user(auth_token)
+    return await app.get_current_user(principal)
 
 
 @router.post(
@@ -42,6 +42,6 @@ async def get_profile(app: AppDep, auth_token: AuthTokenDep) -> UserView:
         401: {"model": ErrorResponse, "description": "Not authenticated or invalid current password"},
     },
 )
-async def change_password(request: ChangePasswordRequest, app: AppDep, auth_token: AuthTokenDep) -> None:
+async def change_password(request: ChangePasswordRequest, app: AppDep, principal: PrincipalDep) -> None:
     """Change password for the current authenticated user."""
-    await app.change_password(auth_token, request.old_password, request.new_password)
+    await app.change_password(principal, request.old_password, request.new_password)
@@ -3,7 +3,7 @@ from pydantic import BaseModel, Field
 
 from spacenote.core.modules.space.models import Member, Space
 from spacenote.utils import SLUG_RE
-from spacenote.web.deps import AppDep, AuthTokenDep
+from spacenote.web.deps import AppDep, PrincipalDep
 from spacenote.web.openapi import ErrorResponse
 
 router = APIRouter(tags=["spaces"])
@@ -78,9 +78,9 @@ class UpdateDefaultFilterRequest(BaseModel):
         401: {"model": ErrorResponse, "description": "Not authenticated"},
     },
 )
-async def list_spaces(app: AppDep, auth_token: AuthTokenDep) -> list[Space]:
+async def list_spaces(app: AppDep, principal: PrincipalDep) -> list[Space]:
     """List spaces based on user role."""
-    return await app.list_spaces(auth_token)
+    return await app.list_spaces(principal)
 
 
 @router.get(
@@ -94,9 +94,9 @@ async def list_spaces(app: AppDep, auth_token: AuthTokenDep) -> list[Space]:
         403: {"model": ErrorResponse, "description": "System admin privileges required"},
     },
 )
-async def list_all_spaces(app: AppDep, auth_token: AuthTokenDep) -> list[Space]:
+async def list_all_spaces(app: AppDep, principal: PrincipalDep) -> list[Space]:
     """List all spaces (system admin only)."""
-    return await app.list_all_spaces(auth_token)
+    return await app.list_all_spaces(principal)
 
 
 @router.post(
@@ -111,9 +111,9 @@ async def list_all_spaces(app: AppDep, auth_token: AuthTokenDep) -> list[Space]:
         404: {"model": ErrorResponse, "description": "Space not found"},
     },
 )
-async def admin_join_space(slug: str, app: AppDep, auth_token: AuthTokenDep) -> Space:
+async def admin_join_space(slug: str, app: AppDep, principal: PrincipalDep) -> Space:
     """System admin joins a space with 'all' permission."""
-    return await app.admin_join_space(auth_token, slug)
+    return await app.admin_join_space(principal, slug)
 
 
 @router.delete(
@@ -128,9 +128,9 @@ async def admin_join_space(slug: str, app: AppDep, auth_token: AuthTokenDep) ->
         404: {"model": ErrorResponse, "description": "Space not found"},
     },
 )
-async def admin_leave_space(slug: str, app: AppDep, auth_token: AuthTokenDep) -> Space:
+async def admin_leave_space(slug: str, app: AppDep, principal: PrincipalDep) -> Space:
     """System admin leaves a space."""
-    return await app.admin_leave_space(auth_token, slug)
+    return await app.admin_leave_space(principal, slug)
 
 
 @router.post(
@@ -145,10 +145,10 @@ async def admin_leave_space(slug: str, app: AppDep, auth_token: AuthTokenDep) ->
         401: {"model": ErrorResponse, "description": "Not authenticated"},
     },
 )
-async def create_space(create_data: CreateSpaceRequest, app: AppDep, auth_token: AuthTokenDep) -> Space:
+async def create_space(create_data: CreateSpaceRequest, app: AppDep, principal: PrincipalDep) -> Space:
     """Create new space (any authenticated user)."""
     return await app.create_space(
-        auth_token,
+        principal,
         create_data.slug,
         create_data.title,
         create_data.description,
@@ -171,9 +171,9 @@ async def create_space(create_data: CreateSpaceRequest, app: AppDep, auth_token:
         404: {"model": ErrorResponse, "description": "Space not found"},
     },
 )
-async def update_space_title(slug: str, update_data: UpdateTitleRequest, app: AppDep, auth_token: AuthTokenDep) -> Space:
+async def update_space_title(slug: str, update_data: UpdateTitleRequest, app: AppDep, principal: PrincipalDep) -> Space:
     """Update space title (space admin only)."""
-    return await app.update_space_title(auth_token, slug, update_data.title)
+    return await app.update_space_title(principal, slug, update_data.title)
 
 
 @router.patch(
@@ -190,10 +190,10 @@ async def update_space_title(slug: str, update_data: UpdateTitleRequest, app: Ap
     },
 )
 async def update_space_description(
-    slug: str, update_data: UpdateDescriptionRequest, app: AppDep, auth_token: AuthTokenDep
+    slug: str, update_data: UpdateDescriptionRequest, app: AppDep, principal: PrincipalDep
 ) -> Space:
     """Update space description (space admin only)."""
-    return await app.update_space_description(auth_token, slug, update_data.description)
+    return await app.update_space_description(principal, slug, update_data.description)
 
 
 @router.patch(
@@ -209,9 +209,9 @@ async def update_space_description(
         404: {"model": ErrorResponse, "description": "Space not found"},
     },
 )
-async def update_space_members(slug: str, update_data: UpdateMembersRequest, app: AppDep, auth_token: AuthTokenDep) -> Space:
+async def update_space_members(slug: str, update_data: UpdateMembersRequest, app: AppDep, principal: PrincipalDep) -> Space:
     """Update space members (space admin only)."""
-    return await app.update_space_members(auth_token, slug, update_data.members)
+    return await app.update_space_members(principal, slug, update_data.members)
 
 
 @router.patch(
@@ -228,10 +228,10 @@ async def update_space_members(slug: str, update_data: UpdateMembersRequest, app
     },
 )
 async def update_space_hidden_fields_on_create(
-    slug: str, update_data: UpdateHiddenFieldsOnCreateRequest, app: AppDep, auth_token: AuthTokenDep
+    slug: str, update_data: UpdateHiddenFieldsOnCreateRequest, app: AppDep, principal: PrincipalDep
 ) -> Space:
     """Update hidden fields on create (space admin only)."""
-    return await app.update_hidden_fields_on_create(auth_token, slug, update_data.hidden_fields_on_create)
+    return await app.update_hidden_fields_on_create(principal, slug, update_data.hidden_fields_on_create)
 
 
 @router.patch(
@@ -248,10 +248,10 @@ async def update_space_hidden_fields_on_create(
     },
 )
 async def update_space_editable_fields_on_comment(
-    slug: str, update_data: UpdateEditableFieldsOnCommentRequest, app: AppDep, auth_token: AuthTokenDep
+    slug: str, update_data: UpdateEditableFieldsOnCommentRequest, app: AppDep, principal: PrincipalDep
 ) -> Space:
     """Update editable fields on comment (space admin only)."""
-    return await app.update_editable_fields_on_comment(auth_token, slug, update_data.editable_fields_on_comment)
+    return await app.update_editable_fields_on_comment(principal, slug, update_data.editable_fields_on_comment)
 
 
 @router.patch(
@@ -268,10 +268,10 @@ async def update_space_editable_fields_on_comment(
     },
 )
 async def update_space_default_filter(
-    slug: str, update_data: UpdateDefaultFilterRequest, app: AppDep, auth_token: AuthTokenDep
+    slug: str, update_data: UpdateDefaultFilterRequest, app: AppDep, principal: PrincipalDep
 ) -> Space:
     """Update default filter (space admin only)."""
-    return await app.update_default_filter(auth_token, slug, update_data.default_filter)
+    return await app.update_default_filter(principal, slug, update_data.default_filter)
 
 
 @router.patch(
@@ -288,10 +288,10 @@ async def update_space_default_filter(
     },
 )
 async def update_space_can_transfer_to(
-    slug: str, update_data: UpdateCanTransferToRequest, app: AppDep, auth_token: AuthTokenDep
+    slug: str, update_data: UpdateCanTransferToRequest, app: AppDep, principal: PrincipalDep
 ) -> Space:
     """Update can_transfer_to (space admin only)."""
-    return await app.update_can_transfer_to(auth_token, slug, update_data.can_transfer_to)
+    return await app.update_can_transfer_to(principal, slug, update_data.can_transfer_to)
 
 
 @router.patch(
@@ -307,9 +307,9 @@ async def update_space_can_transfer_to(
         404: {"model": ErrorResponse, "description": "Space not found"},
     },
 )
-async def rename_space_slug(slug: str, update_data: RenameSlugRequest, app: AppDep, auth_token: AuthTokenDep) -> Space:
+async def rename_space_slug(slug: str, update_data: RenameSlugRequest, app: AppDep, principal: PrincipalDep) -> Space:
     """Rename space slug (space admin only)."""
-    return await app.rename_space_slug(auth_token, slug, update_data.new_slug)
+    return await app.rename_space_slug(principal, slug, update_data.new_slug)
 
 
 @router.delete(
@@ -325,6 +325,6 @@ async def rename_space_slug(slug: str, update_data: RenameSlugRequest, app: AppD
         404: {"model": ErrorResponse, "description": "Space not found"},
     },
 )
-async def delete_space(slug: str, app: AppDep, auth_token: AuthTokenDep) -> None:
+async def delete_space(slug: str, app: AppDep, principal: PrincipalDep) -> None:
     """Delete space (space admin only)."""
-    await app.delete_space(auth_token, slug)
+    await app.delete_space(principal, slug)
@@ -12,7 +12,7 @@ from spacenote.core.modules.telegram.models import (
     TelegramTestResult,
 )
 from spacenote.core.pagination import PaginationResult
-from spacenote.web.deps import AppDep, AuthTokenDep
+from spacenote.web.deps import AppDep, PrincipalDep
 from spacenote.web.openapi import ErrorResponse
 
 router = APIRouter(tags=["telegram"])
@@ -50,9 +50,9 @@ class TestChannelRequest(BaseModel):
         404: {"model": ErrorResponse, "description": "Space not found"},
     },
 )
-async def set_activity_channel(space_slug: str, body: SetActivityChannelRequest, app: AppDep, auth_token: AuthTokenDep) -> Space:
+async def set_activity_channel(space_slug: str, body: SetActivityChannelRequest, app: AppDep, principal: PrincipalDep) -> Space:
     """Set or clear the activity channel."""
-    return await app.set_activity_channel(auth_token, space_slug, body.channel)
+    return await app.set_activity_channel(principal, space_slug, body.channel)
 
 
 @router.post(
@@ -72,9 +72,9 @@ async def set_activity_channel(space_slug: str, body: SetActivityChannelRequest,
         404: {"model": ErrorResponse, "description": "Space not found"},
     },
 )
-async def enable_mirror(space_slug: str, body: EnableMirrorRequest, app: AppDep, auth_token: AuthTokenDep) -> Space:
+async def enable_mirror(space_slug: str, body: EnableMirrorRequest, app: AppDep, principal: PrincipalDep) -> Space:
     """Enable the mirror channel."""
-    return await app.enable_mirror(auth_token, space_slug, body.channel)
+    return await app.enable_mirror(principal, space_slug, body.channel)
 
 
 @router.delete(
@@ -92,9 +92,9 @@ async def enable_mirror(space_slug: str, body: EnableMirrorRequest, app: AppDep,
         404: {"model": ErrorResponse, "description": "Space not found"},
     },
 )
-async def disable_mirror(space_slug: str, app: AppDep, auth_token: AuthTokenDep) -> Space:
+async def disable_mirror(space_slug: str, app: AppDep, principal: PrincipalDep) -> Space:
     """Disable the mirror channel."""
-    return await app.disable_mirror(auth_token, space_slug)
+    return await app.disable_mirror(principal, space_slug)
 
 
 @router.post(
@@ -116,10 +116,10 @@ async def disable_mirror(space_slug: str, app: AppDep, auth_token: AuthTokenDep)
     },
 )
 async def test_telegram_channel(
-    space_slug: str, body: TestChannelRequest, app: AppDep, auth_token: AuthTokenDep
+    space_slug: str, body: TestChannelRequest, app: AppDep, principal: PrincipalDep
 ) -> TelegramTestResult:
     """Probe bot → channel connectivity by sending a test message."""
-    return await app.test_telegram_channel(auth_token, space_slug, body.channel)
+    return await app.test_telegram_channel(principal, space_slug, body.channel)
 
 
 @router.get(
@@ -135,14 +135,14 @@ async def test_telegram_channel(
 )
 async def list_telegram_tasks(
     app: AppDep,
-    auth_token: AuthTokenDep,
+    principal: PrincipalDep,
     space_slug: Annotated[str | None, Query(description="Filter by space slug")] = None,
     task_type: Annotated[TelegramTaskType | None, Query(description="Filter by task type")] = None,
     status: Annotated[TelegramTaskStatus | None, Query(description="Filter by status")] = None,
     limit: Annotated[int, Query(ge=1, le=100, description="Maximum items to return")] = 50,
     offset: Annotated[int, Query(ge=0, description="Number of items to skip")] = 0,
 ) -> PaginationResult[TelegramTask]:
-    return await app.list_telegram_tasks(auth_token, space_slug, task_type, status, limit, offset)
+    return await app.list_telegram_tasks(principal, space_slug, task_type, status, limit, offset)
 
 
 @router.get(
@@ -157,8 +157,8 @@ async def list_telegram_tasks(
         404: {"model": ErrorResponse, "description": "Task not found"},
     },
 )
-async def get_telegram_task(space_slug: str, number: int, app: AppDep, auth_token: AuthTokenDep) -> TelegramTask:
-    return await app.get_telegram_task(auth_token, space_slug, number)
+async def get_telegram_task(space_slug: str, number: int, app: AppDep, principal: PrincipalDep) -> TelegramTask:
+    return await app.get_telegram_task(principal, space_slug, number)
 
 
 @router.post(
@@ -178,8 +178,8 @@ async def get_telegram_task(space_slug: str, number: int, app: AppDep, auth_toke
         404: {"model": ErrorResponse, "description": "Task not found"},
     },
 )
-async def reset_telegram_task(space_slug: str, number: int, app: AppDep, auth_token: AuthTokenDep) -> TelegramTask:
-    return await app.reset_telegram_task(auth_token, space_slug, number)
+async def reset_telegram_task(space_slug: str, number: int, app: AppDep, principal: PrincipalDep) -> TelegramTask:
+    return await app.reset_telegram_task(principal, space_slug, number)
 
 
 @router.get(
@@ -195,12 +195,12 @@ async def reset_telegram_task(space_slug: str, number: int, app: AppDep, auth_to
 )
 async def list_telegram_mirrors(
     app: AppDep,
-    auth_token: AuthTokenDep,
+    principal: PrincipalDep,
     space_slug: Annotated[str | None, Query(description="Filter by space slug")] = None,
     limit: Annotated[int, Query(ge=1, le=100, description="Maximum items to return")] = 50,
     offset: Annotated[int, Query(ge=0, description="Number of items to skip")] = 0,
 ) -> PaginationResult[TelegramMirror]:
-    return await app.list_telegram_mirrors(auth_token, space_slug, limit, offset)
+    return await app.list_telegram_mirrors(principal, space_slug, limit, offset)
 
 
 @router.get(
@@ -215,5 +215,5 @@ async def list_telegram_mirrors(
         404: {"model": ErrorResponse, "description": "Mirror not found"},
     },
 )
-async def get_telegram_mirror(space_slug: str, note_number: int, app: AppDep, auth_token: AuthTokenDep) -> TelegramMirror:
-    return await app.get_telegram_mirror(auth_token, space_slug, note_number)
+async def get_telegram_mirror(space_slug: str, note_number: int, app: AppDep, principal: PrincipalDep) -> TelegramMirror:
+    return await app.get_telegram_mirror(principal, space_slug, note_number)
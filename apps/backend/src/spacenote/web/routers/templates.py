@@ -2,7 +2,7 @@ from fastapi import APIRouter
 from pydantic import BaseModel, Field
 
 from spacenote.core.modules.space.models import Space
-from spacenote.web.deps import AppDep, AuthTokenDep
+from spacenote.web.deps import AppDep, PrincipalDep
 from spacenote.web.openapi import ErrorResponse
 
 router = APIRouter(tags=["templates"])
@@ -49,6 +49,6 @@ Empty content removes the template.
         404: {"model": ErrorResponse, "description": "Space not found"},
     },
 )
-async def set_space_template(slug: str, key: str, request: SetTemplateRequest, app: AppDep, auth_token: AuthTokenDep) -> Space:
+async def set_space_template(slug: str, key: str, request: SetTemplateRequest, app: AppDep, principal: PrincipalDep) -> Space:
     """Set or remove template for space (space admin only). Empty content removes the template."""
-    return await app.set_space_template(auth_token, slug, key, request.content)
+    return await app.set_space_template(principal, slug, key, request.content)
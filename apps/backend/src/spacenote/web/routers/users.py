@@ -2,7 +2,7 @@ from fastapi import APIRouter
 from pydantic import BaseModel, Field
 
 from spacenote.core.modules.user.models import UserView
-from spacenote.web.deps import AppDep, AuthTokenDep
+from spacenote.web.deps import AppDep, PrincipalDep
 from spacenote.web.openapi import ErrorResponse
 
 router = APIRouter(tags=["users"])
@@ -26,9 +26,9 @@ class CreateUserRequest(BaseModel):
         401: {"model": ErrorResponse, "description": "Not authenticated"},
     },
 )
-async def list_users(app: AppDep, auth_token: AuthTokenDep) -> list[UserView]:
+async def list_users(app: AppDep, principal: PrincipalDep) -> list[UserView]:
     """List all users (requires authentication)."""
-    return await app.list_users(auth_token)
+    return await app.list_users(principal)
 
 
 @router.post(
@@ -44,9 +44,9 @@ async def list_users(app: AppDep, auth_token: AuthTokenDep) -> list[UserView]:
         403: {"model": ErrorResponse, "description": "Admin privileges required"},
     },
 )
-async def create_user(create_data: CreateUserRequest, app: AppDep, auth_token: AuthTokenDep) -> UserView:
+async def create_user(create_data: CreateUserRequest, app: AppDep, principal: PrincipalDep) -> UserView:
     """Create new user (admin only)."""
-    return await app.create_user(auth_token, create_data.username, create_data.password, is_admin=create_data.is_admin)
+    return await app.create_user(principal, create_data.username, create_data.password, is_admin=create_data.is_admin)
 
 
 @router.delete(
@@ -63,9 +63,9 @@ async def create_user(create_data: CreateUserRequest, app: AppDep, auth_token: A
         404: {"model": ErrorResponse, "description": "User not found"},
     },
 )
-async def delete_user(username: str, app: AppDep, auth_token: AuthTokenDep) -> None:
+async def delete_user(username: str, app: AppDep, principal: PrincipalDep) -> None:
     """Delete user (admin only)."""
-    await app.delete_user(auth_token, username)
+    await app.delete_user(principal, username)
 
 
 class SetAdminRequest(BaseModel):
@@ -86,9 +86,9 @@ class SetAdminRequest(BaseModel):
         404: {"model": ErrorResponse, "description": "User not found"},
     },
 )
-async def set_admin(username: str, request: SetAdminRequest, app: AppDep, auth_token: AuthTokenDep) -> UserView:
+async def set_admin(username: str, request: SetAdminRequest, app: AppDep, principal: PrincipalDep) -> UserView:
     """Set user admin status (admin only)."""
-    return await app.set_admin(auth_token, username, request.is_admin)
+    return await app.set_admin(principal, username, request.is_admin)
 
 
 class SetPasswordRequest(BaseModel):
@@ -111,6 +111,6 @@ class SetPasswordRequest(BaseModel):
         404: {"model": ErrorResponse, "description": "User not found"},
     },
 )
-async def set_password(username: str, request: SetPasswordRequest, app: AppDep, auth_token: AuthTokenDep) -> None:
+async def set_password(username: str, request: SetPasswordRequest, app: AppDep, principal: PrincipalDep) -> None:
     """Set user password (admin only)."""
-    await app.set_password(auth_token, username, request.password)
+    await app.set_password(principal, username, request.password)
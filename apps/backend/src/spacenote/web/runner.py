@@ -1,14 +1,46 @@
 """Uvicorn server runner."""
 
 import uvicorn
+from fastapi import FastAPI
 
 from spacenote.app import App
 from spacenote.config import Config
+from spacenote.logging import setup_logging
 from spacenote.web.server import create_fastapi_app
 
 
 def run_server(app: App, config: Config) -> None:
     """Run the Uvicorn server."""
+    if config.workers > 1:
+        # Each worker process builds its own App; see create_worker_app
+        uvicorn.run(
+            "spacenote.web.runner:create_worker_app",
+            factory=True,
+            workers=config.workers,
+            host=config.host,
+            port=config.port,
+            proxy_headers=True,
+            forwarded_allow_ips=config.forwarded_allow_ips,
+            log_config=None,
+            access_log=True,
+        )
+        return
+
     fastapi_app = create_fastapi_app(app, config)
 
-    uvicorn.run(fastapi_app, host=config.host, port=config.port, log_config=None, access_log=True)
+    uvicorn.run(
+        fastapi_app,
+        host=config.host,
+        port=config.port,
+        proxy_headers=True,
+        forwarded_allow_ips=config.forwarded_allow_ips,
+        log_config=None,
+        access_log=True,
+    )
+
+
+def create_worker_app() -> FastAPI:
+    """Build the FastAPI app inside a worker process (multi-worker mode)."""
+    config = Config()
+    setup_logging(config.debug, config.logs_path)
+    return create_fastapi_app(App(config), config)
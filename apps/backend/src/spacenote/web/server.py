@@ -22,6 +22,8 @@ from spacenote.web.routers.fields import router as fields_router
 from spacenote.web.routers.filters import router as filters_router
 from spacenote.web.routers.images import router as images_router
 from spacenote.web.routers.logs import router as logs_router
+from spacenote.web.routers.metrics import router as metrics_router
+from spacenote.web.routers.migrations import router as migrations_router
 from spacenote.web.routers.notes import router as notes_router
 from spacenote.web.routers.profile import router as profile_router
 from spacenote.web.routers.spaces import router as spaces_router
@@ -85,6 +87,8 @@ def create_fastapi_app(app_instance: App, config: Config) -> FastAPI:
     app.include_router(filters_router, prefix="/api/v1")
     app.include_router(images_router, prefix="/api/v1")
     app.include_router(logs_router, prefix="/api/v1")
+    app.include_router(metrics_router, prefix="/api/v1")
+    app.include_router(migrations_router, prefix="/api/v1")
     app.include_router(notes_router, prefix="/api/v1")
     app.include_router(profile_router, prefix="/api/v1")
     app.include_router(spaces_router, prefix="/api/v1")
@@ -0,0 +1,172 @@
+"""Tests for ClusterService change polling and the leader lease."""
+
+import asyncio
+from datetime import timedelta
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+from pymongo.errors import DuplicateKeyError
+
+from spacenote.core.modules.cluster.service import LEADER_LEASE_ID, SEQ_DOC_ID, SEQ_LOOKBACK, ClusterService
+from spacenote.utils import now
+
+
+class _Cursor:
+    def __init__(self, docs: list[dict[str, Any]]) -> None:
+        self._docs = docs
+
+    async def to_list(self) -> list[dict[str, Any]]:
+        return self._docs
+
+
+class _EpochsCollection:
+    """Change documents of cache_epochs, answering the polling query."""
+
+    def __init__(self) -> None:
+        self.docs: dict[str, dict[str, Any]] = {}
+
+    def put(self, scope: str, key: str, seq: int) -> None:
+        doc_id = f"{scope}:{key}" if key else scope
+        self.docs[doc_id] = {"_id": doc_id, "scope": scope, "key": key, "seq": seq}
+
+    def find(self, query: dict[str, Any]) -> _Cursor:
+        assert query["_id"] == {"$ne": SEQ_DOC_ID}
+        return _Cursor([doc for doc in self.docs.values() if doc["seq"] > query["seq"]["$gt"]])
+
+
+class _LeasesCollection:
+    """Single lease document with the upsert semantics of find_one_and_update."""
+
+    def __init__(self) -> None:
+        self.lease: dict[str, Any] | None = None
+
+    async def find_one_and_update(self, query: dict[str, Any], update: dict[str, Any], **_: object) -> dict[str, Any] | None:
+        holder_clause, expired_clause = query["$or"]
+        lease = self.lease
+        if (
+            lease is not None
+            and lease["holder"] != holder_clause["holder"]
+            and lease["expires_at"] >= expired_clause["expires_at"]["$lt"]
+        ):
+            # Filter does not match and the upsert collides with the existing _id
+            raise DuplicateKeyError("duplicate key")
+        self.lease = {"_id": LEADER_LEASE_ID, **update["$set"]}
+        return self.lease
+
+    async def find_one(self, query: dict[str, Any]) -> dict[str, Any] | None:
+        lease = self.lease
+        if lease is None or lease["holder"] != query["holder"] or lease["expires_at"] <= query["expires_at"]["$gt"]:
+            return None
+        return lease
+
+
+def _cluster() -> tuple[ClusterService, SimpleNamespace, _EpochsCollection, _LeasesCollection]:
+    epochs = _EpochsCollection()
+    leases = _LeasesCollection()
+    collections = {"cache_epochs": epochs, "leases": leases}
+    services = SimpleNamespace(
+        space=SimpleNamespace(update_all_spaces_cache=AsyncMock()),
+        counter=SimpleNamespace(discard_blocks=MagicMock()),
+        note=SimpleNamespace(load_backfill_state=AsyncMock(), invalidate_caches=MagicMock()),
+        comment=SimpleNamespace(invalidate_caches=MagicMock()),
+        start_leader_all=AsyncMock(),
+        stop_leader_all=AsyncMock(),
+    )
+    core = SimpleNamespace(
+        config=SimpleNamespace(workers=2),
+        services=services,
+        database=SimpleNamespace(get_collection=collections.__getitem__),
+    )
+    service = ClusterService()
+    service.set_core(core)
+    return service, services, epochs, leases
+
+
+class TestApplyChanges:
+    """Each change document is applied once per sequence number."""
+
+    def test_applies_change_once(self) -> None:
+        service, services, epochs, _ = _cluster()
+        epochs.put("notes", "tasks", 5)
+        asyncio.run(service.apply_changes())
+        asyncio.run(service.apply_changes())
+        services.note.invalidate_caches.assert_called_once_with("tasks", broadcast=False)
+
+    def test_applies_newer_change_of_same_key(self) -> None:
+        service, services, epochs, _ = _cluster()
+        epochs.put("spaces", "", 5)
+        asyncio.run(service.apply_changes())
+        epochs.put("spaces", "", 6)
+        asyncio.run(service.apply_changes())
+        assert services.space.update_all_spaces_cache.await_count == 2
+
+    def test_late_change_within_lookback(self) -> None:
+        # Sequence 10 was reserved before 11 but its document was written after
+        service, services, epochs, _ = _cluster()
+        epochs.put("notes", "tasks", 11)
+        asyncio.run(service.apply_changes())
+        epochs.put("comments", "tasks", 10)
+        asyncio.run(service.apply_changes())
+        services.comment.invalidate_caches.assert_called_once_with("tasks", broadcast=False)
+        services.note.invalidate_caches.assert_called_once_with("tasks", broadcast=False)
+
+    def test_change_outside_lookback_is_not_read(self) -> None:
+        service, services, epochs, _ = _cluster()
+        epochs.put("notes", "tasks", SEQ_LOOKBACK + 10)
+        asyncio.run(service.apply_changes())
+        epochs.put("comments", "tasks", 5)
+        asyncio.run(service.apply_changes())
+        services.comment.invalidate_caches.assert_not_called()
+
+    def test_unknown_scope_is_ignored(self) -> None:
+        service, services, epochs, _ = _cluster()
+        epochs.put("retired", "", 3)
+        asyncio.run(service.apply_changes())
+        services.note.invalidate_caches.assert_not_called()
+        services.space.update_all_spaces_cache.assert_not_awaited()
+
+
+class TestLeaderLease:
+    """Leadership follows the lease document."""
+
+    def test_acquires_free_lease(self) -> None:
+        service, services, _, leases = _cluster()
+        asyncio.run(service.check_lease())
+        assert service.is_leader
+        assert leases.lease is not None
+        assert leases.lease["holder"] == service.process_id
+        services.start_leader_all.assert_awaited_once()
+        assert asyncio.run(service.holds_lease())
+
+    def test_does_not_take_live_lease(self) -> None:
+        service, services, _, leases = _cluster()
+        leases.lease = {"_id": LEADER_LEASE_ID, "holder": "other", "expires_at": now() + timedelta(seconds=20)}
+        asyncio.run(service.check_lease())
+        assert not service.is_leader
+        services.start_leader_all.assert_not_awaited()
+        assert not asyncio.run(service.holds_lease())
+
+    def test_takes_over_expired_lease(self) -> None:
+        service, services, _, leases = _cluster()
+        leases.lease = {"_id": LEADER_LEASE_ID, "holder": "other", "expires_at": now() - timedelta(seconds=1)}
+        asyncio.run(service.check_lease())
+        assert service.is_leader
+        services.start_leader_all.assert_awaited_once()
+
+    def test_renewal_keeps_leadership(self) -> None:
+        service, services, _, _ = _cluster()
+        asyncio.run(service.check_lease())
+        asyncio.run(service.check_lease())
+        assert service.is_leader
+        services.start_leader_all.assert_awaited_once()
+
+    def test_resigns_when_lease_taken_over(self) -> None:
+        service, services, _, leases = _cluster()
+        asyncio.run(service.check_lease())
+        # This process stalled past the TTL and another one took the lease
+        leases.lease = {"_id": LEADER_LEASE_ID, "holder": "other", "expires_at": now() + timedelta(seconds=20)}
+        assert not asyncio.run(service.holds_lease())
+        asyncio.run(service.check_lease())
+        assert not service.is_leader
+        services.stop_leader_all.assert_awaited_once()
@@ -0,0 +1,32 @@
+"""Tests for normalized shadow values."""
+
+from spacenote.core.modules.field.models import FieldType, SpaceField
+from spacenote.core.modules.field.normalize import (
+    SHADOW_MAX_LENGTH,
+    build_shadow_values,
+    normalize_text,
+    prefix_upper_bound,
+)
+
+
+class TestNormalize:
+    """Shadow values are normalized, case-folded and bounded."""
+
+    def test_normalize_text(self) -> None:
+        assert normalize_text("Stra\u00dfe \uff21\uff22\uff23") == "strasse abc"
+
+    def test_build_shadow_values(self) -> None:
+        fields = [
+            SpaceField(name="title", type=FieldType.STRING, options={}),
+            SpaceField(name="status", type=FieldType.SELECT, options={"values": ["Open"]}),
+            SpaceField(name="count", type=FieldType.NUMERIC, options={"kind": "int"}),
+            SpaceField(name="empty", type=FieldType.STRING, options={}),
+        ]
+        values = {"title": "x" * 1000, "status": "Open", "count": 3, "empty": None}
+        assert build_shadow_values(fields, values) == {"title": "x" * SHADOW_MAX_LENGTH, "status": "open"}
+
+    def test_prefix_upper_bound(self) -> None:
+        assert prefix_upper_bound("abc") == "abd"
+        assert prefix_upper_bound("a\U0010ffff") == "b"
+        assert prefix_upper_bound("a퟿") == "a"
+        assert prefix_upper_bound("") is None
@@ -0,0 +1,43 @@
+"""Tests for compiled field schemas."""
+
+from decimal import Decimal
+
+from spacenote.core.modules.field.models import FieldType, SpaceField
+from spacenote.core.modules.field.schema import FieldSchema
+from spacenote.core.modules.field.validators import NumericValidator
+from spacenote.core.modules.space.models import Space
+
+
+def _space() -> Space:
+    return Space(
+        slug="photos",
+        title="Photos",
+        timezone="Europe/Berlin",
+        fields=[
+            SpaceField(name="photo", type=FieldType.IMAGE, options={}),
+            SpaceField(name="taken", type=FieldType.DATETIME, options={"kind": "utc"}, default="$exif.created_at:photo"),
+            SpaceField(name="added", type=FieldType.DATETIME, options={"kind": "utc"}, default="$now"),
+            SpaceField(name="owner", type=FieldType.USER, options={}, default="$me"),
+            SpaceField(name="rating", type=FieldType.NUMERIC, options={"kind": "int"}, default=3),
+            SpaceField(name="tags", type=FieldType.TAGS, options={}, default=["new"]),
+            SpaceField(name="note", type=FieldType.STRING, options={}),
+        ],
+    )
+
+
+class TestFieldSchema:
+    """Schema is compiled once from the resolved space."""
+
+    def test_fields_keep_order_and_validators(self) -> None:
+        schema = FieldSchema.compile(_space())
+        assert list(schema.fields) == ["photo", "taken", "added", "owner", "rating", "tags", "note"]
+        assert schema.fields["rating"].validator is NumericValidator
+
+    def test_static_defaults_exclude_request_dependent_values(self) -> None:
+        schema = FieldSchema.compile(_space())
+        assert dict(schema.static_defaults) == {"rating": Decimal(3), "tags": ["new"]}
+
+    def test_exif_sources_and_timezone(self) -> None:
+        schema = FieldSchema.compile(_space())
+        assert schema.exif_sources == ("photo",)
+        assert schema.tz.key == "Europe/Berlin"
@@ -0,0 +1,51 @@
+"""Tests for facet pipeline building."""
+
+import pytest
+
+from spacenote.core.modules.field.models import FieldType, SpaceField
+from spacenote.core.modules.filter.facets import build_facet_pipeline, validate_facet_fields
+from spacenote.core.modules.space.models import Space
+from spacenote.errors import ValidationError
+
+
+def _space() -> Space:
+    """Build a space with facetable and non-facetable fields."""
+    return Space(
+        slug="s",
+        title="s",
+        fields=[
+            SpaceField(name="status", type=FieldType.SELECT, options={"values": ["new", "done"]}),
+            SpaceField(name="tags", type=FieldType.TAGS, options={}),
+            SpaceField(name="body", type=FieldType.STRING, options={}),
+        ],
+    )
+
+
+class TestValidateFacetFields:
+    """Only known SELECT/TAGS/USER fields can be faceted."""
+
+    def test_dedupes(self) -> None:
+        fields = ["note.fields.status", "note.author", "note.fields.status"]
+        assert validate_facet_fields(_space(), fields) == ["note.fields.status", "note.author"]
+
+    @pytest.mark.parametrize("field", ["note.fields.body", "note.fields.missing", "note.created_at"])
+    def test_rejects(self, field: str) -> None:
+        with pytest.raises(ValidationError):
+            validate_facet_fields(_space(), [field])
+
+    def test_rejects_empty(self) -> None:
+        with pytest.raises(ValidationError):
+            validate_facet_fields(_space(), [])
+
+
+class TestBuildFacetPipeline:
+    """One $match followed by one $facet with a sub-pipeline per field."""
+
+    def test_pipeline(self) -> None:
+        query = {"space_slug": "s"}
+        pipeline = build_facet_pipeline(_space(), query, ["note.fields.status", "note.fields.tags"])
+        assert pipeline[0] == {"$match": query}
+        facets = pipeline[1]["$facet"]
+        assert list(facets) == ["f0", "f1"]
+        assert facets["f0"][0] == {"$group": {"_id": "$fields.status", "count": {"$sum": 1}}}
+        assert facets["f1"][0] == {"$unwind": "$fields.tags"}
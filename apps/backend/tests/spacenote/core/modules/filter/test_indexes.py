@@ -0,0 +1,84 @@
+"""Tests for derive_filter_index() and derive_text_index_paths()."""
+
+from spacenote.core.modules.field.models import FieldType, SpaceField
+from spacenote.core.modules.filter.indexes import (
+    MANAGED_INDEX_PREFIX,
+    derive_filter_index,
+    derive_text_index_paths,
+    get_index_name,
+)
+from spacenote.core.modules.filter.models import Filter, FilterCondition, FilterOperator
+from spacenote.core.modules.space.models import Space
+
+
+def _space() -> Space:
+    """Build a space with a few typed fields."""
+    return Space(
+        slug="s",
+        title="s",
+        fields=[
+            SpaceField(name="status", type=FieldType.SELECT, options={"values": ["new", "done"]}),
+            SpaceField(name="priority", type=FieldType.NUMERIC, options={"kind": "int"}),
+            SpaceField(name="tags", type=FieldType.TAGS, options={}),
+            SpaceField(name="labels", type=FieldType.TAGS, options={}),
+        ],
+    )
+
+
+def _filter(conditions: list[FilterCondition] | None = None, sort: list[str] | None = None) -> Filter:
+    return Filter(name="f", conditions=conditions or [], sort=sort or [])
+
+
+class TestDeriveFilterIndex:
+    """Index keys follow equality, sort, range order."""
+
+    def test_base_indexes_suffice(self) -> None:
+        assert derive_filter_index(_space(), _filter()) is None
+        assert derive_filter_index(_space(), _filter(sort=["note.number"])) is None
+
+    def test_sort_only(self) -> None:
+        keys = derive_filter_index(_space(), _filter(sort=["-note.activity_at"]))
+        assert keys == [("space_slug", 1), ("activity_at", -1), ("number", -1)]
+
+    def test_equality_sort_range(self) -> None:
+        conditions = [
+            FilterCondition(field="note.fields.priority", operator=FilterOperator.GTE, value=2),
+            FilterCondition(field="note.fields.status", operator=FilterOperator.EQ, value="new"),
+        ]
+        keys = derive_filter_index(_space(), _filter(conditions, ["-note.created_at"]))
+        assert keys == [
+            ("space_slug", 1),
+            ("fields.status", 1),
+            ("created_at", -1),
+            ("number", -1),
+            ("fields.priority", 1),
+        ]
+
+    def test_single_array_field(self) -> None:
+        conditions = [
+            FilterCondition(field="note.fields.tags", operator=FilterOperator.ALL, value=["a"]),
+            FilterCondition(field="note.fields.labels", operator=FilterOperator.IN, value=["b"]),
+        ]
+        keys = derive_filter_index(_space(), _filter(conditions))
+        assert keys == [("space_slug", 1), ("number", -1), ("fields.tags", 1)]
+
+    def test_index_name_is_deterministic(self) -> None:
+        keys = [("space_slug", 1), ("activity_at", -1), ("number", -1)]
+        assert get_index_name(keys) == get_index_name(list(keys))
+        assert get_index_name(keys).startswith(MANAGED_INDEX_PREFIX)
+        assert get_index_name(keys) != get_index_name([("space_slug", 1), ("activity_at", 1), ("number", 1)])
+
+
+def test_text_index_paths() -> None:
+    """Only text fields are indexed, once per path across spaces."""
+    other = Space(
+        slug="o",
+        title="o",
+        fields=[
+            SpaceField(name="body", type=FieldType.STRING, options={"kind": "markdown"}),
+            SpaceField(name="tags", type=FieldType.TAGS, options={}),
+            SpaceField(name="owner", type=FieldType.USER, options={}),
+        ],
+    )
+    assert derive_text_index_paths([_space(), other]) == ["fields.body", "fields.labels", "fields.status", "fields.tags"]
+    assert derive_text_index_paths([]) == []
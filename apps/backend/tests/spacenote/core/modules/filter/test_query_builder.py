@@ -0,0 +1,131 @@
+"""Tests for sort and keyset query building."""
+
+from datetime import UTC, datetime
+
+import pytest
+
+from spacenote.core.modules.filter.models import FilterCondition, FilterOperator
+from spacenote.core.modules.filter.query_builder import (
+    build_keyset_query,
+    build_mongo_query,
+    build_mongo_sort,
+    build_text_search,
+    get_sort_values,
+    is_user_specific,
+    resolve_me,
+)
+from spacenote.errors import ValidationError
+
+
+class TestBuildMongoSort:
+    """Sort specs always end with a unique tiebreaker."""
+
+    def test_default(self) -> None:
+        assert build_mongo_sort([]) == [("number", -1)]
+
+    def test_appends_number_tiebreaker(self) -> None:
+        assert build_mongo_sort(["-note.created_at"]) == [("created_at", -1), ("number", -1)]
+        assert build_mongo_sort(["note.fields.status"]) == [("fields.status", 1), ("number", 1)]
+
+    def test_keeps_explicit_number(self) -> None:
+        assert build_mongo_sort(["note.number", "note.fields.status"]) == [("number", 1), ("fields.status", 1)]
+
+    def test_stored_title(self) -> None:
+        assert build_mongo_sort(["note.title"]) == [("title", 1), ("number", 1)]
+
+
+class TestKeyset:
+    """Keyset conditions select documents strictly after the cursor position."""
+
+    def test_get_sort_values(self) -> None:
+        doc = {"number": 7, "fields": {"status": "new"}}
+        assert get_sort_values(doc, [("fields.status", 1), ("fields.missing", 1), ("number", 1)]) == ["new", None, 7]
+
+    def test_single_key(self) -> None:
+        assert build_keyset_query([("number", -1)], [10]) == {"$or": [{"number": {"$lt": 10}}, {"number": None}]}
+        assert build_keyset_query([("number", 1)], [10]) == {"number": {"$gt": 10}}
+
+    def test_compound_keys(self) -> None:
+        ts = datetime(2024, 1, 1, tzinfo=UTC)
+        query = build_keyset_query([("created_at", 1), ("number", 1)], [ts, 5])
+        assert query == {
+            "$or": [
+                {"created_at": {"$gt": ts}},
+                {"$and": [{"created_at": ts}, {"number": {"$gt": 5}}]},
+            ]
+        }
+
+    def test_null_values(self) -> None:
+        # Ascending: nulls come first, so everything non-null follows
+        query = build_keyset_query([("edited_at", 1), ("number", 1)], [None, 5])
+        assert query == {
+            "$or": [
+                {"edited_at": {"$ne": None}},
+                {"$and": [{"edited_at": None}, {"number": {"$gt": 5}}]},
+            ]
+        }
+        # Descending: nulls come last, so only ties on null can follow
+        query = build_keyset_query([("edited_at", -1), ("number", -1)], [None, 5])
+        assert query == {"$and": [{"edited_at": None}, {"$or": [{"number": {"$lt": 5}}, {"number": None}]}]}
+
+
+class TestTextSearch:
+    """Search conditions compile to a single $text clause."""
+
+    def test_words_are_required(self) -> None:
+        assert build_text_search(['quarterly "report"', "-draft"]) == '"quarterly" "report" -draft'
+
+    @pytest.mark.parametrize("terms", [["-draft"], ["-draft", '"-old"'], ["  "]])
+    def test_no_word_to_match(self, terms: list[str]) -> None:
+        with pytest.raises(ValidationError, match="at least one word"):
+            build_text_search(terms)
+
+    def test_query(self) -> None:
+        conditions = [
+            FilterCondition(field="note.text", operator=FilterOperator.SEARCH, value="meeting"),
+            FilterCondition(field="note.fields.status", operator=FilterOperator.EQ, value="new"),
+            FilterCondition(field="note.text", operator=FilterOperator.SEARCH, value="notes"),
+        ]
+        assert build_mongo_query(conditions, "s", "alice") == {
+            "space_slug": "s",
+            "fields.status": "new",
+            "$text": {"$search": '"meeting" "notes"'},
+        }
+
+
+class TestShadowStartswith:
+    """startswith on shadowed fields compiles to an index-friendly range."""
+
+    def test_range_on_shadow(self) -> None:
+        conditions = [FilterCondition(field="note.fields.title", operator=FilterOperator.STARTSWITH, value="Meet")]
+        query = build_mongo_query(conditions, "s", "alice", shadow_fields={"title"})
+        assert query == {"space_slug": "s", "fields_norm.title": {"$gte": "meet", "$lt": "meeu"}}
+
+    def test_regex_without_shadow(self) -> None:
+        conditions = [FilterCondition(field="note.fields.title", operator=FilterOperator.STARTSWITH, value="Meet")]
+        query = build_mongo_query(conditions, "s", "alice")
+        assert query == {"space_slug": "s", "fields.title": {"$regex": "^Meet", "$options": "i"}}
+
+    def test_long_prefix_also_checks_original(self) -> None:
+        prefix = "a" * 300
+        conditions = [FilterCondition(field="note.fields.title", operator=FilterOperator.STARTSWITH, value=prefix)]
+        query = build_mongo_query(conditions, "s", "alice", shadow_fields={"title"})
+        assert set(query) == {"space_slug", "fields_norm.title", "fields.title"}
+
+
+class TestMePlaceholder:
+    """Queries compiled with the $me placeholder are resolved per user."""
+
+    def test_equality_is_shared(self) -> None:
+        conditions = [
+            FilterCondition(field="note.author", operator=FilterOperator.EQ, value="$me"),
+            FilterCondition(field="note.fields.owner", operator=FilterOperator.NE, value="$me"),
+        ]
+        assert not is_user_specific(conditions)
+        query = build_mongo_query(conditions, "s", "$me")
+        assert resolve_me(query, "alice") == {"space_slug": "s", "author": "alice", "fields.owner": {"$ne": "alice"}}
+        assert query["author"] == "$me"
+
+    def test_transformed_value_is_user_specific(self) -> None:
+        conditions = [FilterCondition(field="note.fields.title", operator=FilterOperator.STARTSWITH, value="$me")]
+        assert is_user_specific(conditions)
@@ -0,0 +1,103 @@
+"""Tests for migration job note updates."""
+
+from decimal import Decimal
+
+import pytest
+from bson import ObjectId
+from pymongo import UpdateOne
+
+from spacenote.core.modules.field.models import FieldType, SpaceField
+from spacenote.core.modules.migration.models import MigrationJobType
+from spacenote.core.modules.migration.operations import (
+    build_backfill_operation,
+    build_coerce_operation,
+    build_job_query,
+    build_unset_operation,
+    coerce_value,
+    validate_select_migration,
+)
+from spacenote.errors import ValidationError
+
+
+def _select(values: list[str]) -> SpaceField:
+    return SpaceField(name="status", type=FieldType.SELECT, options={"values": values})
+
+
+def _numeric(kind: str) -> SpaceField:
+    return SpaceField(name="count", type=FieldType.NUMERIC, options={"kind": kind})
+
+
+class TestCoerceValue:
+    """Values are brought in line with current options without losing data."""
+
+    def test_select_keeps_unknown_values_by_default(self) -> None:
+        field = _select(["open", "done"])
+        assert coerce_value(field, "open") == "open"
+        assert coerce_value(field, "archived") == "archived"
+
+    def test_select_value_map_and_clear(self) -> None:
+        field = _select(["open", "closed"])
+        value_map = {"done": "closed", "spam": None}
+        assert coerce_value(field, "done", value_map) == "closed"
+        assert coerce_value(field, "spam", value_map) is None
+        assert coerce_value(field, "archived", value_map) == "archived"
+        assert coerce_value(field, "archived", value_map, clear_removed=True) is None
+
+    def test_numeric_converts_losslessly(self) -> None:
+        assert coerce_value(_numeric("int"), 2.0) == 2
+        assert isinstance(coerce_value(_numeric("int"), Decimal("4.00")), int)
+        assert coerce_value(_numeric("int"), 2.5) == 2.5
+        assert coerce_value(_numeric("decimal"), 0.1) == Decimal("0.1")
+        assert isinstance(coerce_value(_numeric("float"), 3), float)
+
+
+class TestOperations:
+    """Job queries and per-note updates."""
+
+    def test_job_query_resumes_after_number(self) -> None:
+        query = build_job_query(MigrationJobType.UNSET_FIELD, "tasks", "status", after_number=42)
+        assert query == {"space_slug": "tasks", "number": {"$gt": 42}, "fields.status": {"$exists": True}}
+
+    def test_unset_removes_shadow(self) -> None:
+        doc = {"_id": ObjectId()}
+        expected = UpdateOne({"_id": doc["_id"]}, {"$unset": {"fields.status": "", "fields_norm.status": ""}})
+        assert build_unset_operation(doc, "status") == expected
+
+    def test_backfill_guards_empty_value(self) -> None:
+        doc = {"_id": ObjectId()}
+        expected = UpdateOne(
+            {"_id": doc["_id"], "fields.status": None}, {"$set": {"fields.status": "Open", "fields_norm.status": "open"}}
+        )
+        assert build_backfill_operation(doc, _select(["Open"]), "Open") == expected
+
+    def test_coerce_skips_conforming_values(self) -> None:
+        field = _select(["open"])
+        assert build_coerce_operation({"_id": ObjectId(), "fields": {"status": "open"}}, field, clear_removed=True) is None
+        doc = {"_id": ObjectId(), "fields": {"status": "gone"}}
+        assert build_coerce_operation(doc, field) is None
+        expected = UpdateOne(
+            {"_id": doc["_id"], "fields.status": "gone"},
+            {"$set": {"fields.status": None}, "$unset": {"fields_norm.status": ""}},
+        )
+        assert build_coerce_operation(doc, field, clear_removed=True) == expected
+
+
+class TestValidateSelectMigration:
+    """Requested SELECT migrations must fit the updated field."""
+
+    def test_mapped_values_must_be_allowed(self) -> None:
+        with pytest.raises(ValidationError):
+            validate_select_migration(_select(["open"]), {"done": "closed"}, clear_removed=False, has_static_default=False)
+        validate_select_migration(_select(["open"]), {"done": "open"}, clear_removed=False, has_static_default=False)
+
+    def test_required_field_needs_default_to_clear(self) -> None:
+        field = SpaceField(name="status", type=FieldType.SELECT, required=True, options={"values": ["open"]})
+        with pytest.raises(ValidationError):
+            validate_select_migration(field, None, clear_removed=True, has_static_default=False)
+        with pytest.raises(ValidationError):
+            validate_select_migration(field, {"done": None}, clear_removed=False, has_static_default=False)
+        validate_select_migration(field, None, clear_removed=True, has_static_default=True)
+
+    def test_select_only(self) -> None:
+        with pytest.raises(ValidationError):
+            validate_select_migration(_numeric("int"), None, clear_removed=True, has_static_default=False)
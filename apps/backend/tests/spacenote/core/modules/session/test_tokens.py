@@ -0,0 +1,50 @@
+"""Tests for signed session tokens."""
+
+from datetime import UTC, datetime, timedelta
+
+from spacenote.core.modules.session.tokens import (
+    create_signed_token,
+    is_signed_token,
+    read_token_claims,
+    verify_signed_token,
+)
+
+SECRET = "test-secret"
+NOW = datetime(2025, 1, 1, tzinfo=UTC)
+
+
+class TestSignedTokens:
+    """Tokens verify with the issuing secret until they expire."""
+
+    def test_round_trip(self) -> None:
+        token = create_signed_token(SECRET, "alice", NOW + timedelta(days=30))
+        assert is_signed_token(token)
+        claims = verify_signed_token(SECRET, token, NOW)
+        assert claims is not None
+        assert claims.username == "alice"
+        assert claims.expires_at == NOW + timedelta(days=30)
+        assert claims == read_token_claims(token)
+
+    def test_unique_ids(self) -> None:
+        first = read_token_claims(create_signed_token(SECRET, "alice", NOW))
+        second = read_token_claims(create_signed_token(SECRET, "alice", NOW))
+        assert first is not None and second is not None
+        assert first.token_id != second.token_id
+
+    def test_expired(self) -> None:
+        token = create_signed_token(SECRET, "alice", NOW)
+        assert verify_signed_token(SECRET, token, NOW) is None
+
+    def test_wrong_secret(self) -> None:
+        token = create_signed_token(SECRET, "alice", NOW + timedelta(days=1))
+        assert verify_signed_token("other-secret", token, NOW) is None
+
+    def test_tampered(self) -> None:
+        token = create_signed_token(SECRET, "alice", NOW + timedelta(days=1))
+        assert verify_signed_token(SECRET, token.replace("alice", "admin", 1), NOW) is None
+
+    def test_opaque_and_malformed(self) -> None:
+        assert not is_signed_token("abcdef")
+        assert read_token_claims("abcdef") is None
+        assert read_token_claims("s1.alice.notanumber.id.sig") is None
+        assert verify_signed_token(SECRET, "s1.alice", NOW) is None
@@ -0,0 +1,55 @@
+"""Tests for the space model."""
+
+import pydantic
+import pytest
+
+from spacenote.core.modules.field.models import FieldType, SpaceField
+from spacenote.core.modules.space.models import Member, Permission, Space
+
+
+def _space() -> Space:
+    return Space(
+        slug="tasks",
+        title="Tasks",
+        members=[
+            Member(username="alice", permissions=[Permission.ALL]),
+            Member(username="bob", permissions=[Permission.CREATE_COMMENT]),
+        ],
+        fields=[SpaceField(name="title", type=FieldType.STRING, options={})],
+    )
+
+
+class TestSpaceLookups:
+    """Lookups give the same answers as scanning the lists."""
+
+    def test_lookups_match_scans(self) -> None:
+        scanned = _space()
+        indexed = _space()
+        indexed.build_lookups()
+        for space in (scanned, indexed):
+            assert space.get_field("title") is space.fields[0]
+            assert space.get_field("missing") is None
+            assert space.get_member("bob") is space.members[1]
+            assert not space.has_member("carol")
+            assert space.get_member_permissions("alice") == frozenset(Permission)
+            assert space.get_member_permissions("bob") == {Permission.CREATE_COMMENT}
+            assert space.get_member_permissions("carol") == frozenset()
+
+    def test_replaced_list_is_not_served_from_lookups(self) -> None:
+        space = _space()
+        space.build_lookups()
+        space.members = [Member(username="carol", permissions=[Permission.CREATE_NOTE])]
+        assert space.has_member("carol")
+        assert not space.has_member("alice")
+
+
+class TestSpaceTimezone:
+    """Only IANA timezone names are accepted."""
+
+    def test_valid_timezone(self) -> None:
+        assert Space(slug="tasks", title="Tasks", timezone="Atlantic/Reykjavik").timezone == "Atlantic/Reykjavik"
+
+    @pytest.mark.parametrize("timezone", ["Mars/Olympus", "../etc/passwd", ""])
+    def test_unknown_timezone(self, timezone: str) -> None:
+        with pytest.raises(pydantic.ValidationError):
+            Space(slug="tasks", title="Tasks", timezone=timezone)
@@ -0,0 +1,49 @@
+"""Tests for analyze_template()."""
+
+from spacenote.core.modules.telegram.utils import parse_photo_directive
+from spacenote.core.modules.template.analysis import analyze_template
+
+
+class TestAnalyzeTemplate:
+    """Templates report the note attributes and fields they read."""
+
+    def test_specific_fields(self) -> None:
+        deps = analyze_template('{{ note.fields.title }} #{{ note.number }} {{ note.fields["due date"] }}')
+        assert deps.note_fields == {"title", "due date"}
+        assert deps.note_attributes == {"fields", "number"}
+        assert not deps.reads_all_fields
+        assert deps.reads_note_field("title")
+        assert not deps.reads_note_field("body")
+
+    def test_loop_over_fields_reads_all(self) -> None:
+        deps = analyze_template("{% for field in note.fields %}{{ field[1] }}{% endfor %}")
+        assert deps.reads_all_fields
+        assert deps.reads_note_field("anything")
+
+    def test_dynamic_key_reads_all(self) -> None:
+        deps = analyze_template("{{ note.fields[key] }}")
+        assert deps.reads_all_fields
+
+    def test_whole_note(self) -> None:
+        deps = analyze_template("{% assign n = note %}{{ n.fields.a }}")
+        assert deps.reads_whole_note
+        assert deps.reads_note_attribute("activity_at")
+
+    def test_variables(self) -> None:
+        deps = analyze_template("{{ space.title }} {% for c in changes %}{{ c[0] }}{% endfor %}")
+        assert deps.variables == {"space", "changes"}
+        assert not deps.note_attributes
+
+    def test_reads_note_changes(self) -> None:
+        deps = analyze_template("{{ note.fields.status }} {{ note.edited_at }}")
+        assert deps.reads_note_changes([], ["status"])
+        assert deps.reads_note_changes(["edited_at"], [])
+        assert not deps.reads_note_changes(["activity_at", "title"], ["body"])
+
+    def test_mirror_photo_field(self) -> None:
+        source = "{# photo: cover #}\n{{ note.title }}"
+        photo_field, _ = parse_photo_directive(source)
+        assert photo_field == "cover"
+        assert not analyze_template(source).reads_note_changes(["edited_at", "activity_at"], ["cover"])
+        deps = analyze_template(source).with_fields([photo_field])
+        assert deps.reads_note_changes(["edited_at", "activity_at"], ["cover"])
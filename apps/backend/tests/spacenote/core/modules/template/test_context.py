@@ -0,0 +1,28 @@
+"""Tests for lazy template contexts."""
+
+from liquid import Template
+
+from spacenote.core.modules.note.models import Note
+from spacenote.core.modules.template.context import ModelContext
+
+
+def _note() -> Note:
+    return Note(space_slug="s", number=7, author="alice", fields={"status": "open", "count": 3})
+
+
+class TestModelContext:
+    """Context renders like model_dump() but dumps only what is read."""
+
+    def test_same_as_model_dump(self) -> None:
+        note = _note()
+        source = "{{ note.number }} {{ note.author }} {% for f in note.fields %}{{ f[0] }}={{ f[1] }};{% endfor %}"
+        assert Template(source).render(note=ModelContext(note)) == Template(source).render(note=note.model_dump())
+
+    def test_excluded_and_unknown_keys(self) -> None:
+        context = ModelContext(_note())
+        assert "id" not in context
+        assert context.get("missing") is None
+
+    def test_keys_match_model_dump(self) -> None:
+        note = _note()
+        assert dict(ModelContext(note)) == note.model_dump()
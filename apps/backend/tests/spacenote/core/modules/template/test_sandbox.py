@@ -0,0 +1,59 @@
+"""Tests for sandboxed template rendering."""
+
+from collections.abc import Iterator
+
+import pytest
+from liquid.exceptions import LoopIterationLimitError, OutputStreamLimitError
+
+from spacenote.core.modules.template import sandbox
+from spacenote.core.modules.template.sandbox import SANDBOX, BudgetedTemplate, RenderTimeLimitError
+
+
+@pytest.fixture
+def no_time_budget(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Keep the wall-time budget out of tests of the other limits (renders are slow on a busy machine)."""
+    monkeypatch.setattr(sandbox, "RENDER_TIME_BUDGET", 3600.0)
+
+
+@pytest.fixture
+def ticking_clock(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Clock advancing 10 ms on every reading, so the 50 ms budget runs out after a few checks."""
+    readings: Iterator[float] = (i * 0.01 for i in range(1_000_000))
+    monkeypatch.setattr(sandbox, "monotonic", lambda: next(readings))
+
+
+@pytest.mark.usefixtures("no_time_budget")
+class TestSandbox:
+    """Renders stop when a limit is exceeded."""
+
+    def test_renders_normally(self) -> None:
+        assert SANDBOX.from_string("Note #{{ n }}").render(n=5) == "Note #5"
+
+    def test_loop_limit(self) -> None:
+        with pytest.raises(LoopIterationLimitError):
+            SANDBOX.from_string("{% for i in (1..100000) %}x{% endfor %}").render()
+
+    def test_output_limit(self) -> None:
+        with pytest.raises(OutputStreamLimitError):
+            SANDBOX.from_string("{% for i in (1..5000) %}{{ s }}{% endfor %}").render(s="y" * 100)
+
+
+@pytest.mark.usefixtures("ticking_clock")
+class TestTimeBudget:
+    """Renders stop once the wall-time budget is used up, output or not."""
+
+    def test_time_budget(self) -> None:
+        with pytest.raises(RenderTimeLimitError):
+            SANDBOX.from_string("{% for i in (1..100) %}{{ i }}{% endfor %}").render()
+
+    def test_time_budget_without_output(self) -> None:
+        source = "{% for i in (1..10) %}{% for j in (1..10) %}{% assign x = i | plus: j %}{% endfor %}{% endfor %}"
+        with pytest.raises(RenderTimeLimitError):
+            SANDBOX.from_string(source).render()
+
+    def test_deterministic_render_has_no_time_budget(self) -> None:
+        template = SANDBOX.from_string("{% for i in (1..100) %}{{ i }}{% endfor %}")
+        assert isinstance(template, BudgetedTemplate)
+        with pytest.raises(RenderTimeLimitError):
+            template.render()
+        assert template.render_deterministic().endswith("99100")
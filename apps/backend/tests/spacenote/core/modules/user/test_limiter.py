@@ -0,0 +1,40 @@
+"""Tests for login admission control."""
+
+import pytest
+
+from spacenote.core.modules.user.limiter import LoginLimiter
+from spacenote.errors import RateLimitError
+
+
+class TestLoginLimiter:
+    """Attempts over a cap are rejected and slots are released on exit."""
+
+    def test_per_username(self) -> None:
+        limiter = LoginLimiter(per_ip=10, per_username=1, total=10)
+        with limiter.admit("alice", "10.0.0.1"):
+            with pytest.raises(RateLimitError), limiter.admit("alice", "10.0.0.2"):
+                pass
+            with limiter.admit("bob", "10.0.0.1"):
+                assert limiter.in_flight == 2
+        assert limiter.in_flight == 0
+        assert limiter.rejected == 1
+
+    def test_per_ip(self) -> None:
+        limiter = LoginLimiter(per_ip=1, per_username=10, total=10)
+        with limiter.admit("alice", "10.0.0.1"):
+            with pytest.raises(RateLimitError), limiter.admit("bob", "10.0.0.1"):
+                pass
+            with limiter.admit("bob", None):
+                pass
+
+    def test_total(self) -> None:
+        limiter = LoginLimiter(per_ip=10, per_username=10, total=1)
+        with limiter.admit("alice", "10.0.0.1"), pytest.raises(RateLimitError), limiter.admit("bob", "10.0.0.2"):
+            pass
+
+    def test_released_on_error(self) -> None:
+        limiter = LoginLimiter(per_ip=1, per_username=1, total=1)
+        with pytest.raises(ValueError), limiter.admit("alice", "10.0.0.1"):
+            raise ValueError
+        with limiter.admit("alice", "10.0.0.1"):
+            assert limiter.in_flight == 1
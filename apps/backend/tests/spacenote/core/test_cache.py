@@ -0,0 +1,64 @@
+"""Tests for in-memory caches."""
+
+from datetime import UTC, datetime, timedelta
+
+from spacenote.core.cache import ExpiringCache, SpaceVersionedCache
+
+
+class TestSpaceVersionedCache:
+    """Entries are invalidated per space and bounded in size."""
+
+    def test_invalidate_is_per_space(self) -> None:
+        cache: SpaceVersionedCache[int] = SpaceVersionedCache()
+        cache.set("a", "k", 1)
+        cache.set("b", "k", 2)
+        cache.invalidate("a")
+        assert cache.get("a", "k") is None
+        assert cache.get("b", "k") == 2
+
+    def test_stale_entries_serve_estimates(self) -> None:
+        cache: SpaceVersionedCache[int] = SpaceVersionedCache()
+        cache.set("a", "k", 1)
+        cache.invalidate("a")
+        assert cache.get("a", "k", max_stale_age=60) == 1
+
+    def test_value_computed_before_write_is_stale(self) -> None:
+        cache: SpaceVersionedCache[int] = SpaceVersionedCache()
+        version = cache.get_version("a")
+        cache.invalidate("a")  # write lands while the value is being computed
+        cache.set("a", "k", 1, version)
+        assert cache.get("a", "k") is None
+
+    def test_lru_eviction(self) -> None:
+        cache: SpaceVersionedCache[int] = SpaceVersionedCache(max_entries=2)
+        cache.set("a", 1, 1)
+        cache.set("a", 2, 2)
+        cache.get("a", 1)
+        cache.set("a", 3, 3)
+        assert cache.get("a", 1) == 1
+        assert cache.get("a", 2) is None
+        assert cache.get("a", 3) == 3
+
+
+class TestExpiringCache:
+    """Entries expire at their deadline and are bounded in size."""
+
+    def test_expiry(self) -> None:
+        start = datetime(2025, 1, 1, tzinfo=UTC)
+        cache: ExpiringCache[str, int] = ExpiringCache()
+        cache.set("k", 1, expires_at=start + timedelta(minutes=1))
+        assert cache.get("k", start) == 1
+        assert cache.get("k", start + timedelta(minutes=1)) is None
+        assert len(cache) == 0
+
+    def test_evicts_least_recently_used(self) -> None:
+        start = datetime(2025, 1, 1, tzinfo=UTC)
+        expires_at = start + timedelta(minutes=1)
+        cache: ExpiringCache[str, int] = ExpiringCache(max_entries=2)
+        cache.set("a", 1, expires_at)
+        cache.set("b", 2, expires_at)
+        cache.get("a", start)
+        cache.set("c", 3, expires_at)
+        assert cache.get("b", start) is None
+        assert cache.get("a", start) == 1
+        assert cache.get("c", start) == 3
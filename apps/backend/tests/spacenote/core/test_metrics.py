@@ -0,0 +1,21 @@
+"""Tests for in-process metrics."""
+
+from spacenote.core.metrics import Histogram
+
+
+class TestHistogram:
+    """Snapshots report cumulative bucket counts."""
+
+    def test_snapshot(self) -> None:
+        histogram = Histogram(bounds=(0.1, 1.0))
+        for value in (0.05, 0.1, 0.5, 3.0):
+            histogram.observe(value)
+        snapshot = histogram.snapshot()
+        assert snapshot.count == 4
+        assert snapshot.max == 3.0
+        assert [(b.le, b.count) for b in snapshot.buckets] == [(0.1, 2), (1.0, 3), (None, 4)]
+
+    def test_empty(self) -> None:
+        snapshot = Histogram().snapshot()
+        assert snapshot.count == 0
+        assert snapshot.max == 0
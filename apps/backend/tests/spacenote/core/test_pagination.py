@@ -0,0 +1,50 @@
+"""Tests for keyset cursor encoding."""
+
+import base64
+from datetime import UTC, datetime
+from decimal import Decimal
+from typing import Any
+
+import bson
+import pytest
+
+from spacenote.core.pagination import decode_cursor, encode_cursor
+from spacenote.errors import ValidationError
+
+SORT_SPEC = [("created_at", -1), ("fields.price", 1), ("fields.status", 1), ("number", -1)]
+
+
+class TestCursor:
+    """Cursors round-trip sort values and reject foreign sort orders."""
+
+    def test_round_trip(self) -> None:
+        values = [datetime(2024, 5, 1, 12, 30, tzinfo=UTC), Decimal("10.50"), None, 42]
+        assert decode_cursor(encode_cursor(SORT_SPEC, values), SORT_SPEC) == values
+
+    def test_sort_mismatch(self) -> None:
+        cursor = encode_cursor([("number", -1)], [42])
+        with pytest.raises(ValidationError):
+            decode_cursor(cursor, SORT_SPEC)
+
+    @pytest.mark.parametrize("cursor", ["", "not-a-cursor", "!!!"])
+    def test_malformed(self, cursor: str) -> None:
+        with pytest.raises(ValidationError):
+            decode_cursor(cursor, SORT_SPEC)
+
+    @pytest.mark.parametrize(
+        "payload",
+        [
+            {"s": 5, "v": [42]},
+            {"s": [5], "v": [42]},
+            {"s": ["ab"], "v": [42]},
+            {"s": [["number", -1, 0]], "v": [42]},
+            {"s": [["number", 2]], "v": [42]},
+            {"s": [["number", -1]], "v": 42},
+            {"s": [["number", -1]], "v": [42, 43]},
+            {"v": [42]},
+        ],
+    )
+    def test_tampered(self, payload: dict[str, Any]) -> None:
+        cursor = base64.urlsafe_b64encode(bson.encode(payload)).decode().rstrip("=")
+        with pytest.raises(ValidationError):
+            decode_cursor(cursor, [("number", -1)])